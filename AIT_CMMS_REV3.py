@@ -15,10 +15,10 @@ from password_change_ui import show_password_change_dialog
 from responsive_utils import ResponsiveManager, make_treeview_responsive, create_responsive_dialog
 # New modular features for enhanced functionality
 from equipment_manager import EquipmentManager
-from backup_manager import BackupManager
 from equipment_history import show_equipment_history, EquipmentHistory
 from kpi_auto_collector import KPIAutoCollector
 from kpi_trend_analyzer import show_kpi_trends, KPITrendAnalyzer
+from query_profiler import count_queries
 import shutil
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -40,6 +40,8 @@ import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, NamedTuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass
 from enum import Enum
 try:
@@ -53,6 +55,83 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     print("ReportLab not installed. PDF generation will not work.")
 
+# Worker threads for slow database work started from dialogs, so the Tk event loop keeps running
+_background_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cmms-background')
+
+
+@lru_cache(maxsize=1)
+def _recent_months(today_ordinal):
+    """Last 12 months as 'YYYY-MM' strings, newest first - rebuilt once per day"""
+    today = datetime.fromordinal(today_ordinal)
+    return tuple((today - timedelta(days=30*i)).strftime('%Y-%m') for i in range(12))
+
+
+# Static setup notes shown by the Backup Manager dialog ({0} = host, {1} = database)
+_BACKUP_INFO = """
+DATABASE BACKUP MANAGER
+================================================================================
+
+The backup manager provides automated database backups with:
+  • Scheduled backups (daily/weekly/monthly)
+  • Automatic retention and cleanup
+  • Backup verification
+  • Easy restore capabilities
+
+SETTING UP AUTOMATED BACKUPS:
+================================================================================
+
+1. Initialize the BackupManager in your application code:
+
+   from backup_manager import BackupManager
+
+   # Initialize with database configuration
+   backup_mgr = BackupManager(self.DB_CONFIG, backup_dir='./backups')
+
+   # Configure backup settings
+   backup_mgr.update_config({{
+       'enabled': True,
+       'schedule': 'daily',        # daily, weekly, or monthly
+       'backup_time': '02:00',     # Time to run (HH:MM)
+       'retention_days': 30,       # Keep backups for 30 days
+       'max_backups': 50,          # Maximum number to keep
+       'verify_after_backup': True # Verify after creation
+   }})
+
+   # Start automatic backups
+   backup_mgr.start_automatic_backups()
+
+2. Backups will run automatically in the background
+
+3. View backups:
+   backups = backup_mgr.list_backups()
+
+4. Create manual backup:
+   success, path, msg = backup_mgr.create_backup('manual_backup')
+
+5. Restore from backup:
+   backup_mgr.restore_backup(backup_path, confirm=True)
+
+REQUIREMENTS:
+================================================================================
+  • PostgreSQL command-line tools (pg_dump, pg_restore)
+  • Must be installed and accessible in system PATH
+  • Sufficient disk space for backups
+
+CURRENT DATABASE:
+================================================================================
+  Host: {0}
+  Database: {1}
+  Connection: PostgreSQL (Neon Cloud)
+
+For detailed documentation, see:
+  • MODULAR_ARCHITECTURE_GUIDE.md
+  • backup_manager.py module
+  • example_integration.py for usage examples
+
+================================================================================
+"""
+
+
 class PMType(Enum):
     MONTHLY = "Monthly"
     ANNUAL = "Annual"
@@ -5701,6 +5780,8 @@ class AITCMMSSystem:
         # Get screen dimensions and make window fullscreen
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
+        # Kept for centering dialogs without querying Tk again each time
+        self._screen_w, self._screen_h = screen_width, screen_height
 
         # Set window to fullscreen for better readability
         self.root.geometry(f"{screen_width}x{screen_height}+0+0")
@@ -5729,7 +5810,9 @@ class AITCMMSSystem:
             if event.widget == self.root:
                 self.responsive_manager.update_dimensions(event.width, event.height)
 
-        self.root.bind('<Configure>', on_window_resize)
+        # add='+' - responsive_utils shares a <Configure> binding on each toplevel
+        # for its debounced Treeview resizing, which a plain bind would replace
+        self.root.bind('<Configure>', on_window_resize, add='+')
 
         # ===== ROLE-BASED ACCESS CONTROL =====
         self.current_user_role = None  # Will be set by login
@@ -5781,6 +5864,7 @@ class AITCMMSSystem:
             self.equipment_manager = None
             self.kpi_collector = None
             self.kpi_trend_analyzer = None
+        self._kpi_save_in_progress = False  # Guards against stacked auto-collect save confirms
 
         # Add logo header
         self.add_logo_to_main_window()
@@ -8435,12 +8519,25 @@ class AITCMMSSystem:
                 ON corrective_maintenance(reported_date)
             ''')
 
+            # KPI calculations: CMs created within a month (range on the raw timestamp)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cm_created_date
+                ON corrective_maintenance(created_date)
+            ''')
+
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_cm_open_by_technician
                 ON corrective_maintenance(assigned_technician, status, priority)
                 WHERE status != 'Closed'
             ''')
 
+            # Efficiency report: the CM branch of labor_events, filtered on a closed_date range
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cm_closed_date
+                ON corrective_maintenance(closed_date)
+                WHERE status = 'Closed'
+            ''')
+
             # === PM Completions Indexes ===
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_pm_completions_equipment
@@ -8457,6 +8554,33 @@ class AITCMMSSystem:
                 ON pm_completions(technician_name)
             ''')
 
+            # Technician-leading indexes from before the efficiency report moved onto
+            # labor_events; that query filters on date only, so they just cost writes
+            # (the PM date range is served by idx_pm_completions_date)
+            cursor.execute('DROP INDEX IF EXISTS idx_cm_tech_status_closed')
+            cursor.execute('DROP INDEX IF EXISTS idx_pm_tech_date')
+
+            # === Reporting Views ===
+            # PM and CM labor as one event stream, so the efficiency report can
+            # aggregate both kinds per technician in a single grouped scan
+            cursor.execute('''
+                CREATE OR REPLACE VIEW labor_events AS
+                SELECT technician_name AS tech,
+                       completion_date AS event_date,
+                       COALESCE(labor_hours, 0) + COALESCE(labor_minutes, 0)/60.0 AS hours,
+                       'PM' AS kind
+                FROM pm_completions
+                UNION ALL
+                SELECT assigned_technician,
+                       closed_date,
+                       COALESCE(labor_hours, 0),
+                       'CM'
+                FROM corrective_maintenance
+                WHERE status = 'Closed'
+                AND closed_date IS NOT NULL
+                AND closed_date != ''
+            ''')
+
             # === Audit Log Indexes ===
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp
@@ -17707,6 +17831,43 @@ class AITCMMSSystem:
     # NEW MODULAR FEATURES - Callback Methods
     # ========================================================================
 
+    def _run_in_background(self, widget, func, on_done, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) on a worker thread and hand the outcome back on the Tk thread
+
+        on_done(result, error) is called from widget.after() polling once func finishes;
+        error is None on success. It is skipped if the widget was destroyed meanwhile.
+        """
+        def run():
+            with count_queries(func.__name__):
+                return func(*args, **kwargs)
+
+        future = _background_executor.submit(run)
+
+        def poll():
+            if not widget.winfo_exists():
+                return
+            if not future.done():
+                widget.after(50, poll)
+                return
+            error = future.exception()
+            on_done(None if error else future.result(), error)
+
+        widget.after(50, poll)
+
+    def _run_kpi_collector_job(self, method_name, *args, **kwargs):
+        """
+        Call a KPIAutoCollector method on a pooled connection checked out for this call only
+
+        For worker threads: self.conn stays with the Tk thread, and a commit or
+        rollback from a worker would end whatever transaction the UI has open on it.
+        """
+        conn = db_pool.get_connection()
+        try:
+            return getattr(KPIAutoCollector(conn), method_name)(*args, **kwargs)
+        finally:
+            db_pool.return_connection(conn)
+
     def show_equipment_manager_dialog(self):
         """Show equipment manager statistics and attention items"""
         try:
@@ -17717,29 +17878,26 @@ class AITCMMSSystem:
             # Create dialog
             dialog = tk.Toplevel(self.root)
             dialog.title("Equipment Manager")
-            dialog.geometry("800x600")
-            dialog.transient(self.root)
-            dialog.grab_set()
 
-            # Center dialog
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() // 2) - 400
-            y = (dialog.winfo_screenheight() // 2) - 300
+            # Size and center the dialog in a single geometry call
+            x = (self._screen_w // 2) - 400
+            y = (self._screen_h // 2) - 300
             dialog.geometry(f"800x600+{x}+{y}")
+            dialog.transient(self.root)
+            dialog.grab_set()
 
             # Header
             ttk.Label(dialog, text="Equipment Manager",
                      font=('Arial', 14, 'bold')).pack(pady=10)
 
-            # Statistics text
-            stats_text = tk.Text(dialog, wrap='word', font=('Courier', 10))
-            stats_text.pack(fill='both', expand=True, padx=10, pady=10)
-
-            # Get statistics
-            stats = self.equipment_manager.get_equipment_statistics()
-            attention = self.equipment_manager.get_equipment_requiring_attention()
+            # Statistics text - filled in once the statistics are loaded
+            stats_text = tk.Text(dialog, wrap='word', font=('Courier', 10), height=14)
+            stats_text.insert('1.0', "\nLoading equipment statistics...")
+            stats_text.config(state='disabled')
+            stats_text.pack(fill='x', padx=10, pady=(10, 0))
 
-            report = f"""
+            def show_statistics(stats):
+                report = f"""
 EQUIPMENT STATISTICS
 {'='*70}
 
@@ -17752,46 +17910,96 @@ OVERALL COUNTS:
 PM CONFIGURATION:
   With Monthly PM: {stats['monthly_pm']}
   With Annual PM: {stats['annual_pm']}
-
-{'='*70}
-EQUIPMENT REQUIRING ATTENTION
-{'='*70}
-
-OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
 """
-            for eq in attention['overdue_monthly'][:10]:
-                report += f"  • {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)\n"
-
-            if len(attention['overdue_monthly']) > 10:
-                report += f"  ... and {len(attention['overdue_monthly']) - 10} more\n"
-
-            report += f"\nOVERDUE ANNUAL PMs: {len(attention['overdue_annual'])}\n"
-            for eq in attention['overdue_annual'][:10]:
-                report += f"  • {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)\n"
-
-            if len(attention['overdue_annual']) > 10:
-                report += f"  ... and {len(attention['overdue_annual']) - 10} more\n"
-
-            report += f"\nMISSING EQUIPMENT: {len(attention['missing'])}\n"
-            for eq in attention['missing'][:10]:
-                report += f"  • {eq['bfm_no']}: {eq['description'][:40]}\n"
-
-            if len(attention['missing']) > 10:
-                report += f"  ... and {len(attention['missing']) - 10} more\n"
-
-            report += f"\nNO PM HISTORY: {len(attention['no_pm_history'])}\n"
-            for eq in attention['no_pm_history'][:10]:
-                report += f"  • {eq['bfm_no']}: {eq['description'][:40]}\n"
-
-            if len(attention['no_pm_history']) > 10:
-                report += f"  ... and {len(attention['no_pm_history']) - 10} more\n"
-
-            stats_text.insert('1.0', report)
-            stats_text.config(state='disabled')
+                stats_text.config(state='normal')
+                stats_text.delete('1.0', 'end')
+                stats_text.insert('1.0', report)
+                stats_text.config(state='disabled')
+
+            # Equipment requiring attention - one heading row per category followed by its items.
+            # Rows are only inserted into the tree a page at a time as the user scrolls down,
+            # so opening the dialog does not depend on how many items need attention.
+            attention_frame = ttk.LabelFrame(dialog, text="Equipment Requiring Attention", padding=5)
+            attention_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+            rows = []
+
+            columns = ('bfm', 'desc', 'days')
+            attention_tree = ttk.Treeview(attention_frame, columns=columns, show='headings', height=8)
+            for col, heading, width in zip(columns, ("BFM No", "Description", "Overdue"), (200, 380, 150)):
+                attention_tree.heading(col, text=heading)
+                attention_tree.column(col, width=width)
+            attention_tree.tag_configure('section', font=('Arial', 10, 'bold'))
+
+            vsb = ttk.Scrollbar(attention_frame, orient='vertical', command=attention_tree.yview)
+            vsb.pack(side='right', fill='y')
+            attention_tree.pack(side='left', fill='both', expand=True)
+
+            page_size = 100
+            loaded = {'count': 0, 'pending': False}
+
+            def load_next_page():
+                if not attention_tree.winfo_exists():
+                    return
+                start = loaded['count']
+                end = min(start + page_size, len(rows))
+                for values, tag in rows[start:end]:
+                    attention_tree.insert('', 'end', values=values, tags=(tag,))
+                loaded['count'] = end
+                loaded['pending'] = False
+
+            def on_tree_scroll(first, last):
+                vsb.set(first, last)
+                # Near the bottom of what is loaded: queue the next page
+                if float(last) > 0.9 and loaded['count'] < len(rows) and not loaded['pending']:
+                    loaded['pending'] = True
+                    attention_tree.after_idle(load_next_page)
+
+            attention_tree.configure(yscrollcommand=on_tree_scroll)
+
+            def show_attention(attention):
+                for title, key in (("OVERDUE MONTHLY PMs", 'overdue_monthly'),
+                                   ("OVERDUE ANNUAL PMs", 'overdue_annual'),
+                                   ("MISSING EQUIPMENT", 'missing'),
+                                   ("NO PM HISTORY", 'no_pm_history')):
+                    items = attention[key]
+                    rows.append(((f"{title}: {len(items)}", '', ''), 'section'))
+                    for eq in items:
+                        days = f"{eq['days_overdue']} days overdue" if 'days_overdue' in eq else ''
+                        rows.append(((eq['bfm_no'], eq['description'], days), 'item'))
+                load_next_page()
 
             # Button
             ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
 
+            # Statistics and attention lists are independent. Each is taken from the
+            # manager's cache when fresh; otherwise it is queried on a worker thread with
+            # its own pooled connection, both side by side, while the dialog stays responsive.
+            def load_equipment_aggregate(getter):
+                with db_pool.get_cursor(commit=False, cursor_factory=None) as cursor:
+                    return getter(cursor)
+
+            def when_loaded(show, what):
+                def done(result, error):
+                    if error is not None:
+                        messagebox.showerror("Error", f"Error loading {what}: {str(error)}", parent=dialog)
+                        print(f"Equipment manager error: {error}")
+                    else:
+                        show(result)
+                return done
+
+            equipment_manager = self.equipment_manager
+            for name, getter, show, what in (
+                    ('statistics', equipment_manager.get_equipment_statistics,
+                     show_statistics, "equipment statistics"),
+                    ('attention', equipment_manager.get_equipment_requiring_attention,
+                     show_attention, "equipment requiring attention")):
+                if equipment_manager.is_cached(name):
+                    show(getter())
+                else:
+                    self._run_in_background(dialog, load_equipment_aggregate,
+                                            when_loaded(show, what), getter)
+
         except Exception as e:
             messagebox.showerror("Error", f"Error opening equipment manager: {str(e)}")
             print(f"Equipment manager error: {e}")
@@ -17809,20 +18017,14 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
             except:
                 pass
 
-            # Ask for BFM number
-            from tkinter import simpledialog
-            bfm_no = simpledialog.askstring(
-                "Equipment History",
-                "Enter Equipment BFM Number:",
-                parent=self.root
-            )
-
-            if bfm_no:
+            def open_history(bfm_no):
                 # Validate BFM exists
                 try:
-                    if self.equipment_manager.validate_bfm_number(bfm_no):
-                        show_equipment_history(self.root, self.conn, str(bfm_no))
-                    else:
+                    with count_queries("Equipment History dialog"):
+                        found = self.equipment_manager.validate_bfm_number(bfm_no)
+                        if found:
+                            show_equipment_history(self.root, self.conn, str(bfm_no))
+                    if not found:
                         messagebox.showerror("Not Found",
                             f"Equipment '{bfm_no}' not found in database.\n\n"
                             "Please check the BFM number and try again.")
@@ -17832,7 +18034,79 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
                         self.conn.rollback()
                     except:
                         pass
-                    raise e
+                    messagebox.showerror("Error", f"Error opening equipment history: {str(e)}")
+                    print(f"Equipment history error: {e}")
+
+            # Ask for BFM number - matching numbers are looked up by prefix while typing,
+            # so the full equipment list never has to be loaded into a dropdown
+            picker = tk.Toplevel(self.root)
+            picker.title("Equipment History")
+            x = (self._screen_w // 2) - 175
+            y = (self._screen_h // 2) - 150
+            picker.geometry(f"350x300+{x}+{y}")
+            picker.transient(self.root)
+            picker.grab_set()
+
+            ttk.Label(picker, text="Enter Equipment BFM Number:").pack(padx=10, pady=(10, 5), anchor='w')
+            bfm_var = tk.StringVar()
+            bfm_entry = ttk.Entry(picker, textvariable=bfm_var)
+            bfm_entry.pack(padx=10, fill='x')
+            bfm_entry.focus_set()
+
+            matches_list = tk.Listbox(picker, height=8)
+            matches_list.pack(padx=10, pady=5, fill='both', expand=True)
+
+            search_job = {'id': None}
+
+            def refresh_matches():
+                search_job['id'] = None
+                matches_list.delete(0, 'end')
+                prefix = bfm_var.get().strip()
+                if not prefix:
+                    return
+                try:
+                    matches = self.equipment_manager.search_bfm_prefix(prefix, limit=20)
+                except Exception as e:
+                    try:
+                        self.conn.rollback()
+                    except:
+                        pass
+                    print(f"BFM search error: {e}")
+                    return
+                for bfm in matches:
+                    matches_list.insert('end', bfm)
+
+            def on_key_release(event):
+                if event.keysym in ('Return', 'Escape'):
+                    return
+                # Debounce - query once typing has paused for 150 ms
+                if search_job['id'] is not None:
+                    picker.after_cancel(search_job['id'])
+                search_job['id'] = picker.after(150, refresh_matches)
+
+            def on_match_selected(event):
+                selection = matches_list.curselection()
+                if selection:
+                    bfm_var.set(matches_list.get(selection[0]))
+
+            def submit(event=None):
+                bfm_no = bfm_var.get().strip()
+                if search_job['id'] is not None:
+                    picker.after_cancel(search_job['id'])
+                picker.destroy()
+                if bfm_no:
+                    open_history(bfm_no)
+
+            bfm_entry.bind('<KeyRelease>', on_key_release)
+            bfm_entry.bind('<Return>', submit)
+            matches_list.bind('<<ListboxSelect>>', on_match_selected)
+            matches_list.bind('<Double-Button-1>', submit)
+            picker.bind('<Escape>', lambda e: picker.destroy())
+
+            button_frame = ttk.Frame(picker)
+            button_frame.pack(pady=(0, 10))
+            ttk.Button(button_frame, text="Open", command=submit).pack(side='left', padx=5)
+            ttk.Button(button_frame, text="Cancel", command=picker.destroy).pack(side='left', padx=5)
 
         except Exception as e:
             messagebox.showerror("Error", f"Error opening equipment history: {str(e)}")
@@ -17866,15 +18140,13 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
             # Create dialog
             dialog = tk.Toplevel(self.root)
             dialog.title("Auto-Collect KPIs")
-            dialog.geometry("600x500")
-            dialog.transient(self.root)
-            dialog.grab_set()
 
-            # Center dialog
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() // 2) - 300
-            y = (dialog.winfo_screenheight() // 2) - 250
+            # Size and center the dialog in a single geometry call
+            x = (self._screen_w // 2) - 300
+            y = (self._screen_h // 2) - 250
             dialog.geometry(f"600x500+{x}+{y}")
+            dialog.transient(self.root)
+            dialog.grab_set()
 
             # Header
             header = ttk.Label(dialog, text="Auto-Collect KPIs from Database",
@@ -17894,11 +18166,8 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
 
             ttk.Label(period_frame, text="Month:").grid(row=0, column=0, padx=5, pady=5, sticky='e')
 
-            # Generate last 12 months
-            months = []
-            for i in range(12):
-                date = datetime.now() - timedelta(days=30*i)
-                months.append(date.strftime('%Y-%m'))
+            # Last 12 months (cached per calendar day)
+            months = _recent_months(datetime.now().toordinal())
 
             period_var = tk.StringVar(value=months[0])
             period_combo = ttk.Combobox(period_frame, textvariable=period_var,
@@ -17909,54 +18178,74 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
             preview_text = tk.Text(dialog, height=10, width=70, wrap='word')
             preview_text.pack(pady=10, padx=20)
 
-            def preview():
-                try:
-                    preview_text.delete('1.0', 'end')
-                    preview_text.insert('1.0', f"Previewing KPIs for {period_var.get()}...\n\n")
-                    dialog.update()
-
-                    result = self.kpi_collector.preview_auto_collection(period_var.get())
+            # Preview and save run on a worker thread; the buttons are disabled meanwhile
+            def set_busy(busy):
+                state = 'disabled' if busy else 'normal'
+                preview_button.config(state=state)
+                save_button.config(state=state)
 
-                    if 'error' in result:
-                        preview_text.insert('end', f"Error: {result['error']}")
-                    else:
-                        preview_text.insert('end', f"Found {len(result['kpis'])} auto-collectible KPIs:\n\n")
-                        for kpi in result['kpis']:
-                            preview_text.insert('end', f"{kpi['name']}: {kpi['value']} {kpi['unit']}\n")
-                except Exception as e:
+            def show_preview(result, error):
+                set_busy(False)
+                if error is not None:
                     preview_text.delete('1.0', 'end')
-                    preview_text.insert('1.0', f"Error: {str(e)}")
+                    preview_text.insert('1.0', f"Error: {str(error)}")
+                elif 'error' in result:
+                    preview_text.insert('end', f"Error: {result['error']}")
+                else:
+                    preview_text.insert('end', f"Found {len(result['kpis'])} auto-collectible KPIs:\n\n")
+                    for kpi in result['kpis']:
+                        preview_text.insert('end', f"{kpi['name']}: {kpi['value']} {kpi['unit']}\n")
+
+            def preview():
+                preview_text.delete('1.0', 'end')
+                preview_text.insert('1.0', f"Previewing KPIs for {period_var.get()}...\n\n")
+                set_busy(True)
+                self._run_in_background(dialog, self._run_kpi_collector_job, show_preview,
+                                        'preview_auto_collection', period_var.get())
 
             # Buttons
             button_frame = ttk.Frame(dialog)
             button_frame.pack(pady=20)
 
-            ttk.Button(button_frame, text="Preview",
-                      command=preview).pack(side='left', padx=5)
+            preview_button = ttk.Button(button_frame, text="Preview", command=preview)
+            preview_button.pack(side='left', padx=5)
+
+            def show_save_result(result, error):
+                set_busy(False)
+                if error is not None:
+                    messagebox.showerror("Error", f"Error saving KPIs: {str(error)}")
+                elif result['success']:
+                    messagebox.showinfo("Success",
+                        f"Successfully auto-collected {result['saved_count']} KPIs!\n\n"
+                        f"Period: {result['period']}\n\n"
+                        "You can now view these in the KPI dashboard.")
+                    dialog.destroy()
+                else:
+                    messagebox.showerror("Error", f"Error: {result.get('error', 'Unknown error')}")
+
+            def save_kpis(period, user_id):
+                # Cleared on the worker so the guard is released even if the dialog is closed first
+                try:
+                    return self._run_kpi_collector_job('save_auto_collected_kpis', period, user_id=user_id)
+                finally:
+                    self._kpi_save_in_progress = False
 
             def save():
+                # One confirm/save at a time - ignore clicks while one is pending
+                if self._kpi_save_in_progress:
+                    return
+                self._kpi_save_in_progress = True
                 if messagebox.askyesno("Confirm",
                     f"Auto-collect and save KPIs for {period_var.get()}?\n\n"
-                    "This will update the KPI database."):
-                    try:
-                        result = self.kpi_collector.save_auto_collected_kpis(
-                            period_var.get(),
-                            user_id=self.current_user
-                        )
-
-                        if result['success']:
-                            messagebox.showinfo("Success",
-                                f"Successfully auto-collected {result['saved_count']} KPIs!\n\n"
-                                f"Period: {result['period']}\n\n"
-                                "You can now view these in the KPI dashboard.")
-                            dialog.destroy()
-                        else:
-                            messagebox.showerror("Error", f"Error: {result.get('error', 'Unknown error')}")
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Error saving KPIs: {str(e)}")
+                    "This will update the KPI database.", parent=dialog):
+                    set_busy(True)
+                    self._run_in_background(dialog, save_kpis, show_save_result,
+                                            period_var.get(), self.current_user)
+                else:
+                    self._kpi_save_in_progress = False
 
-            ttk.Button(button_frame, text="Save to Database",
-                      command=save).pack(side='left', padx=5)
+            save_button = ttk.Button(button_frame, text="Save to Database", command=save)
+            save_button.pack(side='left', padx=5)
 
             ttk.Button(button_frame, text="Close",
                       command=dialog.destroy).pack(side='left', padx=5)
@@ -17991,15 +18280,13 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
             # Create dialog
             dialog = tk.Toplevel(self.root)
             dialog.title("Backup Manager")
-            dialog.geometry("900x500")
-            dialog.transient(self.root)
-            dialog.grab_set()
 
-            # Center dialog
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() // 2) - 450
-            y = (dialog.winfo_screenheight() // 2) - 250
+            # Size and center the dialog in a single geometry call
+            x = (self._screen_w // 2) - 450
+            y = (self._screen_h // 2) - 250
             dialog.geometry(f"900x500+{x}+{y}")
+            dialog.transient(self.root)
+            dialog.grab_set()
 
             # Header
             ttk.Label(dialog, text="Database Backup Manager",
@@ -18007,72 +18294,9 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
 
             # Info text
             info_text = tk.Text(dialog, wrap='word', height=20, width=100)
-            info_text.pack(padx=20, pady=10, fill='both', expand=True)
-
-            info_text.insert('1.0', """
-DATABASE BACKUP MANAGER
-================================================================================
-
-The backup manager provides automated database backups with:
-  • Scheduled backups (daily/weekly/monthly)
-  • Automatic retention and cleanup
-  • Backup verification
-  • Easy restore capabilities
-
-SETTING UP AUTOMATED BACKUPS:
-================================================================================
-
-1. Initialize the BackupManager in your application code:
-
-   from backup_manager import BackupManager
-
-   # Initialize with database configuration
-   backup_mgr = BackupManager(self.DB_CONFIG, backup_dir='./backups')
-
-   # Configure backup settings
-   backup_mgr.update_config({
-       'enabled': True,
-       'schedule': 'daily',        # daily, weekly, or monthly
-       'backup_time': '02:00',     # Time to run (HH:MM)
-       'retention_days': 30,       # Keep backups for 30 days
-       'max_backups': 50,          # Maximum number to keep
-       'verify_after_backup': True # Verify after creation
-   })
-
-   # Start automatic backups
-   backup_mgr.start_automatic_backups()
-
-2. Backups will run automatically in the background
-
-3. View backups:
-   backups = backup_mgr.list_backups()
-
-4. Create manual backup:
-   success, path, msg = backup_mgr.create_backup('manual_backup')
-
-5. Restore from backup:
-   backup_mgr.restore_backup(backup_path, confirm=True)
-
-REQUIREMENTS:
-================================================================================
-  • PostgreSQL command-line tools (pg_dump, pg_restore)
-  • Must be installed and accessible in system PATH
-  • Sufficient disk space for backups
-
-CURRENT DATABASE:
-================================================================================
-  Host: {0}
-  Database: {1}
-  Connection: PostgreSQL (Neon Cloud)
-
-For detailed documentation, see:
-  • MODULAR_ARCHITECTURE_GUIDE.md
-  • backup_manager.py module
-  • example_integration.py for usage examples
-
-================================================================================
-""".format(self.DB_CONFIG['host'], self.DB_CONFIG['database']))
+            info_text.insert('1.0', _BACKUP_INFO.format(self.DB_CONFIG['host'], self.DB_CONFIG['database']))
             info_text.config(state='disabled')
+            info_text.pack(padx=20, pady=10, fill='both', expand=True)
 
             # Button
             ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
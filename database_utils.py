@@ -10,6 +10,7 @@ from datetime import datetime
 import threading
 import hashlib
 import time
+from query_profiler import PROFILE_QUERIES, CountingConnection
 
 
 class DatabaseConnectionPool:
@@ -61,7 +62,9 @@ class DatabaseConnectionPool:
                 keepalives_interval=5,     # Send keepalive every 5 seconds (more frequent)
                 keepalives_count=3,        # Close connection after 3 failed keepalives
                 # Connection timeout settings
-                connect_timeout=10         # 10 second connection timeout
+                connect_timeout=10,        # 10 second connection timeout
+                # Count executed statements per dialog when AIT_PROFILE_QUERIES=1
+                connection_factory=CountingConnection if PROFILE_QUERIES else None
             )
             print(f"Connection pool initialized: {min_conn}-{max_conn} connections with keepalive enabled")
 
@@ -173,12 +176,14 @@ class DatabaseConnectionPool:
             print("Connection pool closed")
 
     @contextmanager
-    def get_cursor(self, commit=True):
+    def get_cursor(self, commit=True, cursor_factory=extras.RealDictCursor):
         """
         Context manager for database operations with automatic retry on connection failure
 
         Args:
             commit: Whether to commit automatically on success
+            cursor_factory: psycopg2 cursor class; defaults to dict rows,
+                pass None for plain tuple rows
 
         Yields:
             cursor: Database cursor
@@ -191,7 +196,7 @@ class DatabaseConnectionPool:
         conn = self.get_connection()  # This now validates the connection
         cursor = None
         try:
-            cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
+            cursor = conn.cursor(cursor_factory=cursor_factory)
             yield cursor
             if commit:
                 conn.commit()
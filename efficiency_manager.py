@@ -16,16 +16,169 @@ Key Metrics:
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
+import functools
+import logging
+from operator import itemgetter
 from database_utils import db_pool
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+matplotlib.rcParams['agg.path.chunksize'] = 10000  # Rasterize long paths in chunks instead of one large path
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 import calendar
 from responsive_utils import calculate_chart_size_for_multi_chart_layout, make_treeview_responsive
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - the plain NumPy version is used instead
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+def _compute_efficiency_rows(pm_hours, cm_hours, available_hours, target_pct, at_target_pct, above_target_pct):
+    """
+    Compute per-technician totals, efficiency, variance to target and status bucket
+
+    Args:
+        pm_hours, cm_hours: 1-D float arrays, one entry per technician
+        available_hours: Available hours per technician for the period
+        target_pct: Target efficiency in percent
+        at_target_pct, above_target_pct: Lower bounds of the 'At' and 'Above' target buckets
+
+    Returns tuple of arrays: (total_hours, efficiency, vs_target, status_index)
+    where status_index is 0 = below, 1 = at, 2 = above target
+    """
+    total = pm_hours + cm_hours
+    if available_hours > 0:
+        efficiency = total / available_hours * 100
+    else:
+        efficiency = np.zeros_like(total)
+    vs_target = efficiency - target_pct
+    status = (efficiency >= at_target_pct).astype(np.int64) + (efficiency >= above_target_pct).astype(np.int64)
+    return total, efficiency, vs_target, status
+
+
+if njit is not None:
+    _compute_efficiency_rows = njit(cache=True)(_compute_efficiency_rows)
+
+
+@functools.lru_cache(maxsize=8)
+def _technician_ticks(technicians: Tuple[str, ...]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """Tick positions and label strings for a technician x axis, cached per roster"""
+    return tuple(range(len(technicians))), tuple(str(name) for name in technicians)
+
+
+# Lazy accessors for the heavier optional libraries: each is imported on first use,
+# so importing this module stays cheap and later calls skip the import statements.
+# A failed import is not cached, so an ImportError is raised again on the next call.
+
+@functools.lru_cache(maxsize=None)
+def _chart_backend():
+    """Return (Figure, FigureCanvasTkAgg)"""
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    return Figure, FigureCanvasTkAgg
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl():
+    """Return (openpyxl, WriteOnlyCell, get_column_letter)"""
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    return openpyxl, WriteOnlyCell, get_column_letter
+
+
+@functools.lru_cache(maxsize=None)
+def _reportlab():
+    """Return (letter, landscape, inch, SimpleDocTemplate, Table, LongTable, Paragraph, Spacer)"""
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, LongTable, Paragraph, Spacer
+    return letter, landscape, inch, SimpleDocTemplate, Table, LongTable, Paragraph, Spacer
+
+
+@functools.lru_cache(maxsize=None)
+def _excel_styles():
+    """
+    Build the openpyxl fonts, fill and alignment used by the Excel export, once
+
+    Imported lazily so openpyxl stays optional; raises ImportError if it is missing.
+    Colors are full 8-digit ARGB so openpyxl does not have to normalise them.
+    """
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    return {
+        'title': Font(size=16, bold=True),
+        'period': Font(size=12),
+        'section': Font(size=14, bold=True),
+        'bold': Font(bold=True),
+        'header_fill': PatternFill(start_color="FFCCCCCC", end_color="FFCCCCCC", fill_type="solid"),
+        'center': Alignment(horizontal='center'),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_styles():
+    """
+    Build the ReportLab paragraph and table styles used by the PDF export, once
+
+    Imported lazily so reportlab stays optional; raises ImportError if it is missing.
+    Returns dict with the sample stylesheet, title/date paragraph styles and the
+    summary/detail table styles (TableStyle objects are safe to share between tables)
+    """
+    from reportlab import rl_config
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.enums import TA_CENTER
+
+    # Attribute shape checking is a development aid; skip it unless debugging
+    if not logger.isEnabledFor(logging.DEBUG):
+        rl_config.shapeChecking = 0
+
+    styles = getSampleStyleSheet()
+    return {
+        'styles': styles,
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#003366'),
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        'date': ParagraphStyle(
+            'DateStyle',
+            parent=styles['Normal'],
+            fontSize=12,
+            alignment=TA_CENTER,
+            spaceAfter=20
+        ),
+        'summary_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]),
+        'detail_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ]),
+    }
+
 
 class EfficiencyManager:
     """Manages efficiency tracking and reporting for maintenance technicians"""
@@ -36,6 +189,51 @@ class EfficiencyManager:
     WEEKLY_AVAILABILITY_HOURS = 342.69  # Total weekly hours for all technicians
     TARGET_EFFICIENCY = 0.80  # 80% target efficiency
 
+    # Status bucketing: efficiency % thresholds and the label/tag/color for each bucket
+    AT_TARGET_THRESHOLD = 75.0
+    ABOVE_TARGET_THRESHOLD = 85.0
+    STATUS_LABELS = ('Below Target', 'At Target', 'Above Target')
+    STATUS_TAGS = ('below_target', 'at_target', 'above_target')
+    STATUS_COLORS = ('#dc3545', '#ffc107', '#28a745')  # Red, Yellow, Green
+
+    # Chart raster resolution - lower DPI means less Agg rasterization per draw
+    CHART_DPI = 80
+
+    # Report footer text; built once from the constants above
+    NOTES_TEXT = f"""\
+Efficiency Calculation Methodology:
+• Annual Working Hours per Technician: {ANNUAL_HOURS_PER_TECH} hours
+• Total Technicians: {TOTAL_TECHNICIANS}
+• Weekly Team Availability: {WEEKLY_AVAILABILITY_HOURS} hours
+• Target Efficiency: {TARGET_EFFICIENCY * 100}%
+
+Efficiency Formula: (Total Worked Hours / Total Available Hours) × 100%
+• Worked Hours = PM Hours + CM Hours (from completed work orders)
+• Available Hours = (Number of working days in period) × (Weekly Availability / 5 days)
+
+Status Indicators:
+• Above Target: Efficiency ≥ 85% (Green)
+• At Target: Efficiency 75-84% (Yellow)
+• Below Target: Efficiency < 75% (Red)
+
+Data Sources:
+• PM Hours: pm_completions table (labor_hours + labor_minutes/60)
+• CM Hours: corrective_maintenance table (labor_hours)
+• Technician List: users table (active technicians only)"""
+
+    # Static part of the PDF report notes; export_to_pdf appends the timestamp and closing tag
+    PDF_NOTES_HEAD = (
+        "<para>"
+        "<b>Efficiency Calculation Methodology:</b><br/>"
+        f"• Annual Working Hours per Technician: {ANNUAL_HOURS_PER_TECH} hours<br/>"
+        f"• Total Technicians: {TOTAL_TECHNICIANS}<br/>"
+        f"• Weekly Team Availability: {WEEKLY_AVAILABILITY_HOURS} hours<br/>"
+        f"• Target Efficiency: {TARGET_EFFICIENCY * 100}%<br/>"
+        "<br/>"
+        "<b>Efficiency Formula:</b> (Total Worked Hours / Total Available Hours) × 100%<br/>"
+        "<br/>"
+    )
+
     def __init__(self, notebook: ttk.Notebook, user_name: str):
         """
         Initialize the Efficiency Manager
@@ -47,7 +245,11 @@ class EfficiencyManager:
         self.notebook = notebook
         self.user_name = user_name
         self.efficiency_frame = None
-        self.canvas_widgets = []  # Store canvas widgets for cleanup
+        self._chart_objs = {}  # Cached Figure/canvas/artists per chart key
+        self._pending_tech_data = None  # Data for the charts of the latest report
+        self._chart_dirty = {}  # Chart key -> needs redraw with _pending_tech_data
+        self._last_report_rows = []  # Technician table rows of the latest report, for exports
+        self.holidays = []  # Non-working dates (YYYY-MM-DD) excluded from available hours
         self.screen_width = None  # Cache screen dimensions
         self.screen_height = None
 
@@ -80,10 +282,38 @@ class EfficiencyManager:
         scrollbar.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
 
-        # Bind mouse wheel scrolling
+        # Take over mouse wheel scrolling only while the pointer is over this canvas,
+        # then put back whatever global wheel binding another window had installed
         def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+            canvas.yview_scroll(-int(event.delta / 120), "units")
+
+        wheel = {'ours': None, 'previous': None}
+
+        def restore_wheel(event=None):
+            if wheel['previous'] is not None:
+                canvas.bind_all("<MouseWheel>", wheel['previous'])
+                wheel['previous'] = None
+
+        def on_enter(event):
+            if wheel['previous'] is not None:
+                return
+            wheel['previous'] = canvas.bind_all("<MouseWheel>")
+            if wheel['ours'] is None:
+                canvas.bind_all("<MouseWheel>", on_mousewheel)
+                wheel['ours'] = canvas.bind_all("<MouseWheel>")  # reused, so one Tcl command
+            else:
+                canvas.bind_all("<MouseWheel>", wheel['ours'])
+
+        def on_leave(event):
+            # <Leave> also fires when the pointer moves onto a widget inside the canvas
+            inside = canvas.winfo_containing(event.x_root, event.y_root)
+            if inside is not None and (inside is canvas or str(inside).startswith(f"{canvas}.")):
+                return
+            restore_wheel()
+
+        canvas.bind("<Enter>", on_enter)
+        canvas.bind("<Leave>", on_leave)
+        canvas.bind("<Destroy>", restore_wheel)
 
         # === HEADER SECTION ===
         header_frame = ttk.Frame(scrollable_frame)
@@ -263,6 +493,7 @@ class EfficiencyManager:
         # Create notebook for different chart views
         self.chart_notebook = ttk.Notebook(self.viz_frame)
         self.chart_notebook.pack(fill='both', expand=True)
+        self.chart_notebook.bind('<<NotebookTabChanged>>', self._on_chart_tab_changed)
 
         # Initialize chart frames (charts will be populated when report is generated)
         self.chart_frames = {}
@@ -272,34 +503,9 @@ class EfficiencyManager:
         notes_frame = ttk.LabelFrame(scrollable_frame, text="Report Notes & Methodology", padding=10)
         notes_frame.pack(fill='x', padx=10, pady=5)
 
-        notes_text = f"""
-Efficiency Calculation Methodology:
-• Annual Working Hours per Technician: {self.ANNUAL_HOURS_PER_TECH} hours
-• Total Technicians: {self.TOTAL_TECHNICIANS}
-• Weekly Team Availability: {self.WEEKLY_AVAILABILITY_HOURS} hours
-• Target Efficiency: {self.TARGET_EFFICIENCY * 100}%
-
-Efficiency Formula: (Total Worked Hours / Total Available Hours) × 100%
-• Worked Hours = PM Hours + CM Hours (from completed work orders)
-• Available Hours = (Number of working days in period) × (Weekly Availability / 5 days)
-
-Status Indicators:
-• Above Target: Efficiency ≥ 85% (Green)
-• At Target: Efficiency 75-84% (Yellow)
-• Below Target: Efficiency < 75% (Red)
-
-Data Sources:
-• PM Hours: pm_completions table (labor_hours + labor_minutes/60)
-• CM Hours: corrective_maintenance table (labor_hours)
-• Technician List: users table (active technicians only)
-        """
-
-        notes_label = ttk.Label(notes_frame, text=notes_text.strip(), justify='left', font=('Arial', 9))
+        notes_label = ttk.Label(notes_frame, text=self.NOTES_TEXT, justify='left', font=('Arial', 9))
         notes_label.pack(anchor='w')
 
-        # Don't auto-generate report - let user click "Generate Report" button when ready
-        # self.efficiency_frame.after(500, self.generate_report)
-
     def _init_screen_dimensions(self):
         """Initialize and cache screen dimensions"""
         try:
@@ -312,7 +518,7 @@ Data Sources:
                 self.screen_width = 1920  # Default to common resolution
                 self.screen_height = 1080
 
-            print(f"DEBUG: Screen dimensions: {self.screen_width}x{self.screen_height}")
+            logger.debug("Screen dimensions: %dx%d", self.screen_width, self.screen_height)
         except Exception as e:
             print(f"Warning: Could not get screen dimensions, using defaults: {e}")
             self.screen_width = 1920
@@ -332,16 +538,18 @@ Data Sources:
     def _initialize_chart_frames(self):
         """Initialize frames for different chart types"""
         chart_types = [
-            ('efficiency_comparison', 'Efficiency Comparison by Technician'),
-            ('hours_breakdown', 'Hours Breakdown (PM vs CM)'),
-            ('workload_distribution', 'Workload Distribution'),
-            ('trend_analysis', 'Efficiency Trend'),
+            ('efficiency_comparison', 'Efficiency Comparison by Technician', self._create_efficiency_comparison_chart),
+            ('hours_breakdown', 'Hours Breakdown (PM vs CM)', self._create_hours_breakdown_chart),
+            ('workload_distribution', 'Workload Distribution', self._create_workload_distribution_chart),
+            ('trend_analysis', 'Efficiency Trend', self._create_trend_chart),
         ]
 
-        for key, title in chart_types:
+        self.chart_builders = {}
+        for key, title, builder in chart_types:
             frame = ttk.Frame(self.chart_notebook)
             self.chart_notebook.add(frame, text=title)
             self.chart_frames[key] = frame
+            self.chart_builders[key] = builder
 
     def set_date_range(self, days: int):
         """Set date range to last N days"""
@@ -391,6 +599,9 @@ Data Sources:
                 messagebox.showwarning("No Data", "No efficiency data found for the selected date range")
                 return
 
+            # Sort by technician name once; the table, charts and exports all share this order
+            tech_data.sort(key=itemgetter('technician'))
+
             # Calculate metrics
             self._calculate_and_display_metrics(tech_data, start_date, end_date)
 
@@ -415,61 +626,56 @@ Data Sources:
 
         Returns list of dicts with technician data
         """
+        # Format the range once; both aggregate queries and the debug output share it
+        start_s = start_date.strftime('%Y-%m-%d')
+        end_s = end_date.strftime('%Y-%m-%d')
+
         try:
-            with db_pool.get_cursor(commit=False) as cursor:
-                # Get all active technicians
+            # Tuple rows: the aggregate rows are unpacked positionally below
+            with db_pool.get_cursor(commit=False, cursor_factory=None) as cursor:
+                # Active technicians joined to their PM and CM labor aggregates,
+                # assembled server-side in a single round-trip. labor_events (created
+                # in init_database) unions PM completions and closed CMs so both are
+                # summed in one grouped scan using conditional aggregation.
+                # Note: dates are stored as TEXT in format YYYY-MM-DD
                 cursor.execute("""
-                    SELECT full_name
-                    FROM users
-                    WHERE is_active = TRUE AND role = 'Technician'
-                    ORDER BY full_name
-                """)
-                technicians = [row['full_name'] for row in cursor.fetchall()]
+                    WITH labor AS (
+                        SELECT
+                            tech,
+                            COUNT(*) FILTER (WHERE kind = 'PM') as pm_count,
+                            COALESCE(SUM(hours) FILTER (WHERE kind = 'PM'), 0) as pm_hours,
+                            COUNT(*) FILTER (WHERE kind = 'CM') as cm_count,
+                            COALESCE(SUM(hours) FILTER (WHERE kind = 'CM'), 0) as cm_hours
+                        FROM labor_events
+                        WHERE event_date BETWEEN %s AND %s
+                        GROUP BY tech
+                    )
+                    SELECT
+                        u.full_name,
+                        COALESCE(l.pm_count, 0) as pm_count,
+                        COALESCE(l.pm_hours, 0) as pm_hours,
+                        COALESCE(l.cm_count, 0) as cm_count,
+                        COALESCE(l.cm_hours, 0) as cm_hours
+                    FROM users u
+                    LEFT JOIN labor l ON l.tech = u.full_name
+                    WHERE u.is_active = TRUE AND u.role = 'Technician'
+                    ORDER BY u.full_name
+                """, (start_s, end_s))
 
                 tech_data = []
+                debug = logger.isEnabledFor(logging.DEBUG)
 
-                for tech_name in technicians:
-                    # Get PM hours and count
-                    # Note: dates are stored as TEXT in format YYYY-MM-DD
-                    cursor.execute("""
-                        SELECT
-                            COUNT(*) as pm_count,
-                            COALESCE(SUM(COALESCE(labor_hours, 0) + COALESCE(labor_minutes, 0)/60.0), 0) as pm_hours
-                        FROM pm_completions
-                        WHERE technician_name = %s
-                        AND completion_date >= %s
-                        AND completion_date <= %s
-                    """, (tech_name, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
-
-                    pm_result = cursor.fetchone()
-                    pm_hours = float(pm_result['pm_hours']) if pm_result else 0.0
-                    pm_count = int(pm_result['pm_count']) if pm_result else 0
-
-                    # Debug output
-                    if pm_count > 0:
-                        print(f"DEBUG: {tech_name} - PM Count: {pm_count}, PM Hours: {pm_hours}")
-
-                    # Get CM hours and count
-                    # Note: closed_date is TEXT, need to handle comparison carefully
-                    cursor.execute("""
-                        SELECT
-                            COUNT(*) as cm_count,
-                            COALESCE(SUM(COALESCE(labor_hours, 0)), 0) as cm_hours
-                        FROM corrective_maintenance
-                        WHERE assigned_technician = %s
-                        AND status = 'Closed'
-                        AND closed_date IS NOT NULL
-                        AND closed_date != ''
-                        AND closed_date >= %s
-                        AND closed_date <= %s
-                    """, (tech_name, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
+                for tech_name, pm_count, pm_hours, cm_count, cm_hours in cursor.fetchall():
+                    pm_hours = float(pm_hours)
+                    pm_count = int(pm_count)
 
-                    cm_result = cursor.fetchone()
-                    cm_hours = float(cm_result['cm_hours']) if cm_result else 0.0
-                    cm_count = int(cm_result['cm_count']) if cm_result else 0
+                    cm_hours = float(cm_hours)
+                    cm_count = int(cm_count)
 
-                    # Debug output - show all techs to see who has/doesn't have CM data
-                    print(f"DEBUG CM: {tech_name} - CM Count: {cm_count}, CM Hours: {cm_hours}")
+                    # Debug output - show all techs to see who has/doesn't have PM/CM data
+                    if debug:
+                        logger.debug("%s - PM Count: %d, PM Hours: %.2f, CM Count: %d, CM Hours: %.2f",
+                                     tech_name, pm_count, pm_hours, cm_count, cm_hours)
 
                     total_hours = pm_hours + cm_hours
 
@@ -482,18 +688,19 @@ Data Sources:
                         'total_hours': total_hours
                     })
 
-                print(f"DEBUG: Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-                print(f"DEBUG: Found {len(tech_data)} technicians")
+                if debug:
+                    logger.debug("Date range: %s to %s", start_s, end_s)
+                    logger.debug("Found %d technicians", len(tech_data))
 
-                # Debug: Check total CM records in database
-                cursor.execute("""
-                    SELECT COUNT(*) as total_cms,
-                           COUNT(CASE WHEN status = 'Closed' THEN 1 END) as closed_cms,
-                           COUNT(CASE WHEN status = 'Closed' AND closed_date IS NOT NULL AND closed_date != '' THEN 1 END) as closed_with_date
-                    FROM corrective_maintenance
-                """)
-                cm_stats = cursor.fetchone()
-                print(f"DEBUG: Total CMs in database: {cm_stats['total_cms']}, Closed: {cm_stats['closed_cms']}, Closed with date: {cm_stats['closed_with_date']}")
+                    # Check total CM records in database (extra query, debug only)
+                    cursor.execute("""
+                        SELECT COUNT(*) as total_cms,
+                               COUNT(CASE WHEN status = 'Closed' THEN 1 END) as closed_cms,
+                               COUNT(CASE WHEN status = 'Closed' AND closed_date IS NOT NULL AND closed_date != '' THEN 1 END) as closed_with_date
+                        FROM corrective_maintenance
+                    """)
+                    logger.debug("Total CMs in database: %s, Closed: %s, Closed with date: %s",
+                                 *cursor.fetchone())
 
                 return tech_data
 
@@ -505,9 +712,9 @@ Data Sources:
 
     def _calculate_and_display_metrics(self, tech_data: List[Dict], start_date: datetime, end_date: datetime):
         """Calculate overall metrics and update summary display"""
-        # Calculate number of working days in period
-        days_in_period = (end_date - start_date).days + 1
-        working_days = days_in_period  # Simplified - could exclude weekends if needed
+        # Calculate number of working days (Mon-Fri, less holidays) in period, inclusive
+        working_days = int(np.busday_count(start_date.date(), (end_date + timedelta(days=1)).date(),
+                                           holidays=self.holidays))
 
         # Calculate available hours per technician for the period
         # Weekly availability per tech = 342.69 / 9 = 38.08 hrs/week
@@ -515,63 +722,64 @@ Data Sources:
         hours_per_tech_per_day = self.WEEKLY_AVAILABILITY_HOURS / self.TOTAL_TECHNICIANS / 5
         available_hours_per_tech = hours_per_tech_per_day * working_days
 
+        # Per-technician hours as columns: pm_hours, cm_hours
+        hours = np.array([(t['pm_hours'], t['cm_hours']) for t in tech_data], dtype=float).reshape(-1, 2)
+        total, efficiencies, vs_targets, status_index = _compute_efficiency_rows(
+            np.ascontiguousarray(hours[:, 0]), np.ascontiguousarray(hours[:, 1]),
+            float(available_hours_per_tech), self.TARGET_EFFICIENCY * 100,
+            self.AT_TARGET_THRESHOLD, self.ABOVE_TARGET_THRESHOLD
+        )
+
         # Calculate totals
         total_available = available_hours_per_tech * len(tech_data)
-        total_pm_hours = sum(t['pm_hours'] for t in tech_data)
-        total_cm_hours = sum(t['cm_hours'] for t in tech_data)
-        total_worked = total_pm_hours + total_cm_hours
+        total_pm_hours = float(hours[:, 0].sum())
+        total_cm_hours = float(hours[:, 1].sum())
+        total_worked = float(total.sum())
 
         overall_efficiency = (total_worked / total_available * 100) if total_available > 0 else 0
 
-        # Store available hours per tech for use in table
-        for tech in tech_data:
+        # Store per-tech results for use in table and charts
+        for tech, efficiency, vs_target, status in zip(
+            tech_data, efficiencies.tolist(), vs_targets.tolist(), status_index.tolist()
+        ):
             tech['available_hours'] = available_hours_per_tech
-            tech['efficiency'] = (tech['total_hours'] / available_hours_per_tech * 100) if available_hours_per_tech > 0 else 0
+            tech['efficiency'] = efficiency
+            tech['vs_target'] = vs_target
+            tech['status_index'] = status
 
         # Update summary labels
-        self.summary_labels['total_available'].config(text=f"{total_available:.1f} hrs")
-        self.summary_labels['total_worked'].config(text=f"{total_worked:.1f} hrs")
-        self.summary_labels['pm_hours'].config(text=f"{total_pm_hours:.1f} hrs")
-        self.summary_labels['cm_hours'].config(text=f"{total_cm_hours:.1f} hrs")
-        self.summary_labels['target'].config(text=f"{self.TARGET_EFFICIENCY * 100:.0f}%")
-
-        # Color code overall efficiency
-        efficiency_label = self.summary_labels['overall_efficiency']
-        efficiency_label.config(text=f"{overall_efficiency:.1f}%")
-
-        if overall_efficiency >= 85:
-            efficiency_label.config(foreground='green')
-        elif overall_efficiency >= 75:
-            efficiency_label.config(foreground='orange')
-        else:
-            efficiency_label.config(foreground='red')
+        labels = self.summary_labels
+        labels['total_available'].config(text=f"{total_available:.1f} hrs")
+        labels['total_worked'].config(text=f"{total_worked:.1f} hrs")
+        labels['pm_hours'].config(text=f"{total_pm_hours:.1f} hrs")
+        labels['cm_hours'].config(text=f"{total_cm_hours:.1f} hrs")
+        labels['target'].config(text=f"{self.TARGET_EFFICIENCY * 100:.0f}%")
+
+        # Color code overall efficiency (below / at / above target)
+        color = ('red', 'orange', 'green')[
+            (overall_efficiency >= self.AT_TARGET_THRESHOLD) + (overall_efficiency >= self.ABOVE_TARGET_THRESHOLD)
+        ]
+        labels['overall_efficiency'].config(text=f"{overall_efficiency:.1f}%", foreground=color)
 
     def _update_technician_table(self, tech_data: List[Dict]):
         """Update the technician detail treeview"""
-        # Clear existing data
-        for item in self.tech_tree.get_children():
-            self.tech_tree.delete(item)
-
-        # Sort by efficiency descending
-        tech_data_sorted = sorted(tech_data, key=lambda x: x['efficiency'], reverse=True)
-
-        # Insert data
-        for tech in tech_data_sorted:
-            efficiency = tech['efficiency']
-            vs_target = efficiency - (self.TARGET_EFFICIENCY * 100)
-
-            # Determine status and tag
-            if efficiency >= 85:
-                status = "Above Target"
-                tag = 'above_target'
-            elif efficiency >= 75:
-                status = "At Target"
-                tag = 'at_target'
-            else:
-                status = "Below Target"
-                tag = 'below_target'
-
-            self.tech_tree.insert('', 'end', values=(
+        # Clear existing data in a single call
+        self.tech_tree.delete(*self.tech_tree.get_children())
+
+        insert = self.tech_tree.insert
+        labels = self.STATUS_LABELS
+        tags = self.STATUS_TAGS
+
+        # Sort by efficiency descending (stable, so ties keep roster order)
+        efficiencies = np.array([t['efficiency'] for t in tech_data], dtype=float)
+        order = np.argsort(-efficiencies, kind='stable')
+
+        # Build every row up front so the insert loop does no formatting or lookups
+        rows = []
+        for i in order.tolist():
+            tech = tech_data[i]
+            status = tech['status_index']
+            rows.append(((
                 tech['technician'],
                 f"{tech['available_hours']:.1f}",
                 f"{tech['pm_hours']:.1f}",
@@ -579,102 +787,156 @@ Data Sources:
                 f"{tech['total_hours']:.1f}",
                 tech['pm_count'],
                 tech['cm_count'],
-                f"{efficiency:.1f}%",
-                f"{vs_target:+.1f}%",
-                status
-            ), tags=(tag,))
+                f"{tech['efficiency']:.1f}%",
+                f"{tech['vs_target']:+.1f}%",
+                labels[status]
+            ), tags[status]))
+
+        # Insert data
+        for values, tag in rows:
+            insert('', 'end', values=values, tags=(tag,))
+
+        # Keep the displayed rows so exports need not read them back from Tk
+        self._last_report_rows = [values for values, _ in rows]
 
     def _generate_visualizations(self, tech_data: List[Dict]):
-        """Generate all chart visualizations"""
-        # Clear existing charts
-        for widget in self.canvas_widgets:
-            widget.destroy()
-        self.canvas_widgets.clear()
-
-        # Generate each chart
-        self._create_efficiency_comparison_chart(tech_data)
-        self._create_hours_breakdown_chart(tech_data)
-        self._create_workload_distribution_chart(tech_data)
-        self._create_trend_chart(tech_data)
+        """
+        Generate chart visualizations
+
+        Only the visible chart is drawn now; the others are marked dirty and
+        drawn the first time their tab is selected.
+        """
+        self._pending_tech_data = tech_data
+        self._chart_dirty = {key: True for key in self.chart_frames}
+        self._render_selected_chart()
+
+    def _on_chart_tab_changed(self, event=None):
+        """Draw the newly selected chart if it has not been drawn for the current report"""
+        self._render_selected_chart()
+
+    def _render_selected_chart(self):
+        """Draw the chart in the selected tab if it is dirty"""
+        if self._pending_tech_data is None:
+            return
+
+        selected = self.chart_notebook.select()
+        for key, frame in self.chart_frames.items():
+            if str(frame) == selected:
+                break
+        else:
+            return
+
+        if self._chart_dirty.get(key):
+            # Charts reuse their cached Figure/canvas, so there is nothing to destroy here
+            self.chart_builders[key](self._pending_tech_data)
+            self._chart_dirty[key] = False
+
+    def _get_chart(self, key: str) -> Dict:
+        """
+        Get the cached Figure/canvas for a chart, creating them on first use
+
+        Returns dict with 'fig' and 'canvas' plus any artists stored by the chart builder
+        """
+        chart = self._chart_objs.get(key)
+        if chart is None:
+            # Get responsive chart size for multi-chart layout (4 charts total)
+            # Use cached screen dimensions
+            figsize = calculate_chart_size_for_multi_chart_layout(
+                self.screen_width, self.screen_height, num_charts=4, dpi=self.CHART_DPI
+            )
+
+            Figure, FigureCanvasTkAgg = _chart_backend()
+            fig = Figure(figsize=figsize, dpi=self.CHART_DPI)
+
+            # Embed in tkinter
+            canvas = FigureCanvasTkAgg(fig, master=self.chart_frames[key])
+            canvas.get_tk_widget().pack(fill='both', expand=True)
+
+            chart = {'fig': fig, 'canvas': canvas}
+            self._chart_objs[key] = chart
+        return chart
+
+    def _set_technician_xticks(self, ax, technicians):
+        """Label the x axis with one rotated tick per technician"""
+        positions, labels = _technician_ticks(tuple(technicians))
+        ax.set_xticks(positions)
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+
+    def _get_chart_axes(self, chart: Dict):
+        """Get the single Axes of a cached chart, cleared for re-plotting"""
+        ax = chart.get('ax')
+        if ax is None:
+            ax = chart['ax'] = chart['fig'].add_subplot(111)
+        else:
+            ax.clear()
+        return ax
 
     def _create_efficiency_comparison_chart(self, tech_data: List[Dict]):
         """Create bar chart comparing technician efficiency"""
-        frame = self.chart_frames['efficiency_comparison']
+        chart = self._get_chart('efficiency_comparison')
 
         # Sort by efficiency
         sorted_data = sorted(tech_data, key=lambda x: x['efficiency'], reverse=True)
 
-        # Get responsive chart size for multi-chart layout (4 charts total)
-        # Use cached screen dimensions
-        figsize = calculate_chart_size_for_multi_chart_layout(
-            self.screen_width, self.screen_height, num_charts=4
-        )
-
-        fig = Figure(figsize=figsize, dpi=100)
-        ax = fig.add_subplot(111)
-
         technicians = [t['technician'] for t in sorted_data]
         efficiencies = [t['efficiency'] for t in sorted_data]
 
         # Color bars based on performance
-        colors = []
-        for eff in efficiencies:
-            if eff >= 85:
-                colors.append('#28a745')  # Green
-            elif eff >= 75:
-                colors.append('#ffc107')  # Yellow
-            else:
-                colors.append('#dc3545')  # Red
+        colors = [self.STATUS_COLORS[t['status_index']] for t in sorted_data]
+
+        # Same roster size as last report: update the existing artists in place
+        if len(chart.get('bars', ())) == len(technicians):
+            ax = chart['ax']
+            for bar, text, eff, color in zip(chart['bars'], chart['texts'], efficiencies, colors):
+                bar.set_height(eff)
+                bar.set_facecolor(color)
+                text.set_position((bar.get_x() + bar.get_width()/2., eff))
+                text.set_text(f'{eff:.1f}%')
+            self._set_technician_xticks(ax, technicians)
+            ax.relim()
+            ax.autoscale_view()
+            chart['canvas'].draw_idle()
+            return
+
+        fig = chart['fig']
+        fig.clear()
+        ax = fig.add_subplot(111)
 
-        bars = ax.bar(technicians, efficiencies, color=colors, alpha=0.7, edgecolor='black')
+        x = range(len(technicians))
+        bars = ax.bar(x, efficiencies, color=colors, alpha=0.7, edgecolor='black')
 
         # Add target line
         ax.axhline(y=self.TARGET_EFFICIENCY * 100, color='red', linestyle='--', linewidth=2, label=f'Target ({self.TARGET_EFFICIENCY * 100}%)')
 
         # Add value labels on bars
+        texts = []
         for bar in bars:
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
+            texts.append(ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{height:.1f}%',
-                   ha='center', va='bottom', fontsize=9, fontweight='bold')
+                   ha='center', va='bottom', fontsize=9, fontweight='bold'))
 
         ax.set_xlabel('Technician', fontsize=12, fontweight='bold')
         ax.set_ylabel('Efficiency (%)', fontsize=12, fontweight='bold')
         ax.set_title('Technician Efficiency Comparison', fontsize=14, fontweight='bold')
+        self._set_technician_xticks(ax, technicians)
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
 
-        # Rotate x labels if needed
-        for label in ax.get_xticklabels():
-            label.set_rotation(45)
-            label.set_ha('right')
         fig.tight_layout()
 
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
-        self.canvas_widgets.append(canvas_widget)
-
-        # Force canvas update
-        canvas_widget.update_idletasks()
+        chart.update(ax=ax, bars=list(bars), texts=texts)
+        chart['canvas'].draw_idle()
 
     def _create_hours_breakdown_chart(self, tech_data: List[Dict]):
         """Create stacked bar chart showing PM vs CM hours"""
-        frame = self.chart_frames['hours_breakdown']
+        chart = self._get_chart('hours_breakdown')
 
         # Sort by total hours
         sorted_data = sorted(tech_data, key=lambda x: x['total_hours'], reverse=True)
 
-        # Get responsive chart size for multi-chart layout (4 charts total)
-        # Use cached screen dimensions
-        figsize = calculate_chart_size_for_multi_chart_layout(
-            self.screen_width, self.screen_height, num_charts=4
-        )
-
-        fig = Figure(figsize=figsize, dpi=100)
-        ax = fig.add_subplot(111)
+        fig = chart['fig']
+        ax = self._get_chart_axes(chart)
 
         technicians = [t['technician'] for t in sorted_data]
         pm_hours = [t['pm_hours'] for t in sorted_data]
@@ -695,49 +957,39 @@ Data Sources:
         ax.set_xlabel('Technician', fontsize=12, fontweight='bold')
         ax.set_ylabel('Hours', fontsize=12, fontweight='bold')
         ax.set_title('Work Hours Breakdown: PM vs CM', fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.set_xticklabels(technicians, rotation=45, ha='right')
+        self._set_technician_xticks(ax, technicians)
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
 
         fig.tight_layout()
 
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
-        self.canvas_widgets.append(canvas_widget)
-
-        # Force canvas update
-        canvas_widget.update_idletasks()
+        chart['canvas'].draw_idle()
 
     def _create_workload_distribution_chart(self, tech_data: List[Dict]):
         """Create pie chart showing workload distribution"""
-        frame = self.chart_frames['workload_distribution']
-
-        # Get responsive chart size for multi-chart layout (4 charts total)
-        # Use cached screen dimensions
-        figsize = calculate_chart_size_for_multi_chart_layout(
-            self.screen_width, self.screen_height, num_charts=4
-        )
+        chart = self._get_chart('workload_distribution')
 
-        fig = Figure(figsize=figsize, dpi=100)
+        fig = chart['fig']
+        fig.clear()
 
         # Create two subplots - one for hours, one for task count
         ax1 = fig.add_subplot(121)
         ax2 = fig.add_subplot(122)
 
-        # Hours distribution
-        technicians = [t['technician'] for t in tech_data if t['total_hours'] > 0]
-        total_hours = [t['total_hours'] for t in tech_data if t['total_hours'] > 0]
+        # Hours distribution - labels and values collected together so they stay paired
+        hours_pairs = [(t['technician'], t['total_hours']) for t in tech_data if t['total_hours'] > 0]
+        technicians, total_hours = zip(*hours_pairs) if hours_pairs else ((), ())
 
         if total_hours:
             ax1.pie(total_hours, labels=technicians, autopct='%1.1f%%', startangle=90)
             ax1.set_title('Total Hours Distribution', fontsize=12, fontweight='bold')
 
         # Task count distribution
-        task_counts = [t['pm_count'] + t['cm_count'] for t in tech_data if (t['pm_count'] + t['cm_count']) > 0]
-        tech_names = [t['technician'] for t in tech_data if (t['pm_count'] + t['cm_count']) > 0]
+        task_pairs = [
+            (t['technician'], count) for t in tech_data
+            if (count := t['pm_count'] + t['cm_count']) > 0
+        ]
+        tech_names, task_counts = zip(*task_pairs) if task_pairs else ((), ())
 
         if task_counts:
             ax2.pie(task_counts, labels=tech_names, autopct='%1.1f%%', startangle=90)
@@ -745,64 +997,99 @@ Data Sources:
 
         fig.tight_layout()
 
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
-        self.canvas_widgets.append(canvas_widget)
-
-        # Force canvas update
-        canvas_widget.update_idletasks()
+        chart['canvas'].draw_idle()
 
     def _create_trend_chart(self, tech_data: List[Dict]):
         """Create chart showing efficiency vs target"""
-        frame = self.chart_frames['trend_analysis']
-
-        # Get responsive chart size for multi-chart layout (4 charts total)
-        # Use cached screen dimensions
-        figsize = calculate_chart_size_for_multi_chart_layout(
-            self.screen_width, self.screen_height, num_charts=4
-        )
-
-        fig = Figure(figsize=figsize, dpi=100)
-        ax = fig.add_subplot(111)
-
-        # Sort by technician name for consistent display
-        sorted_data = sorted(tech_data, key=lambda x: x['technician'])
+        chart = self._get_chart('trend_analysis')
+
+        # tech_data is already sorted by technician name (see generate_report);
+        # names and efficiencies are gathered in one pass into preallocated storage
+        n = len(tech_data)
+        names = [None] * n
+        efficiencies = np.empty(n, dtype=float)
+        for i, tech in enumerate(tech_data):
+            names[i] = tech['technician']
+            efficiencies[i] = tech['efficiency']
+        technicians = tuple(names)
+
+        # Same roster and the new values fit the current y-range: blit just the changed artists
+        if chart.get('background') is not None and chart.get('technicians') == technicians:
+            low, high = chart['ax'].get_ylim()
+            if efficiencies.size == 0 or (efficiencies.min() >= low and efficiencies.max() <= high):
+                self.update_trend_chart(efficiencies)
+                return
 
-        technicians = [t['technician'] for t in sorted_data]
-        efficiencies = [t['efficiency'] for t in sorted_data]
-        x = range(len(technicians))
+        fig = chart['fig']
+        ax = self._get_chart_axes(chart)
+        x = np.arange(len(technicians))
 
-        # Plot efficiency line
-        ax.plot(x, efficiencies, marker='o', linewidth=2, markersize=8, label='Actual Efficiency', color='#007bff')
+        # Plot efficiency line - animated, so it is left out of the cached background
+        line, = ax.plot(x, efficiencies, marker='o', linewidth=2, markersize=8, label='Actual Efficiency',
+                        color='#007bff', animated=True)
 
         # Plot target line
-        target_line = [self.TARGET_EFFICIENCY * 100] * len(technicians)
+        target_line = np.full_like(efficiencies, self.TARGET_EFFICIENCY * 100)
         ax.plot(x, target_line, linestyle='--', linewidth=2, label=f'Target ({self.TARGET_EFFICIENCY * 100}%)', color='red')
 
-        # Fill area between efficiency and target
-        ax.fill_between(x, efficiencies, target_line, alpha=0.2, color='green', where=[e >= t for e, t in zip(efficiencies, target_line)])
-        ax.fill_between(x, efficiencies, target_line, alpha=0.2, color='red', where=[e < t for e, t in zip(efficiencies, target_line)])
-
         ax.set_xlabel('Technician', fontsize=12, fontweight='bold')
         ax.set_ylabel('Efficiency (%)', fontsize=12, fontweight='bold')
         ax.set_title('Efficiency vs Target Analysis', fontsize=14, fontweight='bold')
-        ax.set_xticks(x)
-        ax.set_xticklabels(technicians, rotation=45, ha='right')
+        self._set_technician_xticks(ax, technicians)
         ax.legend()
         ax.grid(True, alpha=0.3)
 
+        chart.update(technicians=technicians, line=line, background=None,
+                     fills=self._fill_trend_areas(ax, x, efficiencies))
+        if 'draw_cid' not in chart:
+            # Every full draw (report rebuild, resize) re-captures the background
+            chart['draw_cid'] = chart['canvas'].mpl_connect('draw_event', lambda event: self._on_trend_chart_draw(chart))
+
         fig.tight_layout()
 
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
-        self.canvas_widgets.append(canvas_widget)
+        chart['canvas'].draw_idle()
+
+    def _fill_trend_areas(self, ax, x, efficiencies) -> List:
+        """Shade above/below target areas of the trend chart as animated artists"""
+        target = self.TARGET_EFFICIENCY * 100
+        above = efficiencies >= target
+        return [
+            ax.fill_between(x, efficiencies, target, alpha=0.2, color='green', where=above, animated=True),
+            ax.fill_between(x, efficiencies, target, alpha=0.2, color='red', where=~above, animated=True),
+        ]
+
+    def _on_trend_chart_draw(self, chart: Dict):
+        """Cache the static trend chart background and draw the animated artists over it"""
+        chart['background'] = chart['canvas'].copy_from_bbox(chart['ax'].bbox)
+        self._draw_trend_artists(chart)
+
+    def _draw_trend_artists(self, chart: Dict):
+        """Draw the data-dependent trend chart artists"""
+        ax = chart['ax']
+        for artist in chart['fills']:
+            ax.draw_artist(artist)
+        ax.draw_artist(chart['line'])
+
+    def update_trend_chart(self, new_efficiencies):
+        """
+        Update the trend chart for new efficiency values of the same technicians
+
+        Only the efficiency line and shaded areas are redrawn, blitted over the cached
+        background; a full draw is left to report rebuilds and resizes
+        """
+        chart = self._chart_objs['trend_analysis']
+        ax = chart['ax']
+        new_efficiencies = np.asarray(new_efficiencies, dtype=float)
+
+        chart['line'].set_ydata(new_efficiencies)
+        for artist in chart['fills']:
+            artist.remove()
+        chart['fills'] = self._fill_trend_areas(ax, np.arange(len(new_efficiencies)), new_efficiencies)
 
-        # Force canvas update
-        canvas_widget.update_idletasks()
+        canvas = chart['canvas']
+        canvas.restore_region(chart['background'])
+        self._draw_trend_artists(chart)
+        canvas.blit(ax.bbox)
 
     def print_report(self):
         """Print the current efficiency report"""
@@ -820,8 +1107,7 @@ Data Sources:
     def export_to_excel(self):
         """Export report data to Excel file"""
         try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            openpyxl, WriteOnlyCell, get_column_letter = _openpyxl()
 
             # Get file path from user
             file_path = filedialog.asksaveasfilename(
@@ -833,26 +1119,23 @@ Data Sources:
             if not file_path:
                 return
 
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Efficiency Report"
-
-            # Add title
-            ws['A1'] = "Technician Efficiency Report"
-            ws['A1'].font = Font(size=16, bold=True)
-            ws.merge_cells('A1:J1')
+            # Create workbook - write-only mode streams rows straight to XML
+            # instead of building the whole sheet as Cell objects in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Efficiency Report")
 
-            # Add date range
-            ws['A2'] = f"Period: {self.start_date_var.get()} to {self.end_date_var.get()}"
-            ws['A2'].font = Font(size=12)
-            ws.merge_cells('A2:J2')
+            # Shared styles, assigned only to the cells that need them
+            xl = _excel_styles()
 
-            # Add summary
-            row = 4
-            ws[f'A{row}'] = "OVERALL SUMMARY"
-            ws[f'A{row}'].font = Font(size=14, bold=True)
-            row += 1
+            def styled(value, font=None, fill=None, alignment=None):
+                cell = WriteOnlyCell(ws, value=value)
+                if font is not None:
+                    cell.font = font
+                if fill is not None:
+                    cell.fill = fill
+                if alignment is not None:
+                    cell.alignment = alignment
+                return cell
 
             summary_data = [
                 ('Total Available Hours', self.summary_labels['total_available'].cget('text')),
@@ -862,49 +1145,43 @@ Data Sources:
                 ('CM Hours', self.summary_labels['cm_hours'].cget('text')),
                 ('Target Efficiency', self.summary_labels['target'].cget('text')),
             ]
+            headers = ['Technician', 'Available Hrs', 'PM Hours', 'CM Hours', 'Total Hours',
+                      'PM Count', 'CM Count', 'Efficiency %', 'vs Target', 'Status']
+            detail_rows = self._last_report_rows
+
+            # Column widths in one pass over the values being written; write-only
+            # sheets need them set before the first row is appended
+            max_widths = [len(h) for h in headers]
+            for row_values in [*summary_data, *detail_rows]:
+                for col, value in enumerate(row_values):
+                    max_widths[col] = max(max_widths[col], len(str(value)))
+            for col, width in enumerate(max_widths, start=1):
+                ws.column_dimensions[get_column_letter(col)].width = width + 2
+
+            # Add title and date range
+            ws.append([styled("Technician Efficiency Report", xl['title'])])
+            ws.append([styled(f"Period: {self.start_date_var.get()} to {self.end_date_var.get()}", xl['period'])])
+            ws.merged_cells.ranges.add('A1:J1')
+            ws.merged_cells.ranges.add('A2:J2')
+            ws.append([])
+
+            # Add summary
+            ws.append([styled("OVERALL SUMMARY", xl['section'])])
 
             for label, value in summary_data:
-                ws[f'A{row}'] = label
-                ws[f'B{row}'] = value
-                ws[f'A{row}'].font = Font(bold=True)
-                row += 1
+                ws.append([styled(label, xl['bold']), value])
 
             # Add technician details
-            row += 2
-            ws[f'A{row}'] = "TECHNICIAN PERFORMANCE DETAILS"
-            ws[f'A{row}'].font = Font(size=14, bold=True)
-            row += 1
+            ws.append([])
+            ws.append([])
+            ws.append([styled("TECHNICIAN PERFORMANCE DETAILS", xl['section'])])
 
             # Headers
-            headers = ['Technician', 'Available Hrs', 'PM Hours', 'CM Hours', 'Total Hours',
-                      'PM Count', 'CM Count', 'Efficiency %', 'vs Target', 'Status']
-            for col, header in enumerate(headers, start=1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-                cell.alignment = Alignment(horizontal='center')
-
-            row += 1
+            ws.append([styled(header, xl['bold'], xl['header_fill'], xl['center']) for header in headers])
 
             # Data rows
-            for item in self.tech_tree.get_children():
-                values = self.tech_tree.item(item)['values']
-                for col, value in enumerate(values, start=1):
-                    ws.cell(row=row, column=col, value=value)
-                row += 1
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column[0].column_letter].width = adjusted_width
+            for row_values in detail_rows:
+                ws.append(row_values)
 
             # Save workbook
             wb.save(file_path)
@@ -920,12 +1197,10 @@ Data Sources:
     def export_to_pdf(self):
         """Export report to PDF format"""
         try:
-            from reportlab.lib.pagesizes import letter, landscape
-            from reportlab.lib import colors
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT
+            letter, landscape, inch, SimpleDocTemplate, Table, LongTable, Paragraph, Spacer = _reportlab()
+
+            pdf_styles = _pdf_styles()
+            styles = pdf_styles['styles']
 
             # Get file path from user
             file_path = filedialog.asksaveasfilename(
@@ -940,30 +1215,14 @@ Data Sources:
             # Create PDF document
             doc = SimpleDocTemplate(file_path, pagesize=landscape(letter))
             elements = []
-            styles = getSampleStyleSheet()
 
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#003366'),
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            elements.append(Paragraph("Technician Efficiency Report", title_style))
+            elements.append(Paragraph("Technician Efficiency Report", pdf_styles['title']))
 
             # Date range
-            date_style = ParagraphStyle(
-                'DateStyle',
-                parent=styles['Normal'],
-                fontSize=12,
-                alignment=TA_CENTER,
-                spaceAfter=20
-            )
             elements.append(Paragraph(
                 f"Report Period: {self.start_date_var.get()} to {self.end_date_var.get()}",
-                date_style
+                pdf_styles['date']
             ))
 
             elements.append(Spacer(1, 0.3*inch))
@@ -982,16 +1241,7 @@ Data Sources:
             ]
 
             summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            summary_table.setStyle(pdf_styles['summary_table'])
 
             elements.append(summary_table)
             elements.append(Spacer(1, 0.3*inch))
@@ -999,30 +1249,18 @@ Data Sources:
             # Technician details
             elements.append(Paragraph("Technician Performance Details", styles['Heading2']))
 
-            # Get data from treeview
+            # Cells are pre-stringified so ReportLab lays them out as plain strings
             detail_data = [['Technician', 'Avail Hrs', 'PM Hrs', 'CM Hrs', 'Total Hrs',
                            'PM Cnt', 'CM Cnt', 'Efficiency', 'vs Target', 'Status']]
-
-            for item in self.tech_tree.get_children():
-                values = self.tech_tree.item(item)['values']
-                detail_data.append(values)
+            detail_data.extend([str(value) for value in values] for values in self._last_report_rows)
 
             # Create table with adjusted column widths
             col_widths = [1.5*inch, 0.8*inch, 0.7*inch, 0.7*inch, 0.8*inch,
                          0.6*inch, 0.6*inch, 0.9*inch, 0.9*inch, 1*inch]
 
-            detail_table = Table(detail_data, colWidths=col_widths)
-            detail_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ]))
+            # LongTable lays out row by row, which scales better for long technician lists
+            detail_table = LongTable(detail_data, colWidths=col_widths, repeatRows=1, splitByRow=1)
+            detail_table.setStyle(pdf_styles['detail_table'])
 
             elements.append(detail_table)
 
@@ -1030,19 +1268,7 @@ Data Sources:
             elements.append(Spacer(1, 0.3*inch))
             elements.append(Paragraph("Report Notes", styles['Heading3']))
 
-            notes_text = f"""
-            <para>
-            <b>Efficiency Calculation Methodology:</b><br/>
-            • Annual Working Hours per Technician: {self.ANNUAL_HOURS_PER_TECH} hours<br/>
-            • Total Technicians: {self.TOTAL_TECHNICIANS}<br/>
-            • Weekly Team Availability: {self.WEEKLY_AVAILABILITY_HOURS} hours<br/>
-            • Target Efficiency: {self.TARGET_EFFICIENCY * 100}%<br/>
-            <br/>
-            <b>Efficiency Formula:</b> (Total Worked Hours / Total Available Hours) × 100%<br/>
-            <br/>
-            Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            </para>
-            """
+            notes_text = f"{self.PDF_NOTES_HEAD}Report Generated: {datetime.now():%Y-%m-%d %H:%M:%S}</para>"
 
             elements.append(Paragraph(notes_text, styles['Normal']))
 
@@ -7,14 +7,18 @@ Handles equipment-related operations including:
 - Equipment validation
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
 from datetime import datetime
+import time
 import psycopg2
 
 
 class EquipmentManager:
     """Manages equipment operations in the CMMS system"""
 
+    # Seconds the statistics / attention aggregates are reused before re-querying
+    AGGREGATE_CACHE_TTL = 30
+
     def __init__(self, conn):
         """
         Initialize equipment manager
@@ -23,6 +27,24 @@ class EquipmentManager:
             conn: Database connection
         """
         self.conn = conn
+        self._aggregate_cache = {}  # name -> (fetched_at, result)
+
+    def is_cached(self, name: str) -> bool:
+        """True if the 'statistics' or 'attention' aggregate can be served without a query"""
+        cached = self._aggregate_cache.get(name)
+        return bool(cached) and time.monotonic() - cached[0] < self.AGGREGATE_CACHE_TTL
+
+    def _cached_aggregate(self, name: str, loader: Callable):
+        """Return a cached aggregate result, reloading it once AGGREGATE_CACHE_TTL has passed"""
+        if self.is_cached(name):
+            return self._aggregate_cache[name][1]
+        result = loader()
+        self._aggregate_cache[name] = (time.monotonic(), result)
+        return result
+
+    def invalidate_cache(self):
+        """Drop cached statistics / attention results after equipment changes"""
+        self._aggregate_cache.clear()
 
     def get_equipment_by_bfm(self, bfm_no: str) -> Optional[Dict]:
         """
@@ -96,6 +118,31 @@ class EquipmentManager:
 
         return results
 
+    def search_bfm_prefix(self, prefix: str, limit: int = 20) -> List[str]:
+        """
+        Get BFM numbers starting with a prefix (for autocomplete)
+
+        Args:
+            prefix: Leading characters of the BFM number
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of matching BFM numbers in order
+        """
+        # Escape LIKE wildcards so the prefix is matched literally
+        pattern = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT bfm_equipment_no
+            FROM equipment
+            WHERE bfm_equipment_no ILIKE %s
+            ORDER BY bfm_equipment_no
+            LIMIT %s
+        ''', (pattern, limit))
+
+        return [row[0] for row in cursor.fetchall()]
+
     def get_all_equipment(self, status_filter: Optional[str] = None) -> List[Dict]:
         """
         Get all equipment records
@@ -180,6 +227,7 @@ class EquipmentManager:
             ))
 
             self.conn.commit()
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"Error updating equipment status: {e}")
@@ -216,20 +264,29 @@ class EquipmentManager:
                 ''', (completion_date, bfm_no))
 
             self.conn.commit()
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"Error updating PM dates: {e}")
             self.conn.rollback()
             return False
 
-    def get_equipment_statistics(self) -> Dict:
+    def get_equipment_statistics(self, cursor=None) -> Dict:
         """
-        Get equipment statistics
+        Get equipment statistics (cached for AGGREGATE_CACHE_TTL seconds)
+
+        Args:
+            cursor: Optional cursor to query with instead of one on self.conn
 
         Returns:
             Dictionary with various equipment statistics
         """
-        cursor = self.conn.cursor()
+        return dict(self._cached_aggregate(
+            'statistics', lambda: self._load_equipment_statistics(cursor)))
+
+    def _load_equipment_statistics(self, cursor=None) -> Dict:
+        """Query the equipment statistics"""
+        cursor = cursor or self.conn.cursor()
 
         stats = {}
 
@@ -259,14 +316,24 @@ class EquipmentManager:
 
         return stats
 
-    def get_equipment_requiring_attention(self) -> Dict[str, List[Dict]]:
+    def get_equipment_requiring_attention(self, cursor=None) -> Dict[str, List[Dict]]:
         """
         Get equipment requiring attention (overdue PMs, missing equipment, etc.)
+        Cached for AGGREGATE_CACHE_TTL seconds.
+
+        Args:
+            cursor: Optional cursor to query with instead of one on self.conn
 
         Returns:
             Dictionary with categories of equipment requiring attention
         """
-        cursor = self.conn.cursor()
+        attention = self._cached_aggregate(
+            'attention', lambda: self._load_equipment_requiring_attention(cursor))
+        return {category: list(items) for category, items in attention.items()}
+
+    def _load_equipment_requiring_attention(self, cursor=None) -> Dict[str, List[Dict]]:
+        """Query the equipment requiring attention"""
+        cursor = cursor or self.conn.cursor()
 
         results = {
             'overdue_monthly': [],
@@ -430,6 +497,7 @@ class EquipmentManager:
             ))
 
             self.conn.commit()
+            self.invalidate_cache()
             return True, f"Equipment {equipment_data['bfm_no']} added successfully"
         except Exception as e:
             print(f"Error adding equipment: {e}")
@@ -472,6 +540,7 @@ class EquipmentManager:
             ))
 
             self.conn.commit()
+            self.invalidate_cache()
             return True, f"Equipment {bfm_no} deleted successfully"
         except Exception as e:
             print(f"Error deleting equipment: {e}")
@@ -11,6 +11,10 @@ This script shows practical examples of:
 6. KPI Trend Analysis
 """
 
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from database_utils import db_pool
 
@@ -361,12 +365,41 @@ def example_kpi_trend_analyzer():
         db_pool.return_connection(conn)
 
 
+class _ThreadOutput:
+    """stdout stand-in that sends each worker thread's prints to its own buffer"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+
+    def flush(self):
+        getattr(self.local, 'buffer', self.stream).flush()
+
+
+def _run_example(example, output):
+    """Run one example with its prints captured; returns (captured_text, error)"""
+    output.local.buffer = buffer = io.StringIO()
+    try:
+        example()
+        return buffer.getvalue(), None
+    except Exception as e:
+        return buffer.getvalue(), e
+    finally:
+        del output.local.buffer
+
+
 def main():
     """Run all examples"""
     print("\n" + "=" * 80)
     print(" AIT CMMS - Modular Features Integration Examples")
     print("=" * 80)
 
+    examples = [example_pm_scheduler, example_equipment_manager, example_backup_manager,
+                example_equipment_history, example_kpi_auto_collector, example_kpi_trend_analyzer]
+
     try:
         # Initialize database pool (use your actual config)
         db_config = {
@@ -378,15 +411,32 @@ def main():
             'sslmode': 'require'
         }
 
-        db_pool.initialize(db_config, min_conn=2, max_conn=10)
+        # One pre-opened connection per concurrently running example, so none of
+        # them waits on a TCP/TLS handshake when it first asks for a connection
+        db_pool.initialize(db_config, min_conn=len(examples), max_conn=10)
+    except Exception as e:
+        # No point starting the examples without a database
+        print(f"\nError initializing database pool: {str(e)}")
+        return
 
-        # Run examples
-        example_pm_scheduler()
-        example_equipment_manager()
-        example_backup_manager()
-        example_equipment_history()
-        example_kpi_auto_collector()
-        example_kpi_trend_analyzer()
+    try:
+        # Run examples - they are independent and I/O bound, so overlap their
+        # database round-trips; each one's output is buffered and printed whole
+        output = _ThreadOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+                futures = [executor.submit(_run_example, example, output) for example in examples]
+                first_error = None
+                for future in as_completed(futures):
+                    text, error = future.result()
+                    output.stream.write(text)
+                    first_error = first_error or error
+        finally:
+            sys.stdout = output.stream
+
+        if first_error is not None:
+            raise first_error
 
         print("\n" + "=" * 80)
         print(" All examples completed successfully!")
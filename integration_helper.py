@@ -366,28 +366,26 @@ PM CONFIGURATION:
 EQUIPMENT REQUIRING ATTENTION
 {'=' * 70}
 
-OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
-\"\"\"
+OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}\"\"\"
 
-            for eq in attention['overdue_monthly'][:10]:
-                report += f"  - {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)\\n"
+            # Collect the report lines in a list and join once at the end
+            parts = [report]
+            parts.extend(f"  - {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)"
+                         for eq in attention['overdue_monthly'][:10])
 
-            report += f"\\nOVERDUE ANNUAL PMs: {len(attention['overdue_annual'])}\\n"
+            parts.append(f"\\nOVERDUE ANNUAL PMs: {len(attention['overdue_annual'])}")
+            parts.extend(f"  - {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)"
+                         for eq in attention['overdue_annual'][:10])
 
-            for eq in attention['overdue_annual'][:10]:
-                report += f"  - {eq['bfm_no']}: {eq['description'][:40]} ({eq['days_overdue']} days overdue)\\n"
+            parts.append(f"\\nMISSING EQUIPMENT: {len(attention['missing'])}")
+            parts.extend(f"  - {eq['bfm_no']}: {eq['description'][:40]}"
+                         for eq in attention['missing'][:10])
 
-            report += f"\\nMISSING EQUIPMENT: {len(attention['missing'])}\\n"
+            parts.append(f"\\nNO PM HISTORY: {len(attention['no_pm_history'])}")
+            parts.extend(f"  - {eq['bfm_no']}: {eq['description'][:40]}"
+                         for eq in attention['no_pm_history'][:10])
 
-            for eq in attention['missing'][:10]:
-                report += f"  - {eq['bfm_no']}: {eq['description'][:40]}\\n"
-
-            report += f"\\nNO PM HISTORY: {len(attention['no_pm_history'])}\\n"
-
-            for eq in attention['no_pm_history'][:10]:
-                report += f"  - {eq['bfm_no']}: {eq['description'][:40]}\\n"
-
-            stats_text.insert('1.0', report)
+            stats_text.insert('1.0', "\\n".join(parts) + "\\n")
             stats_text.config(state='disabled')
 
             # Button
@@ -401,7 +399,8 @@ OVERDUE MONTHLY PMs: {len(attention['overdue_monthly'])}
 # INSTRUCTIONS
 # ==============================================================================
 
-print("""
+if __name__ == "__main__":
+    print("""
 ================================================================================
 AIT CMMS - INTEGRATION INSTRUCTIONS
 ================================================================================
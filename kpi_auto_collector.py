@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import calendar
 from decimal import Decimal
+from psycopg2.extras import execute_values
 
 
 class KPIAutoCollector:
@@ -22,12 +23,14 @@ class KPIAutoCollector:
         """
         self.conn = conn
 
-    def auto_collect_all_kpis(self, period: str) -> Dict[str, Dict]:
+    def auto_collect_all_kpis(self, period: str, cursor=None) -> Dict[str, Dict]:
         """
         Auto-collect all possible KPIs for a given period
 
         Args:
             period: Period string (e.g., "2025-01" for January 2025)
+            cursor: Optional cursor to run every query on; one is opened on
+                self.conn if not given
 
         Returns:
             Dictionary of KPI results
@@ -40,15 +43,16 @@ class KPIAutoCollector:
 
         print(f"Auto-collecting KPIs for period {period} ({start_date} to {end_date})")
 
-        # Collect each KPI
-        results['pm_adherence'] = self._collect_pm_adherence(start_date, end_date, period)
-        results['work_orders_opened'] = self._collect_work_orders_opened(start_date, end_date, period)
-        results['work_orders_closed'] = self._collect_work_orders_closed(start_date, end_date, period)
-        results['work_order_backlog'] = self._collect_work_order_backlog(end_date, period)
-        results['technical_availability'] = self._collect_technical_availability(start_date, end_date, period)
-        results['mtbf'] = self._collect_mtbf(start_date, end_date, period)
-        results['mttr'] = self._collect_mttr(start_date, end_date, period)
-        results['maintenance_labor_hours'] = self._collect_labor_hours(start_date, end_date, period)
+        # Collect each KPI, all on one cursor
+        cursor = cursor or self.conn.cursor()
+        results['pm_adherence'] = self._collect_pm_adherence(cursor, start_date, end_date, period)
+        results['work_orders_opened'] = self._collect_work_orders_opened(cursor, start_date, end_date, period)
+        results['work_orders_closed'] = self._collect_work_orders_closed(cursor, start_date, end_date, period)
+        results['work_order_backlog'] = self._collect_work_order_backlog(cursor, end_date, period)
+        results['technical_availability'] = self._collect_technical_availability(cursor, start_date, end_date, period)
+        results['mtbf'] = self._collect_mtbf(cursor, start_date, end_date, period)
+        results['mttr'] = self._collect_mttr(cursor, start_date, end_date, period)
+        results['maintenance_labor_hours'] = self._collect_labor_hours(cursor, start_date, end_date, period)
 
         return results
 
@@ -62,12 +66,13 @@ class KPIAutoCollector:
 
         return start_date, end_date
 
-    def _collect_pm_adherence(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_pm_adherence(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Calculate PM Adherence (F2.2)
         Formula: (Completed PMs / Scheduled PMs) * 100
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -75,8 +80,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         # Count scheduled PMs
         cursor.execute('''
             SELECT COUNT(DISTINCT bfm_equipment_no || pm_type)
@@ -112,11 +115,12 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_work_orders_opened(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_work_orders_opened(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Count Work Orders Opened (F2.2)
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -124,8 +128,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         cursor.execute('''
             SELECT COUNT(*)
             FROM corrective_maintenance
@@ -144,11 +146,12 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_work_orders_closed(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_work_orders_closed(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Count Work Orders Closed (F2.2)
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -156,8 +159,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         cursor.execute('''
             SELECT COUNT(*)
             FROM corrective_maintenance
@@ -176,19 +177,18 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_work_order_backlog(self, end_date: str, period: str) -> Dict:
+    def _collect_work_order_backlog(self, cursor, end_date: str, period: str) -> Dict:
         """
         Count Open Work Orders (Backlog) at end of period (F2.2)
 
         Args:
+            cursor: Cursor shared by the whole collection run
             end_date: Period end date
             period: Period string
 
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         cursor.execute('''
             SELECT COUNT(*)
             FROM corrective_maintenance
@@ -225,7 +225,7 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_technical_availability(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_technical_availability(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Calculate Technical Availability (F2.1)
         Formula: (Operating Time / (Operating Time + Downtime)) * 100
@@ -233,6 +233,7 @@ class KPIAutoCollector:
         Note: Requires downtime tracking data
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -240,8 +241,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         # Calculate total downtime from CM records
         cursor.execute('''
             SELECT COALESCE(SUM(
@@ -294,12 +293,13 @@ class KPIAutoCollector:
             'note': 'Calculated from CM downtime data'
         }
 
-    def _collect_mtbf(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_mtbf(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Calculate Mean Time Between Failures (F2.1)
         Formula: Operating Time / Number of Failures
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -307,8 +307,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         # Count failures (CMs opened)
         cursor.execute('''
             SELECT COUNT(*)
@@ -341,12 +339,13 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_mttr(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_mttr(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Calculate Mean Time To Repair (F2.1)
         Formula: Total Repair Time / Number of Repairs
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -354,8 +353,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         # Get repair times for closed CMs
         cursor.execute('''
             SELECT
@@ -383,11 +380,12 @@ class KPIAutoCollector:
             'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-    def _collect_labor_hours(self, start_date: str, end_date: str, period: str) -> Dict:
+    def _collect_labor_hours(self, cursor, start_date: str, end_date: str, period: str) -> Dict:
         """
         Calculate Total Maintenance Labor Hours
 
         Args:
+            cursor: Cursor shared by the whole collection run
             start_date: Period start date
             end_date: Period end date
             period: Period string
@@ -395,8 +393,6 @@ class KPIAutoCollector:
         Returns:
             Dictionary with KPI data
         """
-        cursor = self.conn.cursor()
-
         # PM labor hours
         cursor.execute('''
             SELECT COALESCE(SUM(labor_hours), 0)
@@ -437,53 +433,46 @@ class KPIAutoCollector:
             user_id: User ID for audit trail
 
         Returns:
-            Dictionary with results
+            Dictionary with results. The upsert is all-or-nothing: either every
+            KPI is saved, or nothing is and 'error' says why.
         """
         try:
-            # Auto-collect all KPIs
-            kpi_results = self.auto_collect_all_kpis(period)
-
-            saved_count = 0
-            errors = []
-
+            # Auto-collect all KPIs and save them on the same cursor
             cursor = self.conn.cursor()
-
-            # Save each KPI to kpi_manual_data table
-            for kpi_name, kpi_data in kpi_results.items():
-                try:
-                    # Save main value
-                    cursor.execute('''
-                        INSERT INTO kpi_manual_data
-                        (kpi_name, measurement_period, data_field, data_value, notes, entered_by)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (kpi_name, measurement_period, data_field)
-                        DO UPDATE SET
-                            data_value = EXCLUDED.data_value,
-                            notes = EXCLUDED.notes,
-                            entered_by = EXCLUDED.entered_by,
-                            entered_date = CURRENT_TIMESTAMP
-                    ''', (
-                        kpi_data['kpi_name'],
-                        period,
-                        'value',
-                        kpi_data['value'],
-                        f"Auto-calculated on {kpi_data['calculation_date']}",
-                        user_id
-                    ))
-
-                    saved_count += 1
-
-                except Exception as e:
-                    errors.append(f"Error saving {kpi_name}: {str(e)}")
+            kpi_results = self.auto_collect_all_kpis(period, cursor)
+
+            # Main value of every KPI, saved to kpi_manual_data in one multi-row upsert
+            rows = [
+                (
+                    kpi_data['kpi_name'],
+                    period,
+                    'value',
+                    kpi_data['value'],
+                    f"Auto-calculated on {kpi_data['calculation_date']}",
+                    user_id
+                )
+                for kpi_data in kpi_results.values()
+            ]
+
+            execute_values(cursor, '''
+                INSERT INTO kpi_manual_data
+                (kpi_name, measurement_period, data_field, data_value, notes, entered_by)
+                VALUES %s
+                ON CONFLICT (kpi_name, measurement_period, data_field)
+                DO UPDATE SET
+                    data_value = EXCLUDED.data_value,
+                    notes = EXCLUDED.notes,
+                    entered_by = EXCLUDED.entered_by,
+                    entered_date = CURRENT_TIMESTAMP
+            ''', rows)
 
             self.conn.commit()
 
             return {
                 'success': True,
                 'period': period,
-                'saved_count': saved_count,
-                'total_kpis': len(kpi_results),
-                'errors': errors
+                'saved_count': len(rows),
+                'total_kpis': len(kpi_results)
             }
 
         except Exception as e:
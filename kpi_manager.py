@@ -5,22 +5,360 @@ Handles KPI calculations, data management, and reporting for 2025 KPIs
 
 import psycopg2
 from psycopg2 import extras
-from datetime import datetime, timedelta
 from decimal import Decimal
-import calendar
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+import logging
+import traceback
+
+logger = logging.getLogger(__name__)
+
+
+# Upsert of manual KPI input fields, expanded by execute_values like KPI_RESULT_UPSERT
+MANUAL_DATA_UPSERT = """
+    INSERT INTO kpi_manual_data
+    (kpi_name, measurement_period, data_field, data_value, data_text, notes, entered_by)
+    VALUES %s
+    ON CONFLICT (kpi_name, measurement_period, data_field)
+    DO UPDATE SET
+        data_value = EXCLUDED.data_value,
+        data_text = EXCLUDED.data_text,
+        notes = EXCLUDED.notes,
+        entered_by = EXCLUDED.entered_by,
+        entered_date = CURRENT_TIMESTAMP
+"""
+
+# Upsert of calculated KPI results; rows are expanded by execute_values so one
+# statement can save a single result or a whole batch
+KPI_RESULT_UPSERT = """
+    INSERT INTO kpi_results
+    (kpi_name, measurement_period, calculated_value, calculated_text,
+     target_value, meets_criteria, calculated_by, notes)
+    VALUES %s
+    ON CONFLICT (kpi_name, measurement_period)
+    DO UPDATE SET
+        calculated_value = EXCLUDED.calculated_value,
+        calculated_text = EXCLUDED.calculated_text,
+        target_value = EXCLUDED.target_value,
+        meets_criteria = EXCLUDED.meets_criteria,
+        calculated_by = EXCLUDED.calculated_by,
+        notes = EXCLUDED.notes,
+        calculation_date = CURRENT_TIMESTAMP
+"""
+
+
+# Every KPI that can be entered manually, in selector order
+MANUAL_KPI_NAMES = (
+    'FR1',
+    'Near Miss',
+    'TTR (Time to Repair) Adherence',
+    'MTBF Mean Time Between Failure',
+    'Technical Availability Adherence',
+    'MRT (Mean Response Time)',
+    'WO opened vs WO closed',
+    'WO Backlog',
+    'WO age profile',
+    'Preventive Maintenance Adherence',
+    'Top Breakdown',
+    'Purchaser Monthly process Confirmation',
+    'Purchaser satisfaction',
+    'Non Conformances raised',
+    'Non Conformances closed',
+    'Mean Time to Deliver a Quote',
+    'Purchaser Satisfaction Survey'
+)
+
+# Manual input fields required by each KPI
+_KPI_REQUIRED_FIELDS = {
+    'FR1': (
+        {'field': 'accident_count', 'label': 'Number of Accidents (sick leave > 24h)', 'type': 'number'},
+        {'field': 'hours_worked', 'label': 'Number of Hours Worked', 'type': 'number'},
+    ),
+    'Near Miss': (
+        {'field': 'near_miss_count', 'label': 'Number of Near Miss Reports', 'type': 'number'},
+    ),
+    'TTR (Time to Repair) Adherence': (
+        {'field': 'p1_within_target', 'label': 'P1 Assets Fixed Within 2 Hours', 'type': 'number'},
+        {'field': 'p1_total', 'label': 'Total P1 Asset Failures', 'type': 'number'},
+        {'field': 'p2_within_target', 'label': 'P2 Assets Fixed Within 4 Hours', 'type': 'number'},
+        {'field': 'p2_total', 'label': 'Total P2 Asset Failures', 'type': 'number'},
+    ),
+    'MTBF Mean Time Between Failure': (
+        {'field': 'p1_operating_hours', 'label': 'P1 Assets Total Operating Hours', 'type': 'number'},
+        {'field': 'p1_failure_count', 'label': 'P1 Assets Failure Count', 'type': 'number'},
+        {'field': 'p2_operating_hours', 'label': 'P2 Assets Total Operating Hours', 'type': 'number'},
+        {'field': 'p2_failure_count', 'label': 'P2 Assets Failure Count', 'type': 'number'},
+    ),
+    'Technical Availability Adherence': (
+        {'field': 'p1_assets_meeting_target', 'label': 'P1 Assets Meeting >95% Availability', 'type': 'number'},
+        {'field': 'p1_total_assets', 'label': 'Total P1 Assets', 'type': 'number'},
+    ),
+    'MRT (Mean Response Time)': (
+        {'field': 'total_response_time_minutes', 'label': 'Total Response Time (minutes)', 'type': 'number'},
+        {'field': 'wo_count', 'label': 'Number of Work Orders', 'type': 'number'},
+    ),
+    'WO opened vs WO closed': (
+        {'field': 'wo_opened', 'label': 'Number of Work Orders Opened', 'type': 'number'},
+        {'field': 'wo_closed', 'label': 'Number of Work Orders Closed', 'type': 'number'},
+        {'field': 'wo_currently_open', 'label': 'Number of Work Orders Currently Open', 'type': 'number'},
+    ),
+    'WO Backlog': (
+        {'field': 'wo_raised_this_month', 'label': 'Work Orders Raised This Month', 'type': 'number'},
+        {'field': 'wo_open', 'label': 'Work Orders Still Open', 'type': 'number'},
+    ),
+    'WO age profile': (
+        {'field': 'wo_over_60_days', 'label': 'Work Orders Over 60 Days Old', 'type': 'number'},
+        {'field': 'total_open_wo', 'label': 'Total Open Work Orders', 'type': 'number'},
+        {'field': 'avg_age_days', 'label': 'Average Age of Open WOs (days)', 'type': 'number'},
+    ),
+    'Preventive Maintenance Adherence': (
+        {'field': 'pm_scheduled', 'label': 'PM Work Orders Scheduled', 'type': 'number'},
+        {'field': 'pm_completed', 'label': 'PM Work Orders Completed', 'type': 'number'},
+    ),
+    'Non Conformances raised': (
+        {'field': 'nc_count', 'label': 'Number of Non-Conformances Raised', 'type': 'number'},
+    ),
+    'Non Conformances closed': (
+        {'field': 'nc_closed_on_time', 'label': 'Non-Conformances Closed On Time', 'type': 'number'},
+        {'field': 'nc_total', 'label': 'Total Non-Conformances Due', 'type': 'number'},
+    ),
+    'Mean Time to Deliver a Quote': (
+        {'field': 'total_quote_time_hours', 'label': 'Total Quote Delivery Time (hours)', 'type': 'number'},
+        {'field': 'quote_count', 'label': 'Number of Quotes Requested', 'type': 'number'},
+    ),
+    'Purchaser satisfaction': (
+        {'field': 'satisfaction_score', 'label': 'Satisfaction Score (%)', 'type': 'number'},
+    ),
+    'Purchaser Satisfaction Survey': (
+        {'field': 'survey_score', 'label': 'Yearly Satisfaction Survey Score (%)', 'type': 'number'},
+    ),
+    'Top Breakdown': (
+        {'field': 'breakdown_analysis', 'label': 'Breakdown Analysis (Pareto)', 'type': 'text'},
+    ),
+    'Purchaser Monthly process Confirmation': (
+        {'field': 'confirmation_score', 'label': 'Confirmation Score (%)', 'type': 'number'},
+    )
+}
+
+
+@lru_cache(maxsize=32)
+def _period_range(measurement_period):
+    """
+    Date bounds of a 'YYYY-MM' period as ISO strings: (first day, first day of next month)
+
+    The upper bound is exclusive. Strings rather than date objects are returned
+    because several of the filtered columns store ISO dates as TEXT.
+    """
+    year, month = map(int, measurement_period.split('-'))
+    return f"{year}-{month:02d}-01", f"{year + month // 12}-{month % 12 + 1:02d}-01"
+
+
+def _periods_between(start_period, end_period):
+    """List the 'YYYY-MM' periods from start_period to end_period inclusive"""
+    year, month = map(int, start_period.split('-'))
+    end_year, end_month = map(int, end_period.split('-'))
+    periods = []
+    while (year, month) <= (end_year, end_month):
+        periods.append(f"{year}-{month:02d}")
+        year, month = year + month // 12, month % 12 + 1
+    return periods
+
+
+# ==================== MANUAL KPI FORMULAS ====================
+# Each takes the entered data fields and returns (value, meets_criteria, text)
+
+def _manual_fr1(data):
+    accidents = float(data.get('accident_count') or 0)
+    hours = float(data.get('hours_worked') or 1)
+    if hours > 0:
+        result = (accidents / hours) * 1_000_000
+        return result, result == 0, f"{accidents} accidents per {hours:,.0f} hours worked"
+    return None, None, None
+
+
+def _manual_near_miss(data):
+    result = float(data.get('near_miss_count') or 0)
+    return result, None, f"{int(result)} near miss reports"  # No specific target
+
+
+def _manual_ttr_adherence(data):
+    p1_within = float(data.get('p1_within_target') or 0)
+    p1_total = float(data.get('p1_total') or 0)
+    p2_within = float(data.get('p2_within_target') or 0)
+    p2_total = float(data.get('p2_total') or 0)
+
+    # Calculate combined adherence for P1 and P2
+    total_within = p1_within + p2_within
+    total_failures = p1_total + p2_total
+
+    if total_failures > 0:
+        result = (total_within / total_failures) * 100
+        return (result, result >= 95,
+                f"P1: {p1_within}/{p1_total}, P2: {p2_within}/{p2_total} within target ({result:.1f}%)")
+    # No failures means perfect adherence (100%)
+    return 100.0, True, "No P1 or P2 failures - 100% adherence"
+
+
+def _manual_mtbf(data):
+    p1_hours = float(data.get('p1_operating_hours') or 0)
+    p1_failures = float(data.get('p1_failure_count') or 0)
+    if p1_failures > 0:
+        result = p1_hours / p1_failures
+        return result, result > 80, f"{result:.1f} hours between failures (P1 assets)"
+    # No failures - cannot calculate MTBF
+    return None, None, "No failures recorded - MTBF N/A"
+
+
+def _manual_technical_availability(data):
+    meeting = float(data.get('p1_assets_meeting_target') or 0)
+    total = float(data.get('p1_total_assets') or 0)
+    if total > 0:
+        result = (meeting / total) * 100
+        return result, result >= 95, f"{meeting}/{total} P1 assets meeting >95% availability"
+    # No assets to measure
+    return None, None, "No P1 assets to measure - N/A"
+
+
+def _manual_mrt(data):
+    total_time = float(data.get('total_response_time_minutes') or 0)
+    wo_count = float(data.get('wo_count') or 0)
+    if wo_count > 0:
+        result = total_time / wo_count
+        return result, result <= 15, f"{result:.1f} minutes average response time"  # P1 target
+    # No work orders to measure
+    return None, None, "No work orders - MRT N/A"
+
+
+def _manual_nc_raised(data):
+    result = float(data.get('nc_count') or 0)
+    return result, result == 0, f"{int(result)} non-conformances raised"
+
+
+def _manual_nc_closed(data):
+    closed = float(data.get('nc_closed_on_time') or 0)
+    total = float(data.get('nc_total') or 0)
+    if total > 0:
+        result = (closed / total) * 100
+        return result, result == 100, f"{closed}/{total} closed on time"
+    # No non-conformances means 100% compliance
+    return 100.0, True, "No non-conformances - 100% compliance"
+
+
+def _manual_quote_time(data):
+    total_hours = float(data.get('total_quote_time_hours') or 0)
+    quote_count = float(data.get('quote_count') or 0)
+    if quote_count > 0:
+        result = total_hours / quote_count
+        return result, result <= 48, f"{result:.1f} hours average delivery time"
+    # No quotes to measure
+    return None, None, "No quotes delivered - N/A"
+
+
+def _manual_purchaser_satisfaction(data):
+    result = float(data.get('satisfaction_score') or 0)
+    return result, result >= 90, f"{result}% satisfaction score"
+
+
+def _manual_process_confirmation(data):
+    result = float(data.get('confirmation_score') or 0)
+    return result, result >= 90, f"{result}% confirmation score"
+
+
+def _manual_top_breakdown(data):
+    return None, None, data.get('breakdown_analysis') or 'N/A'
+
+
+def _manual_wo_opened_closed(data):
+    opened = float(data.get('wo_opened') or 0)
+    closed = float(data.get('wo_closed') or 0)
+    currently_open = float(data.get('wo_currently_open') or 0)
+    return (currently_open, currently_open <= 40,
+            f"Opened: {int(opened)}, Closed: {int(closed)}, Currently Open: {int(currently_open)}")
+
+
+def _manual_wo_backlog(data):
+    raised = float(data.get('wo_raised_this_month') or 0)
+    open_wo = float(data.get('wo_open') or 0)
+    if raised > 0:
+        backlog_pct = (open_wo / raised) * 100
+        return (open_wo, backlog_pct < 10,
+                f"{int(open_wo)} open ({backlog_pct:.1f}% of {int(raised)} raised)")
+    return open_wo, open_wo == 0, f"{int(open_wo)} open (no WOs raised this month)"
+
+
+def _manual_wo_age_profile(data):
+    over_60 = float(data.get('wo_over_60_days') or 0)
+    avg_age = float(data.get('avg_age_days') or 0)
+    return over_60, over_60 == 0, f"{int(over_60)} WOs over 60 days old (avg age: {avg_age:.1f} days)"
+
+
+def _manual_pm_adherence(data):
+    scheduled = float(data.get('pm_scheduled') or 0)
+    completed = float(data.get('pm_completed') or 0)
+    if scheduled > 0:
+        result = (completed / scheduled) * 100
+        return result, result >= 95, f"{int(completed)}/{int(scheduled)} completed ({result:.1f}%)"
+    return 0, None, "No PM scheduled"
+
+
+def _manual_satisfaction_survey(data):
+    result = float(data.get('survey_score') or 0)
+    return result, result >= 90, f"{result}% satisfaction score"
+
+
+_MANUAL_HANDLERS = {
+    'FR1': _manual_fr1,
+    'Near Miss': _manual_near_miss,
+    'TTR (Time to Repair) Adherence': _manual_ttr_adherence,
+    'MTBF Mean Time Between Failure': _manual_mtbf,
+    'Technical Availability Adherence': _manual_technical_availability,
+    'MRT (Mean Response Time)': _manual_mrt,
+    'Non Conformances raised': _manual_nc_raised,
+    'Non Conformances closed': _manual_nc_closed,
+    'Mean Time to Deliver a Quote': _manual_quote_time,
+    'Purchaser satisfaction': _manual_purchaser_satisfaction,
+    'Purchaser Monthly process Confirmation': _manual_process_confirmation,
+    'Top Breakdown': _manual_top_breakdown,
+    'WO opened vs WO closed': _manual_wo_opened_closed,
+    'WO Backlog': _manual_wo_backlog,
+    'WO age profile': _manual_wo_age_profile,
+    'Preventive Maintenance Adherence': _manual_pm_adherence,
+    'Purchaser Satisfaction Survey': _manual_satisfaction_survey,
+}
 
 
 class KPIManager:
     """Manages KPI calculations and data"""
 
+    # Seconds the active KPI definitions are reused before re-querying
+    DEFINITIONS_CACHE_TTL = 60
+
     def __init__(self, pool):
         """Initialize with database connection pool"""
         self.pool = pool
-
-    def get_all_kpi_definitions(self):
-        """Get all active KPI definitions"""
+        self._defs_cache = None  # Active definitions in display order
+        self._defs_by_name = {}
+        self._defs_cache_ts = 0
+
+    @contextmanager
+    def _conn(self, conn=None):
+        """Yield the caller's connection, or a pooled one that is returned afterwards"""
+        if conn is not None:
+            yield conn
+            return
         conn = self.pool.get_connection()
         try:
+            yield conn
+        finally:
+            self.pool.return_connection(conn)
+
+    def _load_kpi_definitions(self):
+        """Return active KPI definitions, re-querying once DEFINITIONS_CACHE_TTL has passed"""
+        if self._defs_cache is not None and time.monotonic() - self._defs_cache_ts < self.DEFINITIONS_CACHE_TTL:
+            return self._defs_cache
+
+        with self._conn() as conn:
             cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
             cursor.execute("""
                 SELECT * FROM kpi_definitions
@@ -29,740 +367,543 @@ class KPIManager:
             """)
             results = cursor.fetchall()
             cursor.close()
-            return results
-        finally:
-            self.pool.return_connection(conn)
+
+        self._defs_cache = results
+        self._defs_by_name = {row['kpi_name']: row for row in results}
+        self._defs_cache_ts = time.monotonic()
+        return results
+
+    def invalidate_kpi_cache(self):
+        """Drop cached KPI definitions so the next lookup re-reads kpi_definitions"""
+        self._defs_cache = None
+        self._defs_by_name = {}
+
+    def get_all_kpi_definitions(self):
+        """Get all active KPI definitions (cached for DEFINITIONS_CACHE_TTL seconds)"""
+        return list(self._load_kpi_definitions())
 
     def get_kpi_by_name(self, kpi_name):
-        """Get specific KPI definition"""
-        conn = self.pool.get_connection()
-        try:
-            cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
-            cursor.execute("""
-                SELECT * FROM kpi_definitions
-                WHERE kpi_name = %s AND is_active = TRUE
-            """, (kpi_name,))
-            result = cursor.fetchone()
-            cursor.close()
-            return result
-        finally:
-            self.pool.return_connection(conn)
+        """Get specific KPI definition (served from the definitions cache)"""
+        self._load_kpi_definitions()
+        return self._defs_by_name.get(kpi_name)
 
     def save_manual_data(self, kpi_name, measurement_period, data_field, data_value,
                         data_text=None, notes=None, entered_by=None):
         """Save manual data input for KPI calculation"""
-        conn = self.pool.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO kpi_manual_data
-                (kpi_name, measurement_period, data_field, data_value, data_text, notes, entered_by)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (kpi_name, measurement_period, data_field)
-                DO UPDATE SET
-                    data_value = EXCLUDED.data_value,
-                    data_text = EXCLUDED.data_text,
-                    notes = EXCLUDED.notes,
-                    entered_by = EXCLUDED.entered_by,
-                    entered_date = CURRENT_TIMESTAMP
-            """, (kpi_name, measurement_period, data_field, data_value, data_text, notes, entered_by))
-            conn.commit()
-            cursor.close()
-            return True
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            self.pool.return_connection(conn)
+        return self.save_manual_data_bulk(kpi_name, measurement_period,
+                                          [(data_field, data_value, data_text)],
+                                          entered_by=entered_by, notes=notes)
 
-    def get_manual_data(self, kpi_name, measurement_period):
-        """Get manual data for a specific KPI and period"""
-        conn = self.pool.get_connection()
-        try:
-            cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
-            cursor.execute("""
-                SELECT * FROM kpi_manual_data
-                WHERE kpi_name = %s AND measurement_period = %s
-                ORDER BY data_field
-            """, (kpi_name, measurement_period))
-            results = cursor.fetchall()
+    def save_manual_data_bulk(self, kpi_name, measurement_period, rows, entered_by=None, notes=None):
+        """Save several manual data fields for one KPI and period in one statement
+
+        rows is a list of (data_field, data_value, data_text) tuples.
+        """
+        with self._conn() as conn:
+            try:
+                cursor = conn.cursor()
+                extras.execute_values(cursor, MANUAL_DATA_UPSERT, [
+                    (kpi_name, measurement_period, data_field, data_value, data_text, notes, entered_by)
+                    for data_field, data_value, data_text in rows
+                ])
+                conn.commit()
+                cursor.close()
+                return True
+            except Exception as e:
+                conn.rollback()
+                raise e
+
+    def get_manual_data(self, kpi_name, measurement_period, conn=None, as_dict=False):
+        """Get manual data for a specific KPI and period
+
+        With as_dict=True a plain {data_field: value} dict is returned, taking
+        the numeric value where present and the text value otherwise. A numeric
+        value of 0 counts as absent, as it did when callers used
+        data_value or data_text, so formulas keep their defaults for it
+        (e.g. FR1 falls back to 1 hour worked rather than dividing by 0).
+        """
+        with self._conn(conn) as conn:
+            if as_dict:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT data_field, COALESCE(NULLIF(data_value, 0)::text, data_text)
+                    FROM kpi_manual_data
+                    WHERE kpi_name = %s AND measurement_period = %s
+                """, (kpi_name, measurement_period))
+                results = dict(cursor.fetchall())
+            else:
+                cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
+                cursor.execute("""
+                    SELECT * FROM kpi_manual_data
+                    WHERE kpi_name = %s AND measurement_period = %s
+                    ORDER BY data_field
+                """, (kpi_name, measurement_period))
+                results = cursor.fetchall()
             cursor.close()
             return results
-        finally:
-            self.pool.return_connection(conn)
 
     def save_kpi_result(self, kpi_name, measurement_period, calculated_value,
                        calculated_text=None, target_value=None, meets_criteria=None,
-                       calculated_by=None, notes=None):
-        """Save calculated KPI result"""
-        conn = self.pool.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO kpi_results
-                (kpi_name, measurement_period, calculated_value, calculated_text,
-                 target_value, meets_criteria, calculated_by, notes)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (kpi_name, measurement_period)
-                DO UPDATE SET
-                    calculated_value = EXCLUDED.calculated_value,
-                    calculated_text = EXCLUDED.calculated_text,
-                    target_value = EXCLUDED.target_value,
-                    meets_criteria = EXCLUDED.meets_criteria,
-                    calculated_by = EXCLUDED.calculated_by,
-                    notes = EXCLUDED.notes,
-                    calculation_date = CURRENT_TIMESTAMP
-            """, (kpi_name, measurement_period, calculated_value, calculated_text,
-                  target_value, meets_criteria, calculated_by, notes))
-            conn.commit()
-            cursor.close()
-            return True
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            self.pool.return_connection(conn)
+                       calculated_by=None, notes=None, conn=None):
+        """Save calculated KPI result (on the caller's connection if one is given)"""
+        with self._conn(conn) as conn:
+            try:
+                cursor = conn.cursor()
+                extras.execute_values(cursor, KPI_RESULT_UPSERT, [
+                    (kpi_name, measurement_period, calculated_value, calculated_text,
+                     target_value, meets_criteria, calculated_by, notes)
+                ])
+                conn.commit()
+                cursor.close()
+                return True
+            except Exception as e:
+                conn.rollback()
+                raise e
+
+    def _store_kpi_result(self, result_rows, conn, kpi_name, measurement_period, calculated_value,
+                          calculated_text, target_value, meets_criteria, calculated_by, notes):
+        """Save a calculated KPI result on conn now, or queue it on result_rows for a batched upsert"""
+        row = (kpi_name, measurement_period, calculated_value, calculated_text,
+               target_value, meets_criteria, calculated_by, notes)
+        if result_rows is None:
+            self.save_kpi_result(*row, conn=conn)
+        else:
+            result_rows.append(row)
 
     def get_kpi_results(self, measurement_period=None, kpi_name=None):
         """Get KPI results, optionally filtered by period and/or KPI name"""
-        conn = self.pool.get_connection()
-        try:
+        with self._conn() as conn:
             cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
 
-            query = """
+            # One fixed statement for every filter combination; a NULL filter
+            # matches all rows
+            cursor.execute("""
                 SELECT r.*, d.function_code, d.description, d.acceptance_criteria, d.frequency
                 FROM kpi_results r
                 JOIN kpi_definitions d ON r.kpi_name = d.kpi_name
-                WHERE 1=1
-            """
-            params = []
-
-            if measurement_period:
-                query += " AND r.measurement_period = %s"
-                params.append(measurement_period)
-
-            if kpi_name:
-                query += " AND r.kpi_name = %s"
-                params.append(kpi_name)
-
-            query += " ORDER BY d.function_code, r.kpi_name, r.measurement_period DESC"
-
-            cursor.execute(query, params)
+                WHERE (%s::text IS NULL OR r.measurement_period = %s)
+                  AND (%s::text IS NULL OR r.kpi_name = %s)
+                ORDER BY d.function_code, r.kpi_name, r.measurement_period DESC
+            """, (measurement_period or None, measurement_period or None,
+                  kpi_name or None, kpi_name or None))
             results = cursor.fetchall()
             cursor.close()
             return results
-        finally:
-            self.pool.return_connection(conn)
-
     # ==================== KPI CALCULATION METHODS ====================
 
-    def calculate_pm_adherence(self, measurement_period, username=None):
+    def calculate_pm_adherence(self, measurement_period, username=None, conn=None, result_rows=None):
         """
         Calculate Preventive Maintenance Adherence
         Formula: (number of WO completed / number of WO scheduled) x 100%
         Target: >95%
         """
-        conn = self.pool.get_connection()
-        try:
+        with self._conn(conn) as conn:
             cursor = conn.cursor()
 
-            # Parse period (format: YYYY-MM)
-            year, month = map(int, measurement_period.split('-'))
-            start_date = f"{year}-{month:02d}-01"
-            last_day = calendar.monthrange(year, month)[1]
-            end_date = f"{year}-{month:02d}-{last_day}"
+            start_date, next_month_start = _period_range(measurement_period)
 
-            # Count scheduled PMs
+            # Count scheduled and completed PMs in one round trip. The dates are
+            # stored as ISO 'YYYY-MM-DD' text, so they are compared as text (no cast)
+            # and the plain indexes on week_start_date / completion_date apply.
+            # Adherence is NULL when nothing was scheduled.
             cursor.execute("""
-                SELECT COUNT(*) FROM weekly_pm_schedules
-                WHERE week_start_date::date >= %s::date AND week_start_date::date <= %s::date
-            """, (start_date, end_date))
-            scheduled = cursor.fetchone()[0]
-
-            # Count completed PMs
-            cursor.execute("""
-                SELECT COUNT(*) FROM pm_completions
-                WHERE completion_date::date >= %s::date AND completion_date::date <= %s::date
-            """, (start_date, end_date))
-            completed = cursor.fetchone()[0]
+                SELECT scheduled, completed,
+                       ROUND(100.0 * completed / NULLIF(scheduled, 0), 2) AS adherence
+                FROM (SELECT
+                        (SELECT COUNT(*) FROM weekly_pm_schedules
+                         WHERE week_start_date >= %s AND week_start_date < %s) AS scheduled,
+                        (SELECT COUNT(*) FROM pm_completions
+                         WHERE completion_date >= %s AND completion_date < %s) AS completed) pm
+            """, (start_date, next_month_start, start_date, next_month_start))
+            scheduled, completed, adherence = cursor.fetchone()
 
             cursor.close()
 
-            # Calculate adherence
-            if scheduled > 0:
-                adherence = (completed / scheduled) * 100
-                meets_criteria = adherence >= 95
-            else:
-                adherence = 0
-                meets_criteria = None
-
-            # Save result
-            self.save_kpi_result(
-                kpi_name='Preventive Maintenance Adherence',
-                measurement_period=measurement_period,
-                calculated_value=round(adherence, 2),
-                calculated_text=f"{completed}/{scheduled} completed",
-                target_value=95,
-                meets_criteria=meets_criteria,
-                calculated_by=username,
-                notes=f"Scheduled: {scheduled}, Completed: {completed}"
-            )
-
-            return {
-                'value': round(adherence, 2),
-                'scheduled': scheduled,
-                'completed': completed,
-                'meets_criteria': meets_criteria
-            }
+            return self._record_pm_adherence(result_rows, conn, measurement_period,
+                                             scheduled, completed, adherence, username)
 
-        finally:
-            self.pool.return_connection(conn)
+    def _record_pm_adherence(self, result_rows, conn, measurement_period,
+                             scheduled, completed, adherence, username):
+        """Store the PM Adherence result for one period from its PM counts and
+        adherence percentage (None when nothing was scheduled).
 
-    def calculate_wo_opened_vs_closed(self, measurement_period, username=None):
+        The percentage is a Decimal already rounded to 2 places by Postgres, so
+        the target check is exact rather than subject to float rounding.
+        """
+        if adherence is not None:
+            meets_criteria = adherence >= Decimal('95')
+        else:
+            adherence = Decimal('0')
+            meets_criteria = None
+
+        # Save result
+        self._store_kpi_result(
+            result_rows,
+            conn,
+            kpi_name='Preventive Maintenance Adherence',
+            measurement_period=measurement_period,
+            calculated_value=adherence,
+            calculated_text=f"{completed}/{scheduled} completed",
+            target_value=95,
+            meets_criteria=meets_criteria,
+            calculated_by=username,
+            notes=f"Scheduled: {scheduled}, Completed: {completed}"
+        )
+
+        return {
+            'value': adherence,
+            'scheduled': scheduled,
+            'completed': completed,
+            'meets_criteria': meets_criteria
+        }
+
+    def calculate_wo_opened_vs_closed(self, measurement_period, username=None, conn=None, result_rows=None):
         """
         Calculate WO opened vs WO closed
         Formula: number of WO open vs number of WO closed
         Target: No >40 open WO
         """
-        conn = self.pool.get_connection()
-        try:
+        with self._conn(conn) as conn:
             cursor = conn.cursor()
 
-            # Parse period
-            year, month = map(int, measurement_period.split('-'))
-            start_date = f"{year}-{month:02d}-01"
-            last_day = calendar.monthrange(year, month)[1]
-            end_date = f"{year}-{month:02d}-{last_day}"
-
-            # Count opened CMs (CMs created in October)
-            cursor.execute("""
-                SELECT COUNT(*) FROM corrective_maintenance
-                WHERE created_date::date >= %s::date AND created_date::date <= %s::date
-            """, (start_date, end_date))
-            opened = cursor.fetchone()[0]
-
-            # Count closed CMs (CMs created in October that are now Closed/Completed)
-            cursor.execute("""
-                SELECT COUNT(*) FROM corrective_maintenance
-                WHERE created_date::date >= %s::date AND created_date::date <= %s::date
-                AND (status = 'Closed' OR status = 'Completed')
-            """, (start_date, end_date))
-            closed = cursor.fetchone()[0]
+            start_date, next_month_start = _period_range(measurement_period)
 
-            # Count currently open CMs (CMs created in October that are still Open)
+            # Count CMs created in the period: all of them (opened), those now
+            # Closed/Completed (closed) and those still Open - one scan of the range
             cursor.execute("""
-                SELECT COUNT(*) FROM corrective_maintenance
-                WHERE created_date::date >= %s::date AND created_date::date <= %s::date
-                AND status = 'Open'
-            """, (start_date, end_date))
-            currently_open = cursor.fetchone()[0]
+                SELECT COUNT(*) AS opened,
+                       COUNT(*) FILTER (WHERE status IN ('Closed', 'Completed')) AS closed,
+                       COUNT(*) FILTER (WHERE status = 'Open') AS currently_open
+                FROM corrective_maintenance
+                WHERE created_date >= %s::date AND created_date < %s::date
+            """, (start_date, next_month_start))
+            opened, closed, currently_open = cursor.fetchone()
 
             cursor.close()
 
-            meets_criteria = currently_open <= 40
-
-            # Save result
-            self.save_kpi_result(
-                kpi_name='WO opened vs WO closed',
-                measurement_period=measurement_period,
-                calculated_value=currently_open,
-                calculated_text=f"Opened: {opened}, Closed: {closed}, Currently Open: {currently_open}",
-                target_value=40,
-                meets_criteria=meets_criteria,
-                calculated_by=username,
-                notes=f"Opened: {opened}, Closed: {closed}"
-            )
-
-            return {
-                'opened': opened,
-                'closed': closed,
-                'currently_open': currently_open,
-                'meets_criteria': meets_criteria
-            }
-
-        finally:
-            self.pool.return_connection(conn)
+            return self._record_wo_opened_vs_closed(result_rows, conn, measurement_period,
+                                                    opened, closed, currently_open, username)
+
+    def _record_wo_opened_vs_closed(self, result_rows, conn, measurement_period,
+                                    opened, closed, currently_open, username):
+        """Store the WO opened vs WO closed result for one period from its CM counts"""
+        meets_criteria = currently_open <= 40
+
+        # Save result
+        self._store_kpi_result(
+            result_rows,
+            conn,
+            kpi_name='WO opened vs WO closed',
+            measurement_period=measurement_period,
+            calculated_value=currently_open,
+            calculated_text=f"Opened: {opened}, Closed: {closed}, Currently Open: {currently_open}",
+            target_value=40,
+            meets_criteria=meets_criteria,
+            calculated_by=username,
+            notes=f"Opened: {opened}, Closed: {closed}"
+        )
+
+        return {
+            'opened': opened,
+            'closed': closed,
+            'currently_open': currently_open,
+            'meets_criteria': meets_criteria
+        }
 
-    def calculate_wo_backlog(self, measurement_period, username=None):
+    def calculate_wo_backlog(self, measurement_period, username=None, conn=None, result_rows=None):
         """
         Calculate WO Backlog
         Formula: Total of WO open
         Target: <10% of the WO raised in a month
         """
-        conn = self.pool.get_connection()
-        try:
+        with self._conn(conn) as conn:
             cursor = conn.cursor()
 
-            # Parse period
-            year, month = map(int, measurement_period.split('-'))
-            start_date = f"{year}-{month:02d}-01"
-            last_day = calendar.monthrange(year, month)[1]
-            end_date = f"{year}-{month:02d}-{last_day}"
-
-            # Count WO raised this month (CMs created in this period)
-            cursor.execute("""
-                SELECT COUNT(*) FROM corrective_maintenance
-                WHERE created_date::date >= %s::date AND created_date::date <= %s::date
-            """, (start_date, end_date))
-            raised_this_month = cursor.fetchone()[0]
+            start_date, next_month_start = _period_range(measurement_period)
 
-            # Count open WO from this month (CMs created in this period that are still Open)
+            # Count WO raised this month and those of them still Open in one scan;
+            # the backlog percentage is NULL when none were raised
             cursor.execute("""
-                SELECT COUNT(*) FROM corrective_maintenance
-                WHERE created_date::date >= %s::date AND created_date::date <= %s::date
-                AND status = 'Open'
-            """, (start_date, end_date))
-            open_wo = cursor.fetchone()[0]
+                SELECT COUNT(*) AS raised,
+                       COUNT(*) FILTER (WHERE status = 'Open') AS open_wo,
+                       (100.0 * COUNT(*) FILTER (WHERE status = 'Open')
+                        / NULLIF(COUNT(*), 0))::float AS backlog_pct
+                FROM corrective_maintenance
+                WHERE created_date >= %s::date AND created_date < %s::date
+            """, (start_date, next_month_start))
+            raised_this_month, open_wo, backlog_pct = cursor.fetchone()
 
             cursor.close()
 
-            # Calculate percentage
-            if raised_this_month > 0:
-                backlog_pct = (open_wo / raised_this_month) * 100
-                meets_criteria = backlog_pct < 10
-            else:
-                backlog_pct = 0
-                meets_criteria = open_wo == 0
-
-            # Save result
-            self.save_kpi_result(
-                kpi_name='WO Backlog',
-                measurement_period=measurement_period,
-                calculated_value=open_wo,
-                calculated_text=f"{open_wo} open ({backlog_pct:.1f}% of {raised_this_month} raised)",
-                target_value=raised_this_month * 0.1 if raised_this_month > 0 else 0,
-                meets_criteria=meets_criteria,
-                calculated_by=username,
-                notes=f"Open: {open_wo}, Raised this month: {raised_this_month}"
-            )
-
-            return {
-                'open_wo': open_wo,
-                'raised_this_month': raised_this_month,
-                'backlog_pct': round(backlog_pct, 2),
-                'meets_criteria': meets_criteria
-            }
-
-        finally:
-            self.pool.return_connection(conn)
+            return self._record_wo_backlog(result_rows, conn, measurement_period,
+                                           raised_this_month, open_wo, backlog_pct, username)
+
+    def _record_wo_backlog(self, result_rows, conn, measurement_period,
+                           raised_this_month, open_wo, backlog_pct, username):
+        """Store the WO Backlog result for one period from its CM counts and
+        backlog percentage (None when no WO was raised)"""
+        if backlog_pct is not None:
+            meets_criteria = backlog_pct < 10
+        else:
+            backlog_pct = 0
+            meets_criteria = open_wo == 0
+
+        # Save result
+        self._store_kpi_result(
+            result_rows,
+            conn,
+            kpi_name='WO Backlog',
+            measurement_period=measurement_period,
+            calculated_value=open_wo,
+            calculated_text=f"{open_wo} open ({backlog_pct:.1f}% of {raised_this_month} raised)",
+            target_value=raised_this_month * 0.1 if raised_this_month > 0 else 0,
+            meets_criteria=meets_criteria,
+            calculated_by=username,
+            notes=f"Open: {open_wo}, Raised this month: {raised_this_month}"
+        )
+
+        return {
+            'open_wo': open_wo,
+            'raised_this_month': raised_this_month,
+            'backlog_pct': round(backlog_pct, 2),
+            'meets_criteria': meets_criteria
+        }
 
-    def calculate_wo_age_profile(self, measurement_period, username=None):
+    def calculate_wo_age_profile(self, measurement_period, username=None, conn=None, result_rows=None):
         """
         Calculate WO age profile
         Formula: Age of work order
         Target: Nb of WO to exceed 60 days
         """
-        conn = self.pool.get_connection()
-        try:
+        with self._conn(conn) as conn:
             cursor = conn.cursor()
 
-            # Get all open WOs (using status field)
+            # Age of open WOs (using status field), aggregated in the database.
+            # AVG skips rows without a created_date, as they have no age.
             cursor.execute("""
-                SELECT id, created_date
+                SELECT COUNT(*) AS total_open,
+                       COUNT(*) FILTER (WHERE CURRENT_DATE - created_date::date > 60) AS over_60,
+                       AVG(CURRENT_DATE - created_date::date)::float AS avg_age
                 FROM corrective_maintenance
                 WHERE status = 'Open'
             """)
-            open_wos = cursor.fetchall()
+            total_open, over_60_days, avg_age = cursor.fetchone()
 
             cursor.close()
 
-            # Calculate age for each
-            now = datetime.now().date()
-            over_60_days = 0
-            ages = []
-
-            for wo_id, created_date in open_wos:
-                if created_date:
-                    # Convert created_date to date object if it's not already
-                    if isinstance(created_date, str):
-                        try:
-                            created_date = datetime.strptime(created_date, '%Y-%m-%d').date()
-                        except:
-                            try:
-                                created_date = datetime.strptime(created_date, '%Y-%m-%d %H:%M:%S').date()
-                            except:
-                                continue
-                    elif isinstance(created_date, datetime):
-                        created_date = created_date.date()
-
-                    age = (now - created_date).days
-                    ages.append(age)
-                    if age > 60:
-                        over_60_days += 1
-
-            avg_age = sum(ages) / len(ages) if ages else 0
-            meets_criteria = over_60_days == 0
-
-            # Save result
-            self.save_kpi_result(
-                kpi_name='WO age profile',
-                measurement_period=measurement_period,
-                calculated_value=over_60_days,
-                calculated_text=f"{over_60_days} WOs over 60 days old (avg age: {avg_age:.1f} days)",
-                target_value=0,
-                meets_criteria=meets_criteria,
-                calculated_by=username,
-                notes=f"Total open WOs: {len(open_wos)}, Average age: {avg_age:.1f} days"
-            )
-
-            return {
-                'over_60_days': over_60_days,
-                'total_open': len(open_wos),
-                'avg_age': round(avg_age, 1),
-                'meets_criteria': meets_criteria
-            }
-
-        finally:
-            self.pool.return_connection(conn)
+            return self._record_wo_age_profile(result_rows, conn, measurement_period,
+                                               total_open, over_60_days, avg_age, username)
+
+    def _record_wo_age_profile(self, result_rows, conn, measurement_period,
+                               total_open, over_60_days, avg_age, username):
+        """Store the WO age profile result from the open WO age figures"""
+        avg_age = avg_age or 0
+        meets_criteria = over_60_days == 0
+
+        # Save result
+        self._store_kpi_result(
+            result_rows,
+            conn,
+            kpi_name='WO age profile',
+            measurement_period=measurement_period,
+            calculated_value=over_60_days,
+            calculated_text=f"{over_60_days} WOs over 60 days old (avg age: {avg_age:.1f} days)",
+            target_value=0,
+            meets_criteria=meets_criteria,
+            calculated_by=username,
+            notes=f"Total open WOs: {total_open}, Average age: {avg_age:.1f} days"
+        )
+
+        return {
+            'over_60_days': over_60_days,
+            'total_open': total_open,
+            'avg_age': round(avg_age, 1),
+            'meets_criteria': meets_criteria
+        }
 
     def calculate_all_auto_kpis(self, measurement_period, username=None):
         """Calculate all KPIs that can be auto-calculated from database"""
-        results = {}
+        keys = ('pm_adherence', 'wo_opened_closed', 'wo_backlog', 'wo_age_profile')
+        result_rows = []  # Saved together in one upsert once every KPI has run
+
+        start_date, next_month_start = _period_range(measurement_period)
+
+        with self._conn() as conn:
+            try:
+                logger.debug("Calculating auto KPIs for %s", measurement_period)
+                cursor = conn.cursor()
+
+                # Every count the four auto KPIs need, in a single round trip.
+                # Same filters as the individual calculate_* methods.
+                cursor.execute("""
+                    SELECT pm.scheduled, pm.completed,
+                           ROUND(100.0 * pm.completed / NULLIF(pm.scheduled, 0), 2) AS adherence,
+                           cm.opened, cm.closed, cm.currently_open,
+                           (100.0 * cm.currently_open / NULLIF(cm.opened, 0))::float AS backlog_pct,
+                           age.total_open, age.over_60, age.avg_age
+                    FROM (SELECT
+                            (SELECT COUNT(*) FROM weekly_pm_schedules
+                             WHERE week_start_date >= %s AND week_start_date < %s) AS scheduled,
+                            (SELECT COUNT(*) FROM pm_completions
+                             WHERE completion_date >= %s AND completion_date < %s) AS completed) pm,
+                         (SELECT COUNT(*) AS opened,
+                                 COUNT(*) FILTER (WHERE status IN ('Closed', 'Completed')) AS closed,
+                                 COUNT(*) FILTER (WHERE status = 'Open') AS currently_open
+                          FROM corrective_maintenance
+                          WHERE created_date >= %s::date AND created_date < %s::date) cm,
+                         (SELECT COUNT(*) AS total_open,
+                                 COUNT(*) FILTER (WHERE CURRENT_DATE - created_date::date > 60) AS over_60,
+                                 AVG(CURRENT_DATE - created_date::date)::float AS avg_age
+                          FROM corrective_maintenance
+                          WHERE status = 'Open') age
+                """, (start_date, next_month_start, start_date, next_month_start,
+                      start_date, next_month_start))
+                (scheduled, completed, adherence, opened, closed, currently_open, backlog_pct,
+                 total_open, over_60_days, avg_age) = cursor.fetchone()
+
+                results = {
+                    'pm_adherence': self._record_pm_adherence(
+                        result_rows, conn, measurement_period, scheduled, completed, adherence, username),
+                    'wo_opened_closed': self._record_wo_opened_vs_closed(
+                        result_rows, conn, measurement_period, opened, closed, currently_open, username),
+                    'wo_backlog': self._record_wo_backlog(
+                        result_rows, conn, measurement_period, opened, currently_open, backlog_pct, username),
+                    'wo_age_profile': self._record_wo_age_profile(
+                        result_rows, conn, measurement_period, total_open, over_60_days, avg_age, username),
+                }
+
+                extras.execute_values(cursor, KPI_RESULT_UPSERT, result_rows)
+                conn.commit()
+                cursor.close()
+            except Exception as e:
+                logger.exception("Auto KPI calculation failed for %s", measurement_period)
+                conn.rollback()
+                error = {'error': f"{str(e)}\n{traceback.format_exc()}"}
+                results = {key: error for key in keys}
 
-        try:
-            print(f"Calculating PM Adherence for {measurement_period}...")
-            results['pm_adherence'] = self.calculate_pm_adherence(measurement_period, username)
-            print("✓ PM Adherence calculated")
-        except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"✗ PM Adherence error: {error_msg}")
-            results['pm_adherence'] = {'error': error_msg}
-
-        try:
-            print(f"Calculating WO Opened vs Closed for {measurement_period}...")
-            results['wo_opened_closed'] = self.calculate_wo_opened_vs_closed(measurement_period, username)
-            print("✓ WO Opened vs Closed calculated")
-        except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"✗ WO Opened vs Closed error: {error_msg}")
-            results['wo_opened_closed'] = {'error': error_msg}
-
-        try:
-            print(f"Calculating WO Backlog for {measurement_period}...")
-            results['wo_backlog'] = self.calculate_wo_backlog(measurement_period, username)
-            print("✓ WO Backlog calculated")
-        except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"✗ WO Backlog error: {error_msg}")
-            results['wo_backlog'] = {'error': error_msg}
+        return results
 
-        try:
-            print(f"Calculating WO Age Profile for {measurement_period}...")
-            results['wo_age_profile'] = self.calculate_wo_age_profile(measurement_period, username)
-            print("✓ WO Age Profile calculated")
-        except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"✗ WO Age Profile error: {error_msg}")
-            results['wo_age_profile'] = {'error': error_msg}
+    def calculate_range(self, start_period, end_period, username=None):
+        """
+        Backfill the auto KPIs for every month from start_period to end_period
+        (inclusive, 'YYYY-MM'). Each source table is scanned once for the whole
+        range, grouped by month, and all results are saved in one upsert.
+        WO age profile is a snapshot of the WOs open today, so it is not backfilled.
+        """
+        periods = _periods_between(start_period, end_period)
+        if not periods:
+            return {}
+
+        range_start = _period_range(periods[0])[0]
+        range_end = _period_range(periods[-1])[1]
+        results = {period: {} for period in periods}
+        result_rows = []
+
+        with self._conn() as conn:
+            try:
+                cursor = conn.cursor()
+
+                # PM dates are ISO text, so the month is the first 7 characters.
+                # Adherence is rounded to 2 places by Postgres, as in calculate_pm_adherence
+                cursor.execute("""
+                    SELECT COALESCE(s.period, c.period), COALESCE(s.scheduled, 0), COALESCE(c.completed, 0),
+                           ROUND(100.0 * COALESCE(c.completed, 0) / NULLIF(s.scheduled, 0), 2)
+                    FROM (SELECT substr(week_start_date, 1, 7) AS period, COUNT(*) AS scheduled
+                          FROM weekly_pm_schedules
+                          WHERE week_start_date >= %s AND week_start_date < %s
+                          GROUP BY 1) s
+                    FULL OUTER JOIN
+                         (SELECT substr(completion_date, 1, 7) AS period, COUNT(*) AS completed
+                          FROM pm_completions
+                          WHERE completion_date >= %s AND completion_date < %s
+                          GROUP BY 1) c
+                    ON s.period = c.period
+                """, (range_start, range_end, range_start, range_end))
+                pm_counts = {period: (scheduled, completed, adherence)
+                             for period, scheduled, completed, adherence in cursor.fetchall()}
+
+                cursor.execute("""
+                    SELECT to_char(created_date, 'YYYY-MM') AS period,
+                           COUNT(*) AS opened,
+                           COUNT(*) FILTER (WHERE status IN ('Closed', 'Completed')) AS closed,
+                           COUNT(*) FILTER (WHERE status = 'Open') AS currently_open,
+                           (100.0 * COUNT(*) FILTER (WHERE status = 'Open') / COUNT(*))::float AS backlog_pct
+                    FROM corrective_maintenance
+                    WHERE created_date >= %s::date AND created_date < %s::date
+                    GROUP BY 1
+                """, (range_start, range_end))
+                cm_counts = {row[0]: row[1:] for row in cursor.fetchall()}
+
+                # Months without any rows are recorded as zero counts, as a
+                # single-period calculation would
+                for period in periods:
+                    scheduled, completed, adherence = pm_counts.get(period, (0, 0, None))
+                    opened, closed, currently_open, backlog_pct = cm_counts.get(period, (0, 0, 0, None))
+                    results[period]['pm_adherence'] = self._record_pm_adherence(
+                        result_rows, conn, period, scheduled, completed, adherence, username)
+                    results[period]['wo_opened_closed'] = self._record_wo_opened_vs_closed(
+                        result_rows, conn, period, opened, closed, currently_open, username)
+                    results[period]['wo_backlog'] = self._record_wo_backlog(
+                        result_rows, conn, period, opened, currently_open, backlog_pct, username)
+
+                extras.execute_values(cursor, KPI_RESULT_UPSERT, result_rows, page_size=500)
+                conn.commit()
+                cursor.close()
+            except Exception:
+                conn.rollback()
+                raise
 
         return results
 
     def get_kpis_needing_manual_data(self):
         """Get list of all 17 KPIs that require manual data input"""
-        return [
-            'FR1',
-            'Near Miss',
-            'TTR (Time to Repair) Adherence',
-            'MTBF Mean Time Between Failure',
-            'Technical Availability Adherence',
-            'MRT (Mean Response Time)',
-            'WO opened vs WO closed',
-            'WO Backlog',
-            'WO age profile',
-            'Preventive Maintenance Adherence',
-            'Top Breakdown',
-            'Purchaser Monthly process Confirmation',
-            'Purchaser satisfaction',
-            'Non Conformances raised',
-            'Non Conformances closed',
-            'Mean Time to Deliver a Quote',
-            'Purchaser Satisfaction Survey'
-        ]
+        return MANUAL_KPI_NAMES
 
     def get_required_fields_for_kpi(self, kpi_name):
         """Get required manual input fields for a specific KPI"""
-        fields = {
-            'FR1': [
-                {'field': 'accident_count', 'label': 'Number of Accidents (sick leave > 24h)', 'type': 'number'},
-                {'field': 'hours_worked', 'label': 'Number of Hours Worked', 'type': 'number'}
-            ],
-            'Near Miss': [
-                {'field': 'near_miss_count', 'label': 'Number of Near Miss Reports', 'type': 'number'}
-            ],
-            'TTR (Time to Repair) Adherence': [
-                {'field': 'p1_within_target', 'label': 'P1 Assets Fixed Within 2 Hours', 'type': 'number'},
-                {'field': 'p1_total', 'label': 'Total P1 Asset Failures', 'type': 'number'},
-                {'field': 'p2_within_target', 'label': 'P2 Assets Fixed Within 4 Hours', 'type': 'number'},
-                {'field': 'p2_total', 'label': 'Total P2 Asset Failures', 'type': 'number'}
-            ],
-            'MTBF Mean Time Between Failure': [
-                {'field': 'p1_operating_hours', 'label': 'P1 Assets Total Operating Hours', 'type': 'number'},
-                {'field': 'p1_failure_count', 'label': 'P1 Assets Failure Count', 'type': 'number'},
-                {'field': 'p2_operating_hours', 'label': 'P2 Assets Total Operating Hours', 'type': 'number'},
-                {'field': 'p2_failure_count', 'label': 'P2 Assets Failure Count', 'type': 'number'}
-            ],
-            'Technical Availability Adherence': [
-                {'field': 'p1_assets_meeting_target', 'label': 'P1 Assets Meeting >95% Availability', 'type': 'number'},
-                {'field': 'p1_total_assets', 'label': 'Total P1 Assets', 'type': 'number'}
-            ],
-            'MRT (Mean Response Time)': [
-                {'field': 'total_response_time_minutes', 'label': 'Total Response Time (minutes)', 'type': 'number'},
-                {'field': 'wo_count', 'label': 'Number of Work Orders', 'type': 'number'}
-            ],
-            'WO opened vs WO closed': [
-                {'field': 'wo_opened', 'label': 'Number of Work Orders Opened', 'type': 'number'},
-                {'field': 'wo_closed', 'label': 'Number of Work Orders Closed', 'type': 'number'},
-                {'field': 'wo_currently_open', 'label': 'Number of Work Orders Currently Open', 'type': 'number'}
-            ],
-            'WO Backlog': [
-                {'field': 'wo_raised_this_month', 'label': 'Work Orders Raised This Month', 'type': 'number'},
-                {'field': 'wo_open', 'label': 'Work Orders Still Open', 'type': 'number'}
-            ],
-            'WO age profile': [
-                {'field': 'wo_over_60_days', 'label': 'Work Orders Over 60 Days Old', 'type': 'number'},
-                {'field': 'total_open_wo', 'label': 'Total Open Work Orders', 'type': 'number'},
-                {'field': 'avg_age_days', 'label': 'Average Age of Open WOs (days)', 'type': 'number'}
-            ],
-            'Preventive Maintenance Adherence': [
-                {'field': 'pm_scheduled', 'label': 'PM Work Orders Scheduled', 'type': 'number'},
-                {'field': 'pm_completed', 'label': 'PM Work Orders Completed', 'type': 'number'}
-            ],
-            'Non Conformances raised': [
-                {'field': 'nc_count', 'label': 'Number of Non-Conformances Raised', 'type': 'number'}
-            ],
-            'Non Conformances closed': [
-                {'field': 'nc_closed_on_time', 'label': 'Non-Conformances Closed On Time', 'type': 'number'},
-                {'field': 'nc_total', 'label': 'Total Non-Conformances Due', 'type': 'number'}
-            ],
-            'Mean Time to Deliver a Quote': [
-                {'field': 'total_quote_time_hours', 'label': 'Total Quote Delivery Time (hours)', 'type': 'number'},
-                {'field': 'quote_count', 'label': 'Number of Quotes Requested', 'type': 'number'}
-            ],
-            'Purchaser satisfaction': [
-                {'field': 'satisfaction_score', 'label': 'Satisfaction Score (%)', 'type': 'number'}
-            ],
-            'Purchaser Satisfaction Survey': [
-                {'field': 'survey_score', 'label': 'Yearly Satisfaction Survey Score (%)', 'type': 'number'}
-            ],
-            'Top Breakdown': [
-                {'field': 'breakdown_analysis', 'label': 'Breakdown Analysis (Pareto)', 'type': 'text'}
-            ],
-            'Purchaser Monthly process Confirmation': [
-                {'field': 'confirmation_score', 'label': 'Confirmation Score (%)', 'type': 'number'}
-            ]
-        }
-        return fields.get(kpi_name, [])
+        return _KPI_REQUIRED_FIELDS.get(kpi_name, ())
 
     def calculate_manual_kpi(self, kpi_name, measurement_period, username=None):
         """Calculate KPI from manual input data"""
         try:
-            print(f"Calculating manual KPI: {kpi_name} for {measurement_period}...")
-            manual_data = self.get_manual_data(kpi_name, measurement_period)
-
-            if not manual_data:
-                print(f"✗ No manual data found for {kpi_name}")
-                return {'error': 'No manual data entered for this period'}
-
-            print(f"Found {len(manual_data)} data fields for {kpi_name}")
-
-            # Convert to dict for easier access
-            data_dict = {row['data_field']: row['data_value'] or row['data_text'] for row in manual_data}
-            print(f"Data fields: {list(data_dict.keys())}")
-            print(f"Data values: {data_dict}")
-
-            result = None
-            meets_criteria = None
-            calculated_text = None
-
-            # Calculate based on KPI type
-            if kpi_name == 'FR1':
-                accidents = float(data_dict.get('accident_count') or 0)
-                hours = float(data_dict.get('hours_worked') or 1)
-                if hours > 0:
-                    result = (accidents / hours) * 1_000_000
-                    meets_criteria = result == 0
-                    calculated_text = f"{accidents} accidents per {hours:,.0f} hours worked"
-
-            elif kpi_name == 'Near Miss':
-                result = float(data_dict.get('near_miss_count') or 0)
-                calculated_text = f"{int(result)} near miss reports"
-                meets_criteria = None  # No specific target
-
-            elif kpi_name == 'TTR (Time to Repair) Adherence':
-                p1_within = float(data_dict.get('p1_within_target') or 0)
-                p1_total = float(data_dict.get('p1_total') or 0)
-                p2_within = float(data_dict.get('p2_within_target') or 0)
-                p2_total = float(data_dict.get('p2_total') or 0)
-
-                # Calculate combined adherence for P1 and P2
-                total_within = p1_within + p2_within
-                total_failures = p1_total + p2_total
-
-                if total_failures > 0:
-                    result = (total_within / total_failures) * 100
-                    meets_criteria = result >= 95
-                    calculated_text = f"P1: {p1_within}/{p1_total}, P2: {p2_within}/{p2_total} within target ({result:.1f}%)"
-                else:
-                    # No failures means perfect adherence (100%)
-                    result = 100.0
-                    meets_criteria = True
-                    calculated_text = "No P1 or P2 failures - 100% adherence"
-
-            elif kpi_name == 'MTBF Mean Time Between Failure':
-                p1_hours = float(data_dict.get('p1_operating_hours') or 0)
-                p1_failures = float(data_dict.get('p1_failure_count') or 0)
-                if p1_failures > 0:
-                    result = p1_hours / p1_failures
-                    meets_criteria = result > 80
-                    calculated_text = f"{result:.1f} hours between failures (P1 assets)"
-                else:
-                    # No failures - cannot calculate MTBF
-                    result = None
-                    meets_criteria = None
-                    calculated_text = "No failures recorded - MTBF N/A"
-
-            elif kpi_name == 'Technical Availability Adherence':
-                meeting = float(data_dict.get('p1_assets_meeting_target') or 0)
-                total = float(data_dict.get('p1_total_assets') or 0)
-                if total > 0:
-                    result = (meeting / total) * 100
-                    meets_criteria = result >= 95
-                    calculated_text = f"{meeting}/{total} P1 assets meeting >95% availability"
-                else:
-                    # No assets to measure
-                    result = None
-                    meets_criteria = None
-                    calculated_text = "No P1 assets to measure - N/A"
-
-            elif kpi_name == 'MRT (Mean Response Time)':
-                total_time = float(data_dict.get('total_response_time_minutes') or 0)
-                wo_count = float(data_dict.get('wo_count') or 0)
-                if wo_count > 0:
-                    result = total_time / wo_count
-                    meets_criteria = result <= 15  # P1 target
-                    calculated_text = f"{result:.1f} minutes average response time"
-                else:
-                    # No work orders to measure
-                    result = None
-                    meets_criteria = None
-                    calculated_text = "No work orders - MRT N/A"
-
-            elif kpi_name == 'Non Conformances raised':
-                result = float(data_dict.get('nc_count') or 0)
-                meets_criteria = result == 0
-                calculated_text = f"{int(result)} non-conformances raised"
-
-            elif kpi_name == 'Non Conformances closed':
-                closed = float(data_dict.get('nc_closed_on_time') or 0)
-                total = float(data_dict.get('nc_total') or 0)
-                if total > 0:
-                    result = (closed / total) * 100
-                    meets_criteria = result == 100
-                    calculated_text = f"{closed}/{total} closed on time"
-                else:
-                    # No non-conformances means 100% compliance
-                    result = 100.0
-                    meets_criteria = True
-                    calculated_text = "No non-conformances - 100% compliance"
-
-            elif kpi_name == 'Mean Time to Deliver a Quote':
-                total_hours = float(data_dict.get('total_quote_time_hours') or 0)
-                quote_count = float(data_dict.get('quote_count') or 0)
-                if quote_count > 0:
-                    result = total_hours / quote_count
-                    meets_criteria = result <= 48
-                    calculated_text = f"{result:.1f} hours average delivery time"
-                else:
-                    # No quotes to measure
-                    result = None
-                    meets_criteria = None
-                    calculated_text = "No quotes delivered - N/A"
-
-            elif kpi_name == 'Purchaser satisfaction':
-                result = float(data_dict.get('satisfaction_score') or 0)
-                meets_criteria = result >= 90
-                calculated_text = f"{result}% satisfaction score"
-
-            elif kpi_name == 'Purchaser Monthly process Confirmation':
-                result = float(data_dict.get('confirmation_score') or 0)
-                meets_criteria = result >= 90
-                calculated_text = f"{result}% confirmation score"
-
-            elif kpi_name == 'Top Breakdown':
-                calculated_text = data_dict.get('breakdown_analysis') or 'N/A'
-                result = None
-
-            elif kpi_name == 'WO opened vs WO closed':
-                opened = float(data_dict.get('wo_opened') or 0)
-                closed = float(data_dict.get('wo_closed') or 0)
-                currently_open = float(data_dict.get('wo_currently_open') or 0)
-                result = currently_open
-                meets_criteria = currently_open <= 40
-                calculated_text = f"Opened: {int(opened)}, Closed: {int(closed)}, Currently Open: {int(currently_open)}"
-
-            elif kpi_name == 'WO Backlog':
-                raised = float(data_dict.get('wo_raised_this_month') or 0)
-                open_wo = float(data_dict.get('wo_open') or 0)
-                if raised > 0:
-                    backlog_pct = (open_wo / raised) * 100
-                    result = open_wo
-                    meets_criteria = backlog_pct < 10
-                    calculated_text = f"{int(open_wo)} open ({backlog_pct:.1f}% of {int(raised)} raised)"
-                else:
-                    result = open_wo
-                    meets_criteria = open_wo == 0
-                    calculated_text = f"{int(open_wo)} open (no WOs raised this month)"
-
-            elif kpi_name == 'WO age profile':
-                over_60 = float(data_dict.get('wo_over_60_days') or 0)
-                total_open = float(data_dict.get('total_open_wo') or 0)
-                avg_age = float(data_dict.get('avg_age_days') or 0)
-                result = over_60
-                meets_criteria = over_60 == 0
-                calculated_text = f"{int(over_60)} WOs over 60 days old (avg age: {avg_age:.1f} days)"
-
-            elif kpi_name == 'Preventive Maintenance Adherence':
-                scheduled = float(data_dict.get('pm_scheduled') or 0)
-                completed = float(data_dict.get('pm_completed') or 0)
-                if scheduled > 0:
-                    result = (completed / scheduled) * 100
-                    meets_criteria = result >= 95
-                    calculated_text = f"{int(completed)}/{int(scheduled)} completed ({result:.1f}%)"
+            # Read the manual data and save the result on one pooled connection
+            with self._conn() as conn:
+                logger.debug("Calculating manual KPI %s for %s", kpi_name, measurement_period)
+                data_dict = self.get_manual_data(kpi_name, measurement_period,
+                                                 conn=conn, as_dict=True)
+
+                if not data_dict:
+                    logger.debug("No manual data found for %s", kpi_name)
+                    return {'error': 'No manual data entered for this period'}
+
+                logger.debug("Manual data for %s: %s", kpi_name, data_dict)
+
+                # Calculate based on KPI type
+                handler = _MANUAL_HANDLERS.get(kpi_name)
+                if handler:
+                    result, meets_criteria, calculated_text = handler(data_dict)
                 else:
-                    result = 0
-                    meets_criteria = None
-                    calculated_text = "No PM scheduled"
-
-            elif kpi_name == 'Purchaser Satisfaction Survey':
-                result = float(data_dict.get('survey_score') or 0)
-                meets_criteria = result >= 90
-                calculated_text = f"{result}% satisfaction score"
-
-            # Save the result
-            if result is not None or calculated_text:
-                print(f"Saving KPI result: {kpi_name} = {result or calculated_text}")
-                self.save_kpi_result(
-                    kpi_name=kpi_name,
-                    measurement_period=measurement_period,
-                    calculated_value=result,
-                    calculated_text=calculated_text,
-                    meets_criteria=meets_criteria,
-                    calculated_by=username
-                )
-                print(f"✓ {kpi_name} calculated successfully")
-
-            return {
-                'value': result,
-                'text': calculated_text,
-                'meets_criteria': meets_criteria
-            }
+                    result = meets_criteria = calculated_text = None
+
+                # Save the result
+                if result is not None or calculated_text:
+                    logger.debug("Saving KPI result %s = %s", kpi_name, result or calculated_text)
+                    self.save_kpi_result(
+                        kpi_name=kpi_name,
+                        measurement_period=measurement_period,
+                        calculated_value=result,
+                        calculated_text=calculated_text,
+                        meets_criteria=meets_criteria,
+                        calculated_by=username,
+                        conn=conn
+                    )
+
+                return {
+                    'value': result,
+                    'text': calculated_text,
+                    'meets_criteria': meets_criteria
+                }
 
         except Exception as e:
-            import traceback
-            error_msg = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"✗ Error calculating {kpi_name}: {error_msg}")
-            return {'error': error_msg}
+            logger.exception("Error calculating %s for %s", kpi_name, measurement_period)
+            return {'error': f"{str(e)}\n{traceback.format_exc()}"}
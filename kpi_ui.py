@@ -8,6 +8,7 @@ from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from kpi_manager import KPIManager
 from datetime import datetime
+import time
 import traceback
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
@@ -15,8 +16,17 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from xml.sax.saxutils import escape as xml_escape
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
+
+try:
+    import xlsxwriter
+except ImportError:  # xlsxwriter is optional - the openpyxl writer is used instead
+    xlsxwriter = None
 
 # Matplotlib imports for chart generation
 import matplotlib
@@ -26,9 +36,218 @@ from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 
+# Summary card stylesheets, built once at import
+_CARD_STYLE = """
+    QLabel {{
+        background-color: {color};
+        color: white;
+        padding: 20px;
+        border-radius: 10px;
+        font-size: 16pt;
+        font-weight: bold;
+        text-align: center;
+    }}
+"""
+_CARD_STYLE_BLUE = _CARD_STYLE.format(color="#3498db")
+_CARD_STYLE_GREEN = _CARD_STYLE.format(color="#27ae60")
+_CARD_STYLE_RED = _CARD_STYLE.format(color="#e74c3c")
+_CARD_STYLE_ORANGE = _CARD_STYLE.format(color="#f39c12")
+
+
+def count_pass_fail(results):
+    """Count passing and failing KPI results in one pass over the list"""
+    passing = failing = 0
+    for result in results:
+        meets = result.get('meets_criteria')
+        if meets is True:
+            passing += 1
+        elif meets is False:
+            failing += 1
+    return passing, failing
+
+
+# PDF report styles - static, so built once at import rather than per export
+_PDF_STYLES = getSampleStyleSheet()
+_PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_PDF_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#2c3e50'),
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+_PDF_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+_PDF_KPI_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+_PDF_KPI_COL_WIDTHS = [0.8*inch, 2.2*inch, 1.8*inch, 1.8*inch, 0.8*inch]
+_PDF_CELL_PADDING = 12  # default left + right padding of a table cell
+
+
+def _pdf_cell(text, width):
+    """Table cell for text: a plain string when it fits on one line, otherwise
+    a wrapping Paragraph (plain strings are much cheaper for reportlab to lay out)"""
+    text = str(text or '')
+    normal = _PDF_STYLES['Normal']
+    if stringWidth(text, normal.fontName, normal.fontSize) <= width - _PDF_CELL_PADDING:
+        return text
+    # Paragraph text is markup, so escape any literal <, > and &
+    return Paragraph(xml_escape(text), normal)
+
+
+# Excel report layout, shared by both Excel writers
+EXCEL_HEADERS = ['Function', 'KPI Name', 'Value', 'Target', 'Status', 'Calculated Date', 'Notes']
+EXCEL_COLUMN_WIDTHS = [12, 35, 30, 30, 10, 18, 40]
+EXCEL_STATUS_COLORS = {"PASS": "D5F4E6", "FAIL": "FADBD8", "N/A": "F9E79F"}
+EXCEL_STATUS_COLUMN = 4  # 0-based index of the Status column
+
+# openpyxl styles for the Excel report, created once rather than per export
+_XL_TITLE_FONT = Font(bold=True, size=16)
+_XL_HEADER_FILL = PatternFill(start_color="3498DB", end_color="3498DB", fill_type="solid")
+_XL_HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+_XL_BOLD_FONT = Font(bold=True)
+_XL_CENTER = Alignment(horizontal='center')
+_XL_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_XL_STATUS_FILLS = {
+    status: PatternFill(start_color=color, end_color=color, fill_type="solid")
+    for status, color in EXCEL_STATUS_COLORS.items()
+}
+
+
+class KPIFetchSignals(QObject):
+    """Signals emitted by KPIFetchWorker back to the UI thread"""
+    resultsReady = pyqtSignal(str, list, int)
+    failed = pyqtSignal(str, str)
+
+
+class KPIFetchWorker(QRunnable):
+    """Load the KPI results for a period on a QThreadPool thread"""
+
+    def __init__(self, kpi_manager, period, generation):
+        super().__init__()
+        self.kpi_manager = kpi_manager
+        self.period = period
+        self.generation = generation  # the period's cache generation when the load started
+        self.signals = KPIFetchSignals()
+
+    def run(self):
+        try:
+            results = list(self.kpi_manager.get_kpi_results(self.period))
+        except Exception as e:
+            self.signals.failed.emit(self.period, f"{str(e)}\n\n{traceback.format_exc()}")
+        else:
+            self.signals.resultsReady.emit(self.period, results, self.generation)
+
+
+class KPIResultsModel(QAbstractTableModel):
+    """Table model for the overview tab, backed by the list of KPI results"""
+
+    HEADERS = ["Function", "KPI Name", "Value", "Target", "Status", "Date", "Notes"]
+    STATUS_COLUMN = 4
+
+    # meets_criteria -> (status text, background, foreground)
+    STATUS_STYLES = {
+        True: ("✓ PASS", "#d5f4e6", "#27ae60"),
+        False: ("✗ FAIL", "#fadbd8", "#e74c3c"),
+        None: ("N/A", "#f9e79f", None),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._status = []
+        self._status_font = QFont("Arial", 10, QFont.Bold)
+        self._status_brushes = {
+            meets: (QBrush(QColor(bg)), QBrush(QColor(fg)) if fg else None)
+            for meets, (_, bg, fg) in self.STATUS_STYLES.items()
+        }
+
+    def set_results(self, results):
+        """Replace the table contents with a new list of KPI results"""
+        self.beginResetModel()
+        self._rows = []
+        self._status = []
+        for result in results:
+            meets = result.get('meets_criteria')
+            if meets not in (True, False):
+                meets = None
+
+            value_text = result.get('calculated_text') or (
+                f"{result['calculated_value']:.2f}" if result.get('calculated_value') is not None else 'N/A'
+            )
+            calc_date = result.get('calculation_date')
+            date_str = calc_date.strftime('%Y-%m-%d %H:%M') if calc_date else ''
+
+            self._rows.append((
+                result.get('function_code') or '',
+                result.get('kpi_name') or '',
+                value_text,
+                result.get('acceptance_criteria') or '',
+                self.STATUS_STYLES[meets][0],
+                date_str,
+                result.get('notes') or '',
+            ))
+            self._status.append(meets)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self._rows[row][col]
+
+        # Only the status column is colored
+        if col == self.STATUS_COLUMN:
+            if role == Qt.BackgroundRole:
+                return self._status_brushes[self._status[row]][0]
+            if role == Qt.ForegroundRole:
+                return self._status_brushes[self._status[row]][1]
+            if role == Qt.FontRole:
+                return self._status_font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
 class KPIDashboard(QWidget):
     """Professional KPI Dashboard with Manual Data Entry and Chart Generation"""
 
+    # Seconds a period's loaded KPI results are reused before re-querying
+    RESULTS_CACHE_TTL = 30
+
     def __init__(self, pool, current_user, parent=None):
         super().__init__(parent)
         self.pool = pool
@@ -36,6 +255,9 @@ class KPIDashboard(QWidget):
         self.kpi_manager = KPIManager(pool)
         self.current_period = datetime.now().strftime('%Y-%m')
         self.chart_canvas = None
+        self._results_cache = {}  # period -> (load time, KPI results)
+        self._results_generation = {}  # period -> bumped each time its results are invalidated
+        self._dashboard_dirty = False  # a refresh was skipped while the overview was hidden
         self.init_ui()
 
     def init_ui(self):
@@ -100,11 +322,11 @@ class KPIDashboard(QWidget):
 
         controls_layout.addStretch()
 
-        refresh_btn = QPushButton("🔄 Refresh Dashboard")
-        refresh_btn.setStyleSheet(self.get_button_style("#95a5a6"))
-        refresh_btn.clicked.connect(self.refresh_dashboard)
-        refresh_btn.setMinimumHeight(40)
-        controls_layout.addWidget(refresh_btn)
+        self.refresh_btn = QPushButton("🔄 Refresh Dashboard")
+        self.refresh_btn.setStyleSheet(self.get_button_style("#95a5a6"))
+        self.refresh_btn.clicked.connect(lambda: self.refresh_dashboard(force=True))
+        self.refresh_btn.setMinimumHeight(40)
+        controls_layout.addWidget(self.refresh_btn)
 
         controls_widget.setLayout(controls_layout)
         main_layout.addWidget(controls_widget)
@@ -132,21 +354,60 @@ class KPIDashboard(QWidget):
             }
         """)
 
-        # Tab 1: Data Entry & Visualization
+        # Tab 1: Data Entry & Visualization (shown first, so built now)
         self.entry_tab = self.create_data_entry_tab()
         tab_widget.addTab(self.entry_tab, "📝 Data Entry & Charts")
 
-        # Tab 2: Overview Dashboard
-        self.overview_tab = self.create_overview_tab()
-        tab_widget.addTab(self.overview_tab, "📊 KPI Overview")
-
-        # Tab 3: Export Reports
-        self.export_tab = self.create_export_tab()
-        tab_widget.addTab(self.export_tab, "📄 Export Reports")
+        # Tabs 2 and 3 start as placeholders and are built on first visit
+        # (see _on_tab_shown); the overview loads its results at that point
+        self.overview_tab = None
+        self.export_tab = None
+        self._lazy_tabs = {
+            1: ('overview_tab', self.create_overview_tab, "📊 KPI Overview"),
+            2: ('export_tab', self.create_export_tab, "📄 Export Reports"),
+        }
+        for index in sorted(self._lazy_tabs):
+            tab_widget.addTab(QWidget(), self._lazy_tabs[index][2])
+        tab_widget.currentChanged.connect(self._on_tab_shown)
+        tab_widget.currentChanged.connect(self._on_overview_maybe_shown)
+        self.tab_widget = tab_widget
 
         main_layout.addWidget(tab_widget)
         self.setLayout(main_layout)
-        self.refresh_dashboard()
+
+    def _on_tab_shown(self, index):
+        """Build a lazily created tab the first time it is shown"""
+        lazy = self._lazy_tabs.pop(index, None)
+        if lazy is None:
+            return
+
+        attr, builder, title = lazy
+        widget = builder()
+        setattr(self, attr, widget)
+
+        # Swap the placeholder for the real tab without re-entering this slot
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        if attr == 'overview_tab':
+            self.refresh_dashboard()
+
+    def _on_overview_maybe_shown(self, index):
+        """Run a refresh that was deferred while the overview was hidden"""
+        if self._dashboard_dirty and self.tab_widget.widget(index) is self.overview_tab:
+            self.refresh_dashboard()
+
+    def showEvent(self, event):
+        """Catch up on a deferred dashboard refresh when the widget is shown"""
+        super().showEvent(event)
+        if self._dashboard_dirty:
+            # Let the children become visible before checking the overview
+            QTimer.singleShot(0, self.refresh_dashboard)
 
     def get_button_style(self, color):
         """Get professional button style"""
@@ -316,34 +577,35 @@ class KPIDashboard(QWidget):
         summary_layout = QHBoxLayout()
 
         self.total_kpis_label = QLabel("Total KPIs\n0/17")
-        self.total_kpis_label.setStyleSheet(self.get_card_style("#3498db"))
+        self.total_kpis_label.setStyleSheet(_CARD_STYLE_BLUE)
         summary_layout.addWidget(self.total_kpis_label)
 
         self.passing_kpis_label = QLabel("✓ Passing\n0")
-        self.passing_kpis_label.setStyleSheet(self.get_card_style("#27ae60"))
+        self.passing_kpis_label.setStyleSheet(_CARD_STYLE_GREEN)
         summary_layout.addWidget(self.passing_kpis_label)
 
         self.failing_kpis_label = QLabel("✗ Failing\n0")
-        self.failing_kpis_label.setStyleSheet(self.get_card_style("#e74c3c"))
+        self.failing_kpis_label.setStyleSheet(_CARD_STYLE_RED)
         summary_layout.addWidget(self.failing_kpis_label)
 
         self.pending_kpis_label = QLabel("⏳ Pending\n17")
-        self.pending_kpis_label.setStyleSheet(self.get_card_style("#f39c12"))
+        self.pending_kpis_label.setStyleSheet(_CARD_STYLE_ORANGE)
         summary_layout.addWidget(self.pending_kpis_label)
 
         layout.addLayout(summary_layout)
 
         # KPI Results Table
-        self.overview_table = QTableWidget()
-        self.overview_table.setColumnCount(7)
-        self.overview_table.setHorizontalHeaderLabels([
-            "Function", "KPI Name", "Value", "Target", "Status", "Date", "Notes"
-        ])
+        self.overview_model = KPIResultsModel(self)
+        self.overview_table = QTableView()
+        self.overview_table.setModel(self.overview_model)
         self.overview_table.horizontalHeader().setStretchLastSection(True)
         self.overview_table.setAlternatingRowColors(True)
-        self.overview_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.overview_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Fixed column widths, set once (the last column stretches)
+        for col, width in enumerate([80, 260, 220, 180, 90, 130]):
+            self.overview_table.setColumnWidth(col, width)
         self.overview_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #bdc3c7;
                 font-size: 10pt;
             }
@@ -413,36 +675,18 @@ class KPIDashboard(QWidget):
         widget.setLayout(layout)
         return widget
 
-    def get_card_style(self, color):
-        """Get style for summary cards"""
-        return f"""
-            QLabel {{
-                background-color: {color};
-                color: white;
-                padding: 20px;
-                border-radius: 10px;
-                font-size: 16pt;
-                font-weight: bold;
-                text-align: center;
-            }}
-        """
-
     def populate_periods(self):
         """Populate period dropdown with last 12 months"""
-        self.period_combo.clear()
         current = datetime.now()
+        current_index = current.year * 12 + current.month - 1  # months since year 0
+        months = [divmod(current_index - i, 12) for i in range(12)]
 
-        for i in range(12):
-            month = current.month - i
-            year = current.year
-
-            while month < 1:
-                month += 12
-                year -= 1
-
-            period = f"{year}-{month:02d}"
-            display = datetime(year, month, 1).strftime("%B %Y")
-            self.period_combo.addItem(display, period)
+        # No change signals while the list is rebuilt
+        with QSignalBlocker(self.period_combo):
+            self.period_combo.clear()
+            for year, month0 in months:
+                self.period_combo.addItem(datetime(year, month0 + 1, 1).strftime("%B %Y"),
+                                          f"{year}-{month0 + 1:02d}")
 
     def on_period_changed(self, text):
         """Handle period selection change"""
@@ -454,12 +698,14 @@ class KPIDashboard(QWidget):
 
     def populate_kpi_selector(self):
         """Populate KPI selector with ALL 17 KPIs"""
-        self.kpi_selector.clear()
-        self.kpi_selector.addItem("-- Select a KPI --", None)
+        # No change signals while the list is rebuilt
+        with QSignalBlocker(self.kpi_selector):
+            self.kpi_selector.clear()
+            self.kpi_selector.addItem("-- Select a KPI --", None)
 
-        all_kpis = self.kpi_manager.get_kpis_needing_manual_data()
-        for kpi_name in all_kpis:
-            self.kpi_selector.addItem(kpi_name, kpi_name)
+            all_kpis = self.kpi_manager.get_kpis_needing_manual_data()
+            for kpi_name in all_kpis:
+                self.kpi_selector.addItem(kpi_name, kpi_name)
 
     def on_kpi_selected(self, text):
         """Handle KPI selection for data input"""
@@ -498,9 +744,9 @@ class KPIDashboard(QWidget):
             info_label.setStyleSheet("padding: 5px; font-size: 10pt;")
             self.kpi_info_layout.addWidget(info_label)
 
-        # Load existing data if any
-        existing_data = self.kpi_manager.get_manual_data(kpi_name, self.current_period)
-        existing_dict = {row['data_field']: row['data_value'] or row['data_text'] for row in existing_data}
+        # Load existing data if any. A stored numeric 0 comes back as the text value
+        # (usually None), so its spinbox simply keeps its default of 0
+        existing_dict = self.kpi_manager.get_manual_data(kpi_name, self.current_period, as_dict=True)
 
         # Create input fields
         inputs_group = QGroupBox(f"📊 Data Input for: {kpi_name}")
@@ -550,22 +796,22 @@ class KPIDashboard(QWidget):
                 if field_name in existing_dict and existing_dict[field_name] is not None:
                     input_widget.setValue(float(existing_dict[field_name]))
             else:  # text
-                input_widget = QTextEdit()
+                input_widget = QPlainTextEdit()
                 input_widget.setMaximumHeight(100)
                 input_widget.setStyleSheet("""
-                    QTextEdit {
+                    QPlainTextEdit {
                         padding: 5px;
                         border: 2px solid #bdc3c7;
                         border-radius: 5px;
                         font-size: 10pt;
                     }
-                    QTextEdit:focus {
+                    QPlainTextEdit:focus {
                         border: 2px solid #3498db;
                     }
                 """)
                 # Load existing value
                 if field_name in existing_dict:
-                    input_widget.setText(str(existing_dict[field_name]))
+                    input_widget.setPlainText(str(existing_dict[field_name]))
 
             self.input_fields[field_name] = input_widget
             inputs_layout.addRow(label_widget, input_widget)
@@ -582,27 +828,21 @@ class KPIDashboard(QWidget):
             return
 
         try:
-            # Save each field
+            # Save all fields in one statement
+            rows = []
             for field_name, widget in self.input_fields.items():
                 if isinstance(widget, QDoubleSpinBox):
-                    value = widget.value()
-                    self.kpi_manager.save_manual_data(
-                        kpi_name=kpi_name,
-                        measurement_period=self.current_period,
-                        data_field=field_name,
-                        data_value=value,
-                        entered_by=self.current_user
-                    )
-                else:  # QTextEdit
-                    text = widget.toPlainText()
-                    self.kpi_manager.save_manual_data(
-                        kpi_name=kpi_name,
-                        measurement_period=self.current_period,
-                        data_field=field_name,
-                        data_value=None,
-                        data_text=text,
-                        entered_by=self.current_user
-                    )
+                    rows.append((field_name, widget.value(), None))
+                else:  # QPlainTextEdit
+                    rows.append((field_name, None, widget.toPlainText()))
+
+            self.kpi_manager.save_manual_data_bulk(
+                kpi_name=kpi_name,
+                measurement_period=self.current_period,
+                rows=rows,
+                entered_by=self.current_user
+            )
+            self._invalidate_results(self.current_period)
 
             QMessageBox.information(self, "✓ Success", f"Data saved successfully for {kpi_name}")
 
@@ -619,6 +859,7 @@ class KPIDashboard(QWidget):
         try:
             # Calculate KPI
             result = self.kpi_manager.calculate_manual_kpi(kpi_name, self.current_period, self.current_user)
+            self._invalidate_results(self.current_period)
 
             if 'error' in result:
                 QMessageBox.warning(self, "Cannot Calculate", result['error'])
@@ -804,15 +1045,95 @@ class KPIDashboard(QWidget):
 
         fig.tight_layout()
 
-    def refresh_dashboard(self):
-        """Refresh the overview dashboard"""
-        try:
-            results = self.kpi_manager.get_kpi_results(self.current_period)
+    def _cached_results(self, period):
+        """Return the cached KPI results for period, or None if missing or stale"""
+        cached = self._results_cache.get(period)
+        if cached and time.monotonic() - cached[0] < self.RESULTS_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _get_results(self, period):
+        """Get the KPI results for period, reusing a recent load"""
+        results = self._cached_results(period)
+        if results is None:
+            results = list(self.kpi_manager.get_kpi_results(period))
+            self._results_cache[period] = (time.monotonic(), results)
+        return results
+
+    def _invalidate_results(self, period):
+        """Drop the cached KPI results for period after its data changed"""
+        self._results_cache.pop(period, None)
+        # Background loads started before this point now carry an old generation
+        self._results_generation[period] = self._results_generation.get(period, 0) + 1
+
+    def refresh_dashboard(self, force=False):
+        """Refresh the overview dashboard
+
+        Skipped while the overview is hidden; it then refreshes when shown.
+        Recently loaded results are reused unless force is set. Otherwise the
+        results are loaded on a QThreadPool thread so the UI stays responsive;
+        _apply_results updates the cards and table when they arrive.
+        """
+        if self.overview_tab is None:
+            # Overview not built yet - it refreshes when first shown
+            if force:
+                self._invalidate_results(self.current_period)
+            return
 
+        if not self.overview_tab.isVisible():
+            # Nobody is looking - refresh when the overview is shown again
+            self._dashboard_dirty = True
+            if force:
+                self._invalidate_results(self.current_period)
+            return
+        self._dashboard_dirty = False
+
+        if not force:
+            results = self._cached_results(self.current_period)
+            if results is not None:
+                self._show_results(results)
+                return
+
+        worker = KPIFetchWorker(self.kpi_manager, self.current_period,
+                                self._results_generation.get(self.current_period, 0))
+        worker.signals.resultsReady.connect(self._apply_results)
+        worker.signals.failed.connect(self._on_refresh_failed)
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("⏳ Refreshing...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _end_refresh(self):
+        """Re-enable the refresh button once a background load has finished"""
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("🔄 Refresh Dashboard")
+
+    def _on_refresh_failed(self, period, error_msg):
+        """Report a failed background load of the KPI results"""
+        self._end_refresh()
+        if period == self.current_period:
+            QMessageBox.critical(self, "Error", f"Failed to refresh dashboard: {error_msg}")
+
+    def _apply_results(self, period, results, generation):
+        """Cache and show KPI results loaded in the background (runs on the UI thread)"""
+        self._end_refresh()
+        # The period's data changed after this load started (e.g. a manual entry was
+        # saved): don't cache or show the stale results, load the period again instead
+        if generation != self._results_generation.get(period, 0):
+            if period == self.current_period:
+                self.refresh_dashboard()
+            return
+        self._results_cache[period] = (time.monotonic(), results)
+        # Ignore results for a period the user has already moved away from
+        if period != self.current_period:
+            return
+        self._show_results(results)
+
+    def _show_results(self, results):
+        """Show KPI results in the overview summary cards and table"""
+        try:
             # Update summary cards
             total = len(results)
-            passing = sum(1 for r in results if r.get('meets_criteria') is True)
-            failing = sum(1 for r in results if r.get('meets_criteria') is False)
+            passing, failing = count_pass_fail(results)
             pending = 17 - total
 
             self.total_kpis_label.setText(f"Total KPIs\n{total}/17")
@@ -821,49 +1142,7 @@ class KPIDashboard(QWidget):
             self.pending_kpis_label.setText(f"⏳ Pending\n{pending}")
 
             # Update table
-            self.overview_table.setRowCount(len(results))
-
-            for row, result in enumerate(results):
-                # Function
-                self.overview_table.setItem(row, 0, QTableWidgetItem(result.get('function_code', '')))
-
-                # KPI Name
-                self.overview_table.setItem(row, 1, QTableWidgetItem(result.get('kpi_name', '')))
-
-                # Value
-                value_text = result.get('calculated_text') or (
-                    f"{result['calculated_value']:.2f}" if result.get('calculated_value') is not None else 'N/A'
-                )
-                self.overview_table.setItem(row, 2, QTableWidgetItem(value_text))
-
-                # Target
-                self.overview_table.setItem(row, 3, QTableWidgetItem(result.get('acceptance_criteria', '')))
-
-                # Status
-                if result.get('meets_criteria') is True:
-                    status_item = QTableWidgetItem("✓ PASS")
-                    status_item.setBackground(QColor("#d5f4e6"))
-                    status_item.setForeground(QColor("#27ae60"))
-                elif result.get('meets_criteria') is False:
-                    status_item = QTableWidgetItem("✗ FAIL")
-                    status_item.setBackground(QColor("#fadbd8"))
-                    status_item.setForeground(QColor("#e74c3c"))
-                else:
-                    status_item = QTableWidgetItem("N/A")
-                    status_item.setBackground(QColor("#f9e79f"))
-
-                status_item.setFont(QFont("Arial", 10, QFont.Bold))
-                self.overview_table.setItem(row, 4, status_item)
-
-                # Date
-                calc_date = result.get('calculation_date')
-                date_str = calc_date.strftime('%Y-%m-%d %H:%M') if calc_date else ''
-                self.overview_table.setItem(row, 5, QTableWidgetItem(date_str))
-
-                # Notes
-                self.overview_table.setItem(row, 6, QTableWidgetItem(result.get('notes', '')))
-
-            self.overview_table.resizeColumnsToContents()
+            self.overview_model.set_results(results)
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to refresh dashboard: {str(e)}\n\n{traceback.format_exc()}")
@@ -878,23 +1157,15 @@ class KPIDashboard(QWidget):
             return
 
         try:
-            results = self.kpi_manager.get_kpi_results(self.current_period)
+            results = self._get_results(self.current_period)
 
             # Create PDF
             doc = SimpleDocTemplate(file_name, pagesize=letter)
             elements = []
-            styles = getSampleStyleSheet()
+            styles = _PDF_STYLES
 
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#2c3e50'),
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            elements.append(Paragraph("KPI Performance Report 2025", title_style))
+            elements.append(Paragraph("KPI Performance Report 2025", _PDF_TITLE_STYLE))
 
             # Period info
             period_text = f"Measurement Period: {self.current_period}"
@@ -905,8 +1176,7 @@ class KPIDashboard(QWidget):
 
             # Summary
             total = len(results)
-            passing = sum(1 for r in results if r.get('meets_criteria') is True)
-            failing = sum(1 for r in results if r.get('meets_criteria') is False)
+            passing, failing = count_pass_fail(results)
 
             summary_data = [
                 ['Total KPIs', 'Passing', 'Failing', 'Pending'],
@@ -914,16 +1184,7 @@ class KPIDashboard(QWidget):
             ]
 
             summary_table = Table(summary_data, colWidths=[2*inch]*4)
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            summary_table.setStyle(_PDF_SUMMARY_TABLE_STYLE)
             elements.append(summary_table)
             elements.append(Spacer(1, 30))
 
@@ -948,24 +1209,15 @@ class KPIDashboard(QWidget):
 
                     data.append([
                         result.get('function_code', ''),
-                        Paragraph(result.get('kpi_name', ''), styles['Normal']),
-                        Paragraph(str(value_text), styles['Normal']),
-                        Paragraph(result.get('acceptance_criteria', ''), styles['Normal']),
+                        _pdf_cell(result.get('kpi_name', ''), _PDF_KPI_COL_WIDTHS[1]),
+                        _pdf_cell(value_text, _PDF_KPI_COL_WIDTHS[2]),
+                        _pdf_cell(result.get('acceptance_criteria', ''), _PDF_KPI_COL_WIDTHS[3]),
                         status
                     ])
 
-                kpi_table = Table(data, colWidths=[0.8*inch, 2.2*inch, 1.8*inch, 1.8*inch, 0.8*inch])
-                kpi_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 11),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ]))
+                # Split across pages by row, repeating the header row on each page
+                kpi_table = Table(data, colWidths=_PDF_KPI_COL_WIDTHS, repeatRows=1, splitByRow=1)
+                kpi_table.setStyle(_PDF_KPI_TABLE_STYLE)
                 elements.append(kpi_table)
 
             # Build PDF
@@ -986,96 +1238,133 @@ class KPIDashboard(QWidget):
             return
 
         try:
-            results = self.kpi_manager.get_kpi_results(self.current_period)
-
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "KPI Report"
-
-            # Styles
-            header_fill = PatternFill(start_color="3498DB", end_color="3498DB", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=12)
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+            results = self._get_results(self.current_period)
 
-            # Title
-            ws.merge_cells('A1:G1')
-            ws['A1'] = 'KPI Performance Report 2025'
-            ws['A1'].font = Font(bold=True, size=16)
-            ws['A1'].alignment = Alignment(horizontal='center')
+            info_lines = [
+                f'Period: {self.current_period}',
+                f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
+                f'Generated by: {self.current_user}',
+            ]
+            rows = [self._excel_report_row(result) for result in results]
 
-            # Period info
-            ws['A2'] = f'Period: {self.current_period}'
-            ws['A3'] = f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}'
-            ws['A4'] = f'Generated by: {self.current_user}'
-
-            # Headers
-            row = 6
-            headers = ['Function', 'KPI Name', 'Value', 'Target', 'Status', 'Calculated Date', 'Notes']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center')
-
-            # Data
-            for result in results:
-                row += 1
-
-                value_text = result.get('calculated_text') or (
-                    f"{result['calculated_value']:.2f}" if result.get('calculated_value') is not None else 'N/A'
-                )
-
-                if result.get('meets_criteria') is True:
-                    status = "PASS"
-                    status_fill = PatternFill(start_color="D5F4E6", end_color="D5F4E6", fill_type="solid")
-                elif result.get('meets_criteria') is False:
-                    status = "FAIL"
-                    status_fill = PatternFill(start_color="FADBD8", end_color="FADBD8", fill_type="solid")
-                else:
-                    status = "N/A"
-                    status_fill = PatternFill(start_color="F9E79F", end_color="F9E79F", fill_type="solid")
-
-                calc_date = result.get('calculation_date')
-                date_str = calc_date.strftime('%Y-%m-%d %H:%M') if calc_date else ''
-
-                data = [
-                    result.get('function_code', ''),
-                    result.get('kpi_name', ''),
-                    value_text,
-                    result.get('acceptance_criteria', ''),
-                    status,
-                    date_str,
-                    result.get('notes', '')
-                ]
-
-                for col, value in enumerate(data, 1):
-                    cell = ws.cell(row=row, column=col, value=value)
-                    cell.border = border
-                    if col == 5:  # Status column
-                        cell.fill = status_fill
-                        cell.font = Font(bold=True)
-                        cell.alignment = Alignment(horizontal='center')
-
-            # Adjust column widths
-            ws.column_dimensions['A'].width = 12
-            ws.column_dimensions['B'].width = 35
-            ws.column_dimensions['C'].width = 30
-            ws.column_dimensions['D'].width = 30
-            ws.column_dimensions['E'].width = 10
-            ws.column_dimensions['F'].width = 18
-            ws.column_dimensions['G'].width = 40
-
-            # Save
-            wb.save(file_name)
+            # xlsxwriter is much faster than openpyxl for a plain write-once report
+            if xlsxwriter is not None:
+                self._write_excel_xlsxwriter(file_name, info_lines, rows)
+            else:
+                self._write_excel_openpyxl(file_name, info_lines, rows)
 
             QMessageBox.information(self, "Success", f"Excel file exported successfully to:\n{file_name}")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export Excel: {str(e)}\n\n{traceback.format_exc()}")
+
+    def _excel_report_row(self, result):
+        """Format one KPI result as a row of Excel report values"""
+        value_text = result.get('calculated_text') or (
+            f"{result['calculated_value']:.2f}" if result.get('calculated_value') is not None else 'N/A'
+        )
+
+        if result.get('meets_criteria') is True:
+            status = "PASS"
+        elif result.get('meets_criteria') is False:
+            status = "FAIL"
+        else:
+            status = "N/A"
+
+        calc_date = result.get('calculation_date')
+        date_str = calc_date.strftime('%Y-%m-%d %H:%M') if calc_date else ''
+
+        return [
+            result.get('function_code', ''),
+            result.get('kpi_name', ''),
+            value_text,
+            result.get('acceptance_criteria', ''),
+            status,
+            date_str,
+            result.get('notes', '')
+        ]
+
+    def _write_excel_xlsxwriter(self, file_name, info_lines, rows):
+        """Write the Excel report with xlsxwriter in constant memory mode"""
+        wb = xlsxwriter.Workbook(file_name, {'constant_memory': True})
+        try:
+            ws = wb.add_worksheet("KPI Report")
+
+            # Formats
+            title_format = wb.add_format({'bold': True, 'font_size': 16, 'align': 'center'})
+            header_format = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'font_size': 12,
+                                           'bg_color': '#3498DB', 'border': 1, 'align': 'center'})
+            cell_format = wb.add_format({'border': 1})
+            status_formats = {
+                status: wb.add_format({'bold': True, 'bg_color': f'#{color}', 'border': 1, 'align': 'center'})
+                for status, color in EXCEL_STATUS_COLORS.items()
+            }
+
+            for col, width in enumerate(EXCEL_COLUMN_WIDTHS):
+                ws.set_column(col, col, width)
+
+            # Title, period info and headers (constant memory mode writes rows in order)
+            ws.merge_range(0, 0, 0, len(EXCEL_HEADERS) - 1, 'KPI Performance Report 2025', title_format)
+            for row, line in enumerate(info_lines, 1):
+                ws.write(row, 0, line)
+            ws.write_row(5, 0, EXCEL_HEADERS, header_format)
+
+            # Data
+            for row, data in enumerate(rows, 6):
+                for col, value in enumerate(data):
+                    if col == EXCEL_STATUS_COLUMN:
+                        ws.write(row, col, value, status_formats[value])
+                    else:
+                        ws.write(row, col, value, cell_format)
+        finally:
+            wb.close()
+
+    def _write_excel_openpyxl(self, file_name, info_lines, rows):
+        """Write the Excel report with an openpyxl write-only workbook"""
+        # Write-only workbook: rows are streamed out as they are appended
+        # instead of keeping every cell object in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("KPI Report")
+
+        # Column widths must be set before any row is written
+        for col, width in enumerate(EXCEL_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+
+        # Title
+        title = WriteOnlyCell(ws, value='KPI Performance Report 2025')
+        title.font = _XL_TITLE_FONT
+        title.alignment = _XL_CENTER
+        ws.append([title])
+        ws.merged_cells.add('A1:G1')
+
+        # Period info
+        for line in info_lines:
+            ws.append([line])
+        ws.append([])
+
+        # Headers
+        header_cells = []
+        for header in EXCEL_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.fill = _XL_HEADER_FILL
+            cell.font = _XL_HEADER_FONT
+            cell.border = _XL_BORDER
+            cell.alignment = _XL_CENTER
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Data
+        for data in rows:
+            row_cells = []
+            for col, value in enumerate(data):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = _XL_BORDER
+                if col == EXCEL_STATUS_COLUMN:
+                    cell.fill = _XL_STATUS_FILLS[value]
+                    cell.font = _XL_BOLD_FONT
+                    cell.alignment = _XL_CENTER
+                row_cells.append(cell)
+            ws.append(row_cells)
+
+        # Save
+        wb.save(file_name)
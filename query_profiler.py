@@ -0,0 +1,94 @@
+"""
+Query Profiler Module
+Development aid that counts the SQL statements executed while a block runs:
+- Enabled by setting the AIT_PROFILE_QUERIES=1 environment variable
+- Prints the query count for each profiled block
+- Warns when a block issues more queries than expected (likely N+1 loops)
+"""
+
+import os
+import threading
+import warnings
+from contextlib import contextmanager
+from functools import lru_cache
+from psycopg2 import extensions
+
+
+PROFILE_QUERIES = os.environ.get('AIT_PROFILE_QUERIES') == '1'
+
+# A single dialog open issuing more statements than this is reported as a warning
+QUERY_WARN_THRESHOLD = 20
+
+_active_counters = set()
+_counters_lock = threading.Lock()
+
+
+class QueryCounter:
+    """Number of queries executed while a count_queries() block was active"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.n = 0
+
+
+def _record_query():
+    """Add one executed statement to every active counter"""
+    with _counters_lock:
+        for counter in _active_counters:
+            counter.n += 1
+
+
+@lru_cache(maxsize=None)
+def _counting_cursor_class(base):
+    """Subclass of a psycopg2 cursor class that reports each execute"""
+
+    class CountingCursor(base):
+        def execute(self, query, vars=None):
+            _record_query()
+            return super().execute(query, vars)
+
+        def executemany(self, query, vars_list):
+            _record_query()
+            return super().executemany(query, vars_list)
+
+    return CountingCursor
+
+
+class CountingConnection(extensions.connection):
+    """psycopg2 connection whose cursors are counted (pass as connection_factory)"""
+
+    def cursor(self, *args, cursor_factory=None, **kwargs):
+        base = cursor_factory or self.cursor_factory or extensions.cursor
+        return super().cursor(*args, cursor_factory=_counting_cursor_class(base), **kwargs)
+
+
+@contextmanager
+def count_queries(label: str):
+    """
+    Count the queries executed on CountingConnection connections inside the block
+
+    Statements from any thread are counted while the block is active.
+    Does nothing unless AIT_PROFILE_QUERIES=1.
+
+    Args:
+        label: Name printed with the count (e.g. the dialog name)
+
+    Yields:
+        QueryCounter: counter whose n attribute holds the count so far
+    """
+    counter = QueryCounter(label)
+    if not PROFILE_QUERIES:
+        yield counter
+        return
+
+    with _counters_lock:
+        _active_counters.add(counter)
+    try:
+        yield counter
+    finally:
+        with _counters_lock:
+            _active_counters.discard(counter)
+        print(f"[query profile] {label}: {counter.n} queries")
+        if counter.n > QUERY_WARN_THRESHOLD:
+            warnings.warn(f"{label} issued {counter.n} queries "
+                          f"(more than {QUERY_WARN_THRESHOLD}) - check for per-row queries")
@@ -5,7 +5,11 @@ This module provides utilities for making the Tkinter application
 responsive across different screen sizes and resolutions.
 """
 
+import time
 import tkinter as tk
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, Dict, Optional
 
 
@@ -17,32 +21,127 @@ BREAKPOINTS = {
     'xlarge': 2560      # Extra large desktop screens
 }
 
+# Breakpoint lookup derived from BREAKPOINTS: a width below _BP_THRESHOLDS[i]
+# falls in _BP_NAMES[i], anything wider is 'xlarge'
+_BP_THRESHOLDS = (BREAKPOINTS['small'], BREAKPOINTS['medium'], BREAKPOINTS['large'])
+_BP_NAMES = ('small', 'medium', 'large', 'xlarge')
+# Width range [lo, hi) covered by each breakpoint
+_BP_RANGES = MappingProxyType(dict(zip(
+    _BP_NAMES,
+    zip((float('-inf'),) + _BP_THRESHOLDS, _BP_THRESHOLDS + (float('inf'),)))))
+
+# Column count from which get_column_widths uses NumPy instead of a Python loop
+_VECTORIZE_MIN_COLUMNS = 8
+
+# Per-breakpoint sizing rules (read-only)
+# Chart size as (width ratio, height ratio) of the container
+_CHART_RATIOS = MappingProxyType({
+    'small': (0.40, 0.30),      # Smaller charts for small screens
+    'medium': (0.45, 0.35),
+    'large': (0.45, 0.35),
+    'xlarge': (0.40, 0.35),
+})
+# Font size / padding as (change from the medium-screen base, minimum or None)
+_FONT_RULES = MappingProxyType({
+    'small': (-1, 8),
+    'medium': (0, None),
+    'large': (1, None),
+    'xlarge': (2, None),
+})
+_PADDING_RULES = MappingProxyType({
+    'small': (-2, 2),
+    'medium': (0, None),
+    'large': (2, None),
+    'xlarge': (2, None),
+})
+
+
+def _clamp(value, lo, hi):
+    """Limit value to [lo, hi] (hi wins if the bounds cross)"""
+    return min(hi, max(lo, value))
+
+
+@lru_cache(maxsize=4)
+def _screen_dims(tk_interp) -> Tuple[int, int]:
+    """Screen size for a Tk interpreter, queried from Tk only once"""
+    return (int(tk_interp.call('winfo', 'screenwidth', '.')),
+            int(tk_interp.call('winfo', 'screenheight', '.')))
+
+
+def get_screen_size(widget) -> Tuple[int, int]:
+    """
+    Get the screen (width, height) in pixels for any widget
+
+    The screen size does not change during a session, so it is cached per
+    Tk interpreter (call _screen_dims.cache_clear() if it ever has to be re-read)
+    """
+    return _screen_dims(widget.tk)
+
+
+def _raw_chart_size(width: int, height: int, breakpoint: str) -> Tuple[float, float]:
+    """Unclamped chart size in inches for the given dimensions and breakpoint"""
+    dpi = 100
+
+    # Calculate based on breakpoint
+    width_ratio, height_ratio = _CHART_RATIOS[breakpoint]
+
+    return ((width * width_ratio) / dpi, (height * height_ratio) / dpi)
+
+
+@lru_cache(maxsize=64)
+def _chart_size_impl(width: int, height: int, breakpoint: str,
+                     aspect_ratio: float) -> Tuple[float, float]:
+    """Chart size for the given dimensions and breakpoint (memoized - the same
+    sizes are requested for every chart on a page)"""
+    width_inches, height_inches = _raw_chart_size(width, height, breakpoint)
+
+    # Keep between the minimum and maximum chart size
+    return (_clamp(width_inches, 4.0, 10.0), _clamp(height_inches, 3.0, 7.0))
+
+
+@lru_cache(maxsize=64)
+def _compact_chart_size_impl(width: int, height: int,
+                             breakpoint: str) -> Tuple[float, float]:
+    """Compact chart size: 75% of the normal size, with the limits scaled to match"""
+    width_inches, height_inches = _raw_chart_size(width, height, breakpoint)
+
+    return (_clamp(width_inches * 0.75, 3.0, 7.5), _clamp(height_inches * 0.75, 2.25, 5.25))
+
 
 class ResponsiveManager:
     """Manages responsive sizing and scaling throughout the application"""
 
+    __slots__ = ('root', 'current_width', 'current_height', 'breakpoint',
+                 '_font_rule', '_padding_rule', '_bp_lo', '_bp_hi')
+
     def __init__(self, root_window):
         self.root = root_window
-        self.current_width = root_window.winfo_screenwidth()
-        self.current_height = root_window.winfo_screenheight()
-        self.breakpoint = self._calculate_breakpoint(self.current_width)
+        self.current_width, self.current_height = get_screen_size(root_window)
+        self._set_breakpoint(self.current_width)
 
-    def _calculate_breakpoint(self, width: int) -> str:
+    def _calculate_breakpoint(self, width: int, _names=_BP_NAMES,
+                              _thresholds=_BP_THRESHOLDS, _bisect=bisect_right) -> str:
         """Determine current breakpoint based on width"""
-        if width < BREAKPOINTS['small']:
-            return 'small'
-        elif width < BREAKPOINTS['medium']:
-            return 'medium'
-        elif width < BREAKPOINTS['large']:
-            return 'large'
-        else:
-            return 'xlarge'
+        # Lookup tables bound as defaults so they are local-variable loads
+        return _names[_bisect(_thresholds, width)]
+
+    def _set_breakpoint(self, width: int):
+        """Set the breakpoint for width and the sizing rules that depend on it"""
+        self.breakpoint = self._calculate_breakpoint(width)
+        self._bp_lo, self._bp_hi = _BP_RANGES[self.breakpoint]
+        # Looked up once here rather than in every get_font_size/get_padding call
+        self._font_rule = _FONT_RULES[self.breakpoint]
+        self._padding_rule = _PADDING_RULES[self.breakpoint]
 
     def update_dimensions(self, width: int, height: int):
         """Update current dimensions and recalculate breakpoint"""
+        if width == self.current_width and height == self.current_height:
+            return
         self.current_width = width
         self.current_height = height
-        self.breakpoint = self._calculate_breakpoint(width)
+        # Resize jitter usually stays within the current breakpoint
+        if not self._bp_lo <= width < self._bp_hi:
+            self._set_breakpoint(width)
 
     def get_chart_size(self, container_width: Optional[int] = None,
                       container_height: Optional[int] = None,
@@ -58,39 +157,11 @@ class ResponsiveManager:
         Returns:
             Tuple of (width_inches, height_inches) for matplotlib figsize
         """
-        dpi = 100
-
         # Use container dimensions or fall back to window dimensions
         width = container_width or self.current_width
         height = container_height or self.current_height
 
-        # Calculate based on breakpoint
-        if self.breakpoint == 'small':
-            # Smaller charts for small screens
-            width_ratio = 0.40
-            height_ratio = 0.30
-        elif self.breakpoint == 'medium':
-            width_ratio = 0.45
-            height_ratio = 0.35
-        elif self.breakpoint == 'large':
-            width_ratio = 0.45
-            height_ratio = 0.35
-        else:  # xlarge
-            width_ratio = 0.40
-            height_ratio = 0.35
-
-        width_inches = (width * width_ratio) / dpi
-        height_inches = (height * height_ratio) / dpi
-
-        # Ensure minimum size
-        width_inches = max(4.0, width_inches)
-        height_inches = max(3.0, height_inches)
-
-        # Ensure maximum size
-        width_inches = min(10.0, width_inches)
-        height_inches = min(7.0, height_inches)
-
-        return (width_inches, height_inches)
+        return _chart_size_impl(width, height, self.breakpoint, aspect_ratio)
 
     def get_compact_chart_size(self, container_width: Optional[int] = None,
                               container_height: Optional[int] = None) -> Tuple[float, float]:
@@ -100,9 +171,10 @@ class ResponsiveManager:
         Returns:
             Tuple of (width_inches, height_inches) for matplotlib figsize
         """
-        base_size = self.get_chart_size(container_width, container_height)
-        # Return 75% of base size for compact charts
-        return (base_size[0] * 0.75, base_size[1] * 0.75)
+        width = container_width or self.current_width
+        height = container_height or self.current_height
+
+        return _compact_chart_size_impl(width, height, self.breakpoint)
 
     def get_dialog_size(self, width_ratio: float = 0.7,
                        height_ratio: float = 0.7) -> Tuple[int, int]:
@@ -116,8 +188,7 @@ class ResponsiveManager:
         Returns:
             Tuple of (width_pixels, height_pixels)
         """
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        screen_width, screen_height = get_screen_size(self.root)
 
         width = int(screen_width * width_ratio)
         height = int(screen_height * height_ratio)
@@ -149,6 +220,14 @@ class ResponsiveManager:
         # Reserve space for scrollbar and padding
         available_width = total_width - 20
 
+        # Wide tables: do the arithmetic in one vectorized pass
+        if len(column_weights) >= _VECTORIZE_MIN_COLUMNS:
+            import numpy as np  # only needed for wide tables
+            weights = np.fromiter(column_weights.values(), dtype=np.float64,
+                                  count=len(column_weights))
+            col_widths = np.maximum(50, (available_width * weights / weights.sum()).astype(np.int64))
+            return dict(zip(column_weights.keys(), col_widths.tolist()))
+
         # Calculate total weight
         total_weight = sum(column_weights.values())
 
@@ -171,14 +250,9 @@ class ResponsiveManager:
         Returns:
             Adjusted font size
         """
-        if self.breakpoint == 'small':
-            return max(8, base_size - 1)
-        elif self.breakpoint == 'medium':
-            return base_size
-        elif self.breakpoint == 'large':
-            return base_size + 1
-        else:  # xlarge
-            return base_size + 2
+        delta, minimum = self._font_rule
+        size = base_size + delta
+        return size if minimum is None else max(minimum, size)
 
     def get_padding(self, base_padding: int = 5) -> int:
         """
@@ -190,14 +264,12 @@ class ResponsiveManager:
         Returns:
             Adjusted padding
         """
-        if self.breakpoint == 'small':
-            return max(2, base_padding - 2)
-        elif self.breakpoint == 'medium':
-            return base_padding
-        else:  # large or xlarge
-            return base_padding + 2
+        delta, minimum = self._padding_rule
+        padding = base_padding + delta
+        return padding if minimum is None else max(minimum, padding)
 
 
+@lru_cache(maxsize=64)
 def calculate_chart_size_for_multi_chart_layout(screen_width: int,
                                                screen_height: int,
                                                num_charts: int = 4,
@@ -241,13 +313,85 @@ def center_window(window, width: int, height: int):
         width: Window width
         height: Window height
     """
-    screen_width = window.winfo_screenwidth()
-    screen_height = window.winfo_screenheight()
+    screen_width, screen_height = get_screen_size(window)
 
     x = (screen_width // 2) - (width // 2)
     y = (screen_height // 2) - (height // 2)
 
-    window.geometry(f"{width}x{height}+{x}+{y}")
+    window.geometry("%dx%d+%d+%d" % (width, height, x, y))
+
+
+class _ResizeBus:
+    """
+    Shared resize handling for one toplevel window
+
+    <Configure> events from every widget inside a toplevel also reach the
+    toplevel's own binding, so one binding and one debounce timer per window
+    serve all the widgets registered through make_treeview_responsive and
+    bind_resize_event. Once resizing has settled for 100ms each widget that
+    changed size gets its callbacks called with its latest (width, height).
+    """
+
+    delay_ms = 100
+
+    def __init__(self, toplevel):
+        self.toplevel = toplevel
+        self.subscribers = {}   # widget path -> [callback, ...]
+        self.sizes = {}         # widget path -> latest (width, height) not yet dispatched
+        self.pending = None     # id of the one live 'after' timer, if any
+        self.deadline_ns = 0    # dispatch once this passes with no new events
+        toplevel.bind('<Configure>', self._on_configure, add='+')
+        toplevel.bind('<Destroy>', self._on_destroy, add='+')
+
+    @classmethod
+    def for_widget(cls, widget) -> '_ResizeBus':
+        """Get (or create) the bus for the toplevel containing widget"""
+        toplevel = widget.winfo_toplevel()
+        bus = _resize_buses.get(toplevel)
+        if bus is None:
+            bus = _resize_buses[toplevel] = cls(toplevel)
+        return bus
+
+    def subscribe(self, widget, callback):
+        """Call callback(width, height) after widget has been resized"""
+        self.subscribers.setdefault(str(widget), []).append(callback)
+
+    def _on_configure(self, event):
+        path = str(event.widget)
+        if path not in self.subscribers:
+            return
+        self.sizes[path] = (event.width, event.height)
+        # Only push the deadline back; the single pending timer re-checks it
+        self.deadline_ns = time.monotonic_ns() + self.delay_ms * 1_000_000
+        if self.pending is None:
+            self.pending = self.toplevel.after(self.delay_ms, self._check)
+
+    def _check(self):
+        remaining_ns = self.deadline_ns - time.monotonic_ns()
+        if remaining_ns > 0:
+            # More events arrived since this timer was set - wait out the rest
+            self.pending = self.toplevel.after(-(-remaining_ns // 1_000_000), self._check)
+            return
+
+        self.pending = None
+        sizes, self.sizes = self.sizes, {}
+        for path, (width, height) in sizes.items():
+            for callback in self.subscribers.get(path, ()):
+                callback(width, height)
+
+    def _on_destroy(self, event):
+        path = str(event.widget)
+        self.subscribers.pop(path, None)
+        self.sizes.pop(path, None)
+        if event.widget is self.toplevel:
+            if self.pending is not None:
+                self.toplevel.after_cancel(self.pending)
+                self.pending = None
+            _resize_buses.pop(self.toplevel, None)
+
+
+# Toplevel widget -> its _ResizeBus
+_resize_buses = {}
 
 
 def make_treeview_responsive(tree, parent, column_weights: Dict[str, float]):
@@ -259,22 +403,32 @@ def make_treeview_responsive(tree, parent, column_weights: Dict[str, float]):
         parent: Parent widget
         column_weights: Dict mapping column names to relative weights
     """
-    def resize_columns(event=None):
+    # Fixed for the life of the tree, so worked out once
+    total_weight = sum(column_weights.values())
+    column_ratios = tuple((col, weight / total_weight)
+                          for col, weight in column_weights.items())
+    # Set every column width with a single Tcl command instead of one
+    # tree.column() round trip per column
+    set_widths = f'{tree} column $col -width $width'
+
+    def resize_columns(parent_width=None, parent_height=None):
         """Resize columns when parent widget size changes"""
         try:
-            parent_width = parent.winfo_width()
+            if parent_width is None:
+                parent_width = parent.winfo_width()
             if parent_width > 1:  # Ensure parent has been rendered
                 available_width = parent_width - 20  # Account for scrollbar
-                total_weight = sum(column_weights.values())
 
-                for col, weight in column_weights.items():
-                    col_width = int((available_width * weight) / total_weight)
-                    tree.column(col, width=max(50, col_width))
-        except:
+                col_widths = []
+                for col, ratio in column_ratios:
+                    col_widths += (col, max(50, int(available_width * ratio)))
+                tree.tk.call('foreach', ('col', 'width'), tuple(col_widths), set_widths)
+        except tk.TclError:
+            # Tree or parent already destroyed
             pass
 
-    # Bind to parent configure event
-    parent.bind('<Configure>', resize_columns)
+    # Follow parent size changes through the window's shared resize handler
+    _ResizeBus.for_widget(parent).subscribe(parent, resize_columns)
 
     # Do initial resize after a short delay
     parent.after(100, resize_columns)
@@ -302,19 +456,11 @@ def create_responsive_dialog(parent, title: str,
     dialog = tk.Toplevel(parent)
     dialog.title(title)
 
-    screen_width = dialog.winfo_screenwidth()
-    screen_height = dialog.winfo_screenheight()
-
-    width = int(screen_width * width_ratio)
-    height = int(screen_height * height_ratio)
+    screen_width, screen_height = get_screen_size(dialog)
 
-    # Apply minimum constraints
-    width = max(min_width, width)
-    height = max(min_height, height)
-
-    # Apply maximum constraints (90% of screen)
-    width = min(int(screen_width * 0.9), width)
-    height = min(int(screen_height * 0.9), height)
+    # Apply minimum constraints, then maximum constraints (90% of screen)
+    width = _clamp(int(screen_width * width_ratio), min_width, int(screen_width * 0.9))
+    height = _clamp(int(screen_height * height_ratio), min_height, int(screen_height * 0.9))
 
     center_window(dialog, width, height)
 
@@ -333,15 +479,4 @@ def bind_resize_event(widget, callback):
         widget: Widget to monitor
         callback: Function to call on resize (receives width, height)
     """
-    resize_timer = None
-
-    def on_configure(event):
-        nonlocal resize_timer
-        # Cancel previous timer
-        if resize_timer is not None:
-            widget.after_cancel(resize_timer)
-
-        # Set new timer to call callback after 100ms of no resize events
-        resize_timer = widget.after(100, lambda: callback(event.width, event.height))
-
-    widget.bind('<Configure>', on_configure)
+    _ResizeBus.for_widget(widget).subscribe(widget, callback)